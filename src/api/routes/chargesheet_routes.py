@@ -79,7 +79,7 @@ async def review_chargesheet(
         query = " | ".join(query_parts)
 
         # Query RAG pipeline with chargesheet use case
-        result = rag_pipeline.query(
+        result = await rag_pipeline.aquery(
             text=query,
             use_case="chargesheet",
             top_k=request.top_k
@@ -50,7 +50,7 @@ async def search_documents(
 
     try:
         # Use RAG pipeline's hybrid search
-        result = rag_pipeline.query(
+        result = await rag_pipeline.aquery(
             text=request.query,
             use_case="general",
             collection=request.collection,
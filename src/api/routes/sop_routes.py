@@ -61,7 +61,7 @@ async def suggest_investigation_steps(
             filters["district"] = request.district
 
         # Query RAG pipeline
-        result = rag_pipeline.query(
+        result = await rag_pipeline.aquery(
             text=query,
             use_case="sop",
             filters=filters if filters else None,
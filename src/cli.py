@@ -65,11 +65,13 @@ def collect():
 ]), required=True, help="Data source to scrape")
 @click.option("--max-results", "-n", default=50, help="Max results per query")
 @click.option("--output-dir", "-o", default="data/sources", help="Output directory")
-def collect_run(source, max_results, output_dir):
+@click.option("--redis-url", envvar="SCRAPER_REDIS_URL", default=None,
+              help="Keep scraper resume state in Redis (default: state files)")
+def collect_run(source, max_results, output_dir, redis_url):
     """Run data collection from a specific source."""
     from src.data_sources.orchestrator import DataSourceOrchestrator
 
-    orchestrator = DataSourceOrchestrator(base_output_dir=output_dir)
+    orchestrator = DataSourceOrchestrator(base_output_dir=output_dir, redis_url=redis_url)
 
     if source == "all":
         stats = orchestrator.run_all()
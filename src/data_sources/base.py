@@ -6,24 +6,60 @@ Provides common functionality: rate limiting, retry, logging, storage.
 import hashlib
 import json
 import logging
+import multiprocessing
 import os
+import queue
+import sqlite3
+import threading
 import time
+import zlib
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Generator, Optional
+from typing import Any, Callable, Generator, Iterable, NamedTuple, Optional
 from urllib.parse import urlparse
 
 import requests
+from lxml import etree
 from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
 from urllib3.util.retry import Retry
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+try:
+    import redis
+except ImportError:  # Optional: only needed for Redis-backed scraper state
+    redis = None
+
 logger = logging.getLogger(__name__)
 
 
+# Helpers for the lxml/XPath fast paths used by the scrapers' hot parsers
+
+def xpath_class(name: str) -> str:
+    """XPath predicate matching a single CSS class token (CSS ``.name``)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+_XP_VISIBLE_TEXT = etree.XPath(
+    "descendant-or-self::text()[not(ancestor::script) and not(ancestor::style)]"
+)
+
+
+def element_text(element, separator: str = "") -> str:
+    """Visible text of an lxml element, like BS4's get_text(separator, strip=True)."""
+    if next(element.iter("script", "style"), None) is None:
+        # Common case: no script/style to skip, so walk the text with the C-level iterator.
+        texts = element.itertext()
+    else:
+        texts = _XP_VISIBLE_TEXT(element)
+    return separator.join(filter(None, map(str.strip, texts)))
+
+
 class DocumentType(str, Enum):
     COURT_RULING = "court_ruling"
     FIR = "fir"
@@ -60,11 +96,24 @@ class DataSourceConfig:
     verify_ssl: bool = True
     max_pages: int = 100
     state_file: Optional[str] = None  # For resume capability
-
-
-@dataclass
+    # AIMD concurrency control: start at max_concurrent, grow towards the
+    # ceiling while the server is healthy, halve on 429/5xx responses.
+    adaptive_concurrency: bool = False
+    max_concurrent_ceiling: int = 8
+    # Redis-backed resume state, opt-in (falls back to state_file when
+    # unset/unreachable). State kept in files is not copied to Redis.
+    redis_url: Optional[str] = None
+    state_flush_every: int = 20  # Buffered state updates per Redis round-trip
+    state_flush_interval: float = 5.0  # Min seconds between state file rewrites at checkpoints
+    doc_cache_ttl: int = 30 * 86400  # Seconds parsed documents stay cached
+    doc_cache_file: Optional[str] = None  # On-disk document cache used without Redis
+    prefetch_documents: int = 64  # Documents scraped ahead of the consumer in run(); 0 disables
+    parse_processes: int = 0  # Worker processes for CPU-bound page parsing; 0 parses in-thread
+
+
+@dataclass(slots=True, frozen=True)
 class ScrapedDocument:
-    """A document scraped from a verified source."""
+    """A document scraped from a verified source (immutable once built)."""
     source: SourceName
     source_url: str
     document_type: DocumentType
@@ -84,7 +133,9 @@ class ScrapedDocument:
 
     def __post_init__(self):
         if not self.content_hash and self.content:
-            self.content_hash = hashlib.sha256(self.content.encode()).hexdigest()
+            object.__setattr__(
+                self, "content_hash", hashlib.sha256(self.content.encode()).hexdigest()
+            )
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -100,6 +151,159 @@ class ScrapedDocument:
         return cls(**data)
 
 
+class AdaptiveConcurrencyLimiter:
+    """
+    Additive-increase / multiplicative-decrease cap on in-flight requests.
+
+    The limit grows by one after ``increase_after`` consecutive successes (up
+    to ``ceiling``) and halves on any throttling response, so a scraper
+    settles near the highest concurrency the server tolerates without manual
+    tuning of delay/concurrency settings.
+    """
+
+    def __init__(self, initial: int, ceiling: int, increase_after: int = 20):
+        self.limit = max(1, initial)
+        self.ceiling = max(self.limit, ceiling)
+        self.increase_after = increase_after
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def __enter__(self) -> "AdaptiveConcurrencyLimiter":
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def record_success(self):
+        with self._cond:
+            self._successes += 1
+            if self._successes >= self.increase_after and self.limit < self.ceiling:
+                self.limit += 1
+                self._successes = 0
+                logger.info(f"Server healthy - concurrency raised to {self.limit}")
+                self._cond.notify_all()
+
+    def record_throttle(self):
+        with self._cond:
+            self._successes = 0
+            if self.limit > 1:
+                self.limit = max(1, self.limit // 2)
+                logger.warning(f"Server throttling - concurrency lowered to {self.limit}")
+
+
+class RedisStateStore:
+    """
+    Scraper resume state kept in a Redis hash.
+
+    Reads are served from a local copy primed with a single HGETALL. Writes
+    are queued on a pipeline and sent every ``flush_every`` updates (and on
+    ``flush()``), so a long scrape costs a handful of round-trips instead of
+    one JSON file rewrite per completed combo.
+    """
+
+    def __init__(self, client, key: str, flush_every: int = 20):
+        self._client = client
+        self._key = key
+        self._flush_every = max(1, flush_every)
+        self._pipeline = client.pipeline(transaction=False)
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._data = {
+            (k.decode() if isinstance(k, bytes) else k): json.loads(v)
+            for k, v in client.hgetall(key).items()
+        }
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __setitem__(self, key: str, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._pipeline.hset(self._key, key, json.dumps(value))
+            self._pending += 1
+            if self._pending >= self._flush_every:
+                self._flush_locked()
+
+    def flush(self):
+        """Send any buffered updates to Redis."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._pending:
+            self._pipeline.execute()
+            self._pending = 0
+
+
+class _StateMark(NamedTuple):
+    """A state update made by a prefetching scraper, applied by the consumer."""
+    key: Optional[str]  # None for a checkpoint/save request
+    value: Any = None
+    save: bool = False
+
+
+class _DeferredState:
+    """
+    Scraper state as seen from run()'s prefetch thread.
+
+    scrape() marks combos done as soon as it has yielded their documents, but
+    with prefetching those documents may still be queued, unsaved. Writes are
+    therefore recorded as _StateMark items that travel through the prefetch
+    buffer behind the documents yielded before them, and only reach the real
+    store once the consumer has saved those documents. Reads see the
+    producer's own pending writes.
+    """
+
+    def __init__(self, store):
+        self._store = store
+        self._overlay: dict = {}
+        self._marks: list = []
+        self.owner: Optional[threading.Thread] = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._overlay:
+            return self._overlay[key]
+        return self._store.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._overlay:
+            return self._overlay[key]
+        return self._store[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._overlay or key in self._store
+
+    def __len__(self) -> int:
+        return len(self._store) + sum(1 for k in self._overlay if k not in self._store)
+
+    def __setitem__(self, key: str, value: Any):
+        self._overlay[key] = value
+        self._marks.append(_StateMark(key, value))
+
+    def request_save(self, save: bool):
+        self._marks.append(_StateMark(None, save=save))
+
+    def drain(self) -> list:
+        marks, self._marks = self._marks, []
+        return marks
+
+
 class BaseDataSource(ABC):
     """
     Abstract base class for all data source scrapers.
@@ -118,7 +322,24 @@ class BaseDataSource(ABC):
         self.output_dir = Path(config.output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self._last_request_time = 0.0
+        self._state_last_flush = 0.0
+        self._rate_lock = threading.Lock()
+        self._not_before = 0.0  # Set from Retry-After to pause all workers
+        self._limiter = (
+            AdaptiveConcurrencyLimiter(config.max_concurrent, config.max_concurrent_ceiling)
+            if config.adaptive_concurrency
+            else None
+        )
+        self._stats_lock = threading.Lock()
+        self._deferred_state: Optional[_DeferredState] = None
+        # Set by run()'s caller (e.g. the orchestrator on Ctrl-C) to stop early
+        self._stop_event = threading.Event()
         self._seen_hashes: set = set()
+        self._redis = self._create_redis()
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._parse_pool_lock = threading.Lock()
+        self._doc_db: Optional[sqlite3.Connection] = None
+        self._doc_db_lock = threading.Lock()
         self._stats = {
             "total_fetched": 0,
             "total_saved": 0,
@@ -130,6 +351,26 @@ class BaseDataSource(ABC):
         self._load_state()
         self._load_seen_hashes()
 
+    @property
+    def _state(self):
+        """Resume state; the prefetch thread gets a deferred view (see _DeferredState)."""
+        deferred = self._deferred_state
+        if deferred is not None and deferred.owner is threading.current_thread():
+            return deferred
+        return self._state_store
+
+    @_state.setter
+    def _state(self, value):
+        self._state_store = value
+
+    def _defer_state_save(self, save: bool) -> bool:
+        """Queue a save/checkpoint requested from the prefetch thread; True if queued."""
+        deferred = self._deferred_state
+        if deferred is not None and deferred.owner is threading.current_thread():
+            deferred.request_save(save)
+            return True
+        return False
+
     def _create_session(self) -> requests.Session:
         """Create an HTTP session with retry logic."""
         session = requests.Session()
@@ -139,28 +380,310 @@ class BaseDataSource(ABC):
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS"],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # One keep-alive pool per host, sized so concurrent workers reuse
+        # connections (and TLS sessions) instead of discarding them.
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=4,
+            pool_maxsize=self._max_workers(),
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         session.headers.update({
             "User-Agent": self.config.user_agent,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.9,hi;q=0.8,gu;q=0.7",
+            # gzip/deflate, plus br/zstd when urllib3 has a decoder installed for them
+            **make_headers(accept_encoding=True),
         })
         if self.config.proxy:
             session.proxies = {"http": self.config.proxy, "https": self.config.proxy}
         return session
 
+    def __enter__(self) -> "BaseDataSource":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Persist state and release pooled HTTP/Redis connections."""
+        self._save_state()
+        self.session.close()
+        if self._redis is not None:
+            self._redis.close()
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(cancel_futures=True)
+            self._parse_pool = None
+        if self._doc_db is not None:
+            self._doc_db.close()
+            self._doc_db = None
+
+    def _create_redis(self):
+        """Connect to Redis if configured; returns None to fall back to local files."""
+        if not self.config.redis_url:
+            return None
+        if redis is None:
+            logger.warning("redis package not installed - using file-based scraper state")
+            return None
+        try:
+            client = redis.Redis.from_url(self.config.redis_url, max_connections=4)
+            client.ping()
+            return client
+        except redis.RedisError as e:
+            logger.warning(f"Redis unavailable ({e}) - using file-based scraper state")
+            return None
+
+    def _max_workers(self) -> int:
+        """Upper bound on concurrent requests for this source."""
+        if self.config.adaptive_concurrency:
+            return max(1, self.config.max_concurrent, self.config.max_concurrent_ceiling)
+        return max(1, self.config.max_concurrent)
+
     def _rate_limit(self):
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.config.delay_seconds:
-            time.sleep(self.config.delay_seconds - elapsed)
-        self._last_request_time = time.time()
+        """Enforce rate limiting between requests (shared by all worker threads)."""
+        # Under adaptive control delay_seconds is a per-connection budget, so
+        # the aggregate request rate scales with the current limit.
+        delay = self.config.delay_seconds
+        if self._limiter is not None:
+            delay /= self._limiter.limit
+        with self._rate_lock:
+            now = time.time()
+            wait = max(self._last_request_time + delay, self._not_before) - now
+            if wait > 0:
+                self._stop_event.wait(wait)  # cut short when stopping
+            self._last_request_time = time.time()
+
+    def _record_response(self, response: Optional[requests.Response], throttled: bool):
+        """Feed a request outcome to the adaptive limiter and honour Retry-After."""
+        if self._limiter is None:
+            return
+        if response is not None and response.headers.get("X-RateLimit-Remaining") == "0":
+            throttled = True
+        if not throttled:
+            self._limiter.record_success()
+            return
+
+        self._limiter.record_throttle()
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            with self._rate_lock:
+                self._not_before = max(self._not_before, time.time() + int(retry_after))
+
+    def _parse_in_pool(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a CPU-bound parser, in a worker process when parse_processes > 0.
+
+        fn must be a module-level function and args picklable (e.g. the raw
+        response bytes). Fetch threads block on the result, so downloads keep
+        overlapping while parsing spreads across cores instead of contending
+        for the GIL. The pool uses spawn, since forking a process that is
+        running fetch threads is unsafe.
+        """
+        if self.config.parse_processes <= 0:
+            return fn(*args)
+        with self._parse_pool_lock:
+            if self._parse_pool is None:
+                self._parse_pool = ProcessPoolExecutor(
+                    max_workers=self.config.parse_processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+        return self._parse_pool.submit(fn, *args).result()
+
+    def _prefetch(self, items: Iterable[Any], maxsize: int) -> Generator[Any, None, None]:
+        """
+        Drive items on a background thread, buffering up to maxsize ahead.
+
+        Lets the scraper keep fetching while the consumer saves, chunks or
+        embeds the previous document. Exceptions raised by the producer are
+        re-raised in the consumer; closing this generator early stops the
+        producer at its next buffered item.
+        """
+        buffer: queue.Queue = queue.Queue(maxsize=maxsize)
+        stop = threading.Event()
+        done = object()
+
+        def produce():
+            try:
+                for item in items:
+                    while not stop.is_set():
+                        try:
+                            buffer.put((item, None), timeout=0.5)
+                            break
+                        except queue.Full:
+                            continue
+                    if stop.is_set():
+                        break
+            except BaseException as e:
+                buffer.put((done, e))
+                return
+            finally:
+                if hasattr(items, "close"):
+                    items.close()
+            buffer.put((done, None))
+
+        producer = threading.Thread(
+            target=produce, name=f"{self.source_name().value}-prefetch", daemon=True
+        )
+        producer.start()
+        try:
+            while True:
+                item, error = buffer.get()
+                if item is done:
+                    if error is not None:
+                        raise error
+                    break
+                yield item
+        finally:
+            stop.set()
+            # Unblock a producer waiting on a full buffer
+            while producer.is_alive():
+                try:
+                    buffer.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            producer.join()
+
+    def _with_state_marks(
+        self, docs: Iterable[ScrapedDocument]
+    ) -> Generator[Any, None, None]:
+        """
+        Interleave scrape()'s state updates with its documents, in order.
+
+        Runs on the prefetch thread. Each state write made between two yields
+        is emitted before the next document, so the consumer applies it only
+        after saving every document scraped before it. Marks still queued when
+        the run stops are dropped with their unsaved documents, and a resume
+        redoes that work.
+        """
+        deferred = _DeferredState(self._state_store)
+        deferred.owner = threading.current_thread()
+        self._deferred_state = deferred
+        try:
+            for doc in docs:
+                yield from deferred.drain()
+                yield doc
+            yield from deferred.drain()
+        finally:
+            if hasattr(docs, "close"):
+                docs.close()
+            self._deferred_state = None
+
+    def _apply_state_mark(self, mark: _StateMark):
+        """Apply a state update deferred from the prefetch thread."""
+        if mark.key is not None:
+            self._state[mark.key] = mark.value
+        elif mark.save:
+            self._save_state()
+        else:
+            self._checkpoint_state()
+
+    def _doc_cache_key(self, url: str) -> str:
+        digest = hashlib.sha1(url.encode()).hexdigest()
+        return f"scrape:doc:{self.source_name().value}:{digest}"
+
+    def _open_doc_db(self) -> sqlite3.Connection:
+        """Open (creating if needed) the SQLite document cache; caller holds _doc_db_lock."""
+        if self._doc_db is None:
+            path = self.config.doc_cache_file or str(self.output_dir / ".doc_cache.sqlite")
+            self._doc_db = sqlite3.connect(path, check_same_thread=False)
+            self._doc_db.execute(
+                "CREATE TABLE IF NOT EXISTS docs (key TEXT PRIMARY KEY, doc BLOB, ts INTEGER)"
+            )
+        return self._doc_db
+
+    def _get_cached_document(self, url: str) -> Optional[ScrapedDocument]:
+        """Return the document previously parsed from url, if cached (Redis or SQLite)."""
+        key = self._doc_cache_key(url)
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(key)
+            except redis.RedisError as e:
+                logger.debug(f"Document cache read failed for {url}: {e}")
+                return None
+        else:
+            try:
+                with self._doc_db_lock:
+                    row = self._open_doc_db().execute(
+                        "SELECT doc FROM docs WHERE key = ? AND ts > ?",
+                        (key, int(time.time()) - self.config.doc_cache_ttl),
+                    ).fetchone()
+            except sqlite3.Error as e:
+                logger.debug(f"Document cache read failed for {url}: {e}")
+                return None
+            raw = row[0] if row else None
+        if raw is None:
+            return None
+        return ScrapedDocument.from_json(zlib.decompress(raw).decode("utf-8"))
+
+    def _cache_document(self, doc: ScrapedDocument):
+        """Store a parsed document (compressed JSON) so later runs skip fetch + parse."""
+        key = self._doc_cache_key(doc.source_url)
+        raw = zlib.compress(doc.to_json().encode("utf-8"), 3)
+        if self._redis is not None:
+            try:
+                self._redis.set(key, raw, ex=self.config.doc_cache_ttl)
+            except redis.RedisError as e:
+                logger.debug(f"Document cache write failed for {doc.source_url}: {e}")
+            return
+        try:
+            with self._doc_db_lock:
+                db = self._open_doc_db()
+                db.execute(
+                    "INSERT OR REPLACE INTO docs (key, doc, ts) VALUES (?, ?, ?)",
+                    (key, raw, int(time.time())),
+                )
+                db.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Document cache write failed for {doc.source_url}: {e}")
+
+    def _incr_stat(self, name: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[name] += amount
+
+    def _map_concurrent(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        max_workers: Optional[int] = None,
+    ) -> Generator[Any, None, None]:
+        """
+        Apply fn to items on a thread pool, yielding results in input order.
+
+        Only a bounded window of items is pulled ahead, so this can sit between
+        a lazy producer (e.g. a search listing) and the consumer without
+        buffering the whole input. Requests still pass through _rate_limit, so
+        concurrency overlaps network latency without raising the request rate.
+        With a single worker it is a plain serial loop.
+        """
+        workers = max_workers or self._max_workers()
+        if workers <= 1:
+            for item in items:
+                yield fn(item)
+            return
+
+        pending: deque = deque()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            try:
+                for item in items:
+                    pending.append(pool.submit(fn, item))
+                    if len(pending) >= workers * 2:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=30))
     def fetch_page(self, url: str, params: dict = None) -> Optional[requests.Response]:
         """Fetch a page with rate limiting and retry."""
+        if self._limiter is None:
+            return self._fetch(url, params)
+        with self._limiter:
+            return self._fetch(url, params)
+
+    def _fetch(self, url: str, params: dict = None) -> Optional[requests.Response]:
         self._rate_limit()
         try:
             response = self.session.get(
@@ -170,11 +693,21 @@ class BaseDataSource(ABC):
                 verify=self.config.verify_ssl,
             )
             response.raise_for_status()
-            self._stats["total_fetched"] += 1
+            self._incr_stat("total_fetched")
+            self._record_response(response, throttled=False)
             logger.info(f"Fetched: {url} [{response.status_code}]")
+            logger.debug(
+                f"{url}: content-encoding={response.headers.get('Content-Encoding', 'identity')}"
+            )
             return response
         except requests.RequestException as e:
-            self._stats["total_errors"] += 1
+            self._incr_stat("total_errors")
+            response = getattr(e, "response", None)
+            status = response.status_code if response is not None else None
+            if isinstance(e, requests.exceptions.RetryError) or (
+                status is not None and (status == 429 or status >= 500)
+            ):
+                self._record_response(response, throttled=True)
             logger.error(f"Error fetching {url}: {e}")
             raise
 
@@ -231,6 +764,12 @@ class BaseDataSource(ABC):
 
     def _load_state(self):
         """Load scraper state for resume capability."""
+        if self._redis is not None:
+            key = f"scrape:state:{self.source_name().value}"
+            self._state = RedisStateStore(self._redis, key, self.config.state_flush_every)
+            logger.info(f"Resumed from Redis hash: {key} ({len(self._state)} entries)")
+            return
+
         self._state = {}
         state_file = self.config.state_file or str(self.output_dir / ".scraper_state.json")
         if os.path.exists(state_file):
@@ -240,9 +779,34 @@ class BaseDataSource(ABC):
 
     def _save_state(self):
         """Save scraper state for resume capability."""
+        if self._defer_state_save(save=True):
+            return
+        if isinstance(self._state, RedisStateStore):
+            self._state.flush()
+            return
+
         state_file = self.config.state_file or str(self.output_dir / ".scraper_state.json")
-        with open(state_file, "w") as f:
+        tmp_file = f"{state_file}.tmp"
+        with open(tmp_file, "w") as f:
             json.dump(self._state, f, indent=2)
+        os.replace(tmp_file, state_file)  # never leave a half-written state file
+        self._state_last_flush = time.monotonic()
+
+    def _checkpoint_state(self):
+        """
+        Persist progress after a unit of work (e.g. a completed search combo).
+
+        The Redis store batches its own writes, so this only rewrites the
+        state file when running without Redis, and at most once every
+        state_flush_interval seconds. run() and close() always save, so a
+        skipped checkpoint only costs re-doing that work after a crash.
+        """
+        if self._defer_state_save(save=False):
+            return
+        if isinstance(self._state, RedisStateStore):
+            return
+        if time.monotonic() - self._state_last_flush >= self.config.state_flush_interval:
+            self._save_state()
 
     def get_stats(self) -> dict:
         """Get scraping statistics."""
@@ -270,20 +834,42 @@ class BaseDataSource(ABC):
         """
         ...
 
-    def run(self, **kwargs) -> dict:
-        """Execute the full scraping pipeline."""
+    def run(self, stop_event: Optional[threading.Event] = None, **kwargs) -> dict:
+        """
+        Execute the full scraping pipeline.
+
+        Args:
+            stop_event: Stops the run after the current document when set
+                (used when sources run on worker threads, which never see
+                KeyboardInterrupt); state is still saved
+            **kwargs: Passed to scrape()
+        """
+        if stop_event is not None:
+            self._stop_event = stop_event
         self._stats["start_time"] = datetime.utcnow().isoformat()
         logger.info(f"Starting {self.source_name().value} scraper...")
 
+        docs = self.scrape(**kwargs)
+        if self.config.prefetch_documents > 0:
+            docs = self._prefetch(self._with_state_marks(docs), self.config.prefetch_documents)
         try:
-            for doc in self.scrape(**kwargs):
+            for doc in docs:
+                if self._stop_event.is_set():
+                    logger.warning("Scraping stopped")
+                    self._stats["interrupted"] = True
+                    break
+                if isinstance(doc, _StateMark):
+                    self._apply_state_mark(doc)
+                    continue
                 self.save_document(doc)
         except KeyboardInterrupt:
             logger.warning("Scraping interrupted by user")
+            self._stats["interrupted"] = True
         except Exception as e:
             logger.error(f"Scraping failed: {e}")
             raise
         finally:
+            docs.close()  # stop any prefetch thread before state is persisted
             self._stats["end_time"] = datetime.utcnow().isoformat()
             self._save_seen_hashes()
             self._save_state()
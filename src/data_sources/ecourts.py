@@ -22,10 +22,21 @@ We use the public search interface with rate limiting.
 import re
 import json
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from typing import Generator, Optional
 from urllib.parse import urljoin
 
+import soupsieve
 from bs4 import BeautifulSoup
+from tenacity import RetryError
+
+try:
+    import orjson
+except ImportError:  # Optional: faster serialization of case-data fallbacks
+    orjson = None
 
 from src.data_sources.base import (
     BaseDataSource,
@@ -78,6 +89,9 @@ GUJARAT_DISTRICTS = {
 # Gujarat State Code in eCourts
 GUJARAT_STATE_CODE = "9"
 
+# Order/judgment link in a results row, matched in a single traversal
+_ORDER_LINK_SELECTOR = soupsieve.compile("a[href*='order'], a[onclick*='order']")
+
 # Case types relevant to criminal investigations
 CRIMINAL_CASE_TYPES = [
     {"code": "1", "name": "Sessions Case"},
@@ -92,6 +106,22 @@ CRIMINAL_CASE_TYPES = [
 ]
 
 
+def _with_csrf(params: dict, token: Optional[str]) -> dict:
+    """Add the eCourts CSRF token to form params when one is available."""
+    if not token:
+        return params
+    return {**params, "csrf_token": token}
+
+
+def _split_parties(parties: Optional[str]) -> list[str]:
+    """Split an "X vs Y" cause title into its two sides (empty for no parties)."""
+    if not parties:
+        return []
+    if " vs " not in parties:
+        return [parties]
+    return parties.split(" vs ", 1)
+
+
 class ECourtsDataSource(BaseDataSource):
     """
     Scraper for eCourts India (ecourts.gov.in).
@@ -102,20 +132,57 @@ class ECourtsDataSource(BaseDataSource):
     SERVICES_URL = "https://services.ecourts.gov.in/ecourtindia_v6"
     API_URL = "https://services.ecourts.gov.in/ecourtindia_v6"
 
+    # The homepage token stays valid for the session; refetch hourly or on 403
+    CSRF_TOKEN_TTL = 3600
+
+    def __init__(self, config: DataSourceConfig):
+        super().__init__(config)
+        self._csrf_token: Optional[str] = None
+        self._csrf_fetched_at = 0.0
+        self._csrf_lock = threading.Lock()
+
     def source_name(self) -> SourceName:
         return SourceName.ECOURTS
 
-    def _get_csrf_token(self) -> Optional[str]:
-        """Get CSRF token from eCourts homepage."""
-        response = self.fetch_page(f"{self.SERVICES_URL}/")
-        if response:
-            soup = BeautifulSoup(response.text, "lxml")
-            token_elem = soup.select_one('input[name="csrf_token"]') or soup.select_one(
-                'meta[name="csrf-token"]'
-            )
-            if token_elem:
-                return token_elem.get("value") or token_elem.get("content")
-        return None
+    def _get_csrf_token(self, refresh: bool = False) -> Optional[str]:
+        """Get CSRF token from eCourts homepage (cached for CSRF_TOKEN_TTL seconds)."""
+        with self._csrf_lock:
+            if not refresh and time.time() - self._csrf_fetched_at < self.CSRF_TOKEN_TTL:
+                return self._csrf_token
+
+            token = None
+            try:
+                response = self.fetch_page(f"{self.SERVICES_URL}/")
+            except RetryError as e:
+                logger.warning(f"Could not fetch eCourts CSRF token: {e}")
+                response = None
+            if response:
+                soup = BeautifulSoup(response.content, "lxml", from_encoding=response.encoding)
+                token_elem = soup.select_one('input[name="csrf_token"]') or soup.select_one(
+                    'meta[name="csrf-token"]'
+                )
+                if token_elem:
+                    token = token_elem.get("value") or token_elem.get("content")
+
+            # Cache misses too, so a page without a token isn't refetched per search
+            self._csrf_token = token
+            self._csrf_fetched_at = time.time()
+            return token
+
+    def _fetch_with_csrf(self, url: str, params: dict):
+        """Fetch a search page with the cached CSRF token, refreshing it once on 403."""
+        token = self._get_csrf_token()
+        try:
+            return self.fetch_page(url, params=_with_csrf(params, token))
+        except RetryError as e:
+            error = e.last_attempt.exception()
+            response = getattr(error, "response", None)
+            if response is None or response.status_code != 403:
+                raise
+
+        logger.info("eCourts rejected the CSRF token - refreshing")
+        token = self._get_csrf_token(refresh=True)
+        return self.fetch_page(url, params=_with_csrf(params, token))
 
     def search_by_act(
         self,
@@ -143,11 +210,11 @@ class ECourtsDataSource(BaseDataSource):
             "search": "Search",
         }
 
-        response = self.fetch_page(search_url, params=params)
+        response = self._fetch_with_csrf(search_url, params)
         if not response:
             return
 
-        soup = BeautifulSoup(response.text, "lxml")
+        soup = BeautifulSoup(response.content, "lxml", from_encoding=response.encoding)
 
         # Parse results table
         results_table = soup.select_one("table.table") or soup.select_one("#dispTable")
@@ -173,9 +240,7 @@ class ECourtsDataSource(BaseDataSource):
             }
 
             # Check for order/judgment link
-            order_link = row.select_one("a[href*='order']") or row.select_one(
-                "a[onclick*='order']"
-            )
+            order_link = _ORDER_LINK_SELECTOR.select_one(row)
             if order_link:
                 case_data["order_link"] = order_link.get("href", "")
 
@@ -194,7 +259,7 @@ class ECourtsDataSource(BaseDataSource):
         if not response:
             return None
 
-        soup = BeautifulSoup(response.text, "lxml")
+        soup = BeautifulSoup(response.content, "lxml", from_encoding=response.encoding)
 
         # Extract order text
         order_div = soup.select_one("#order_content") or soup.select_one(".order-text")
@@ -230,11 +295,11 @@ class ECourtsDataSource(BaseDataSource):
             "search": "Search",
         }
 
-        response = self.fetch_page(search_url, params=params)
+        response = self._fetch_with_csrf(search_url, params)
         if not response:
             return
 
-        soup = BeautifulSoup(response.text, "lxml")
+        soup = BeautifulSoup(response.content, "lxml", from_encoding=response.encoding)
         results_table = soup.select_one("table.table") or soup.select_one("#dispTable")
         if not results_table:
             return
@@ -254,6 +319,42 @@ class ECourtsDataSource(BaseDataSource):
                 "district_code": district_code,
             }
 
+    def _build_case_document(
+        self,
+        case_data: dict,
+        order_text: Optional[str],
+        district: dict,
+        section: str,
+    ) -> ScrapedDocument:
+        """Build a ScrapedDocument from a search row and its (optional) order text."""
+        if order_text:
+            content = order_text
+        elif orjson is not None:
+            content = orjson.dumps(case_data).decode("utf-8")
+        else:
+            content = json.dumps(case_data, ensure_ascii=False)
+
+        return ScrapedDocument(
+            source=SourceName.ECOURTS,
+            source_url=f"{self.SERVICES_URL}",
+            document_type=DocumentType.COURT_RULING,
+            title=f"{case_data.get('case_number', 'Unknown')} - IPC {section}",
+            content=content,
+            language="en",
+            date_published=case_data.get("filing_date"),
+            case_number=case_data.get("case_number"),
+            court=f"{district['name']} District Court",
+            sections_cited=[f"IPC Section {section}"],
+            parties=_split_parties(case_data.get("parties")),
+            metadata={
+                "district": district["name"],
+                "district_code": district["code"],
+                "case_status": case_data.get("status"),
+                "source": "ecourts",
+                "has_order_text": order_text is not None,
+            },
+        )
+
     def scrape(
         self,
         districts: list[str] = None,
@@ -283,6 +384,7 @@ class ECourtsDataSource(BaseDataSource):
                 "379", "392", "395", "406", "420", "468", "498A", "506",
             ]
 
+        combos = []
         for district_key in districts:
             district = GUJARAT_DISTRICTS.get(district_key)
             if not district:
@@ -294,61 +396,75 @@ class ECourtsDataSource(BaseDataSource):
                 if self._state.get(state_key):
                     logger.info(f"Skipping completed: {district['name']} IPC {section}")
                     continue
-
-                logger.info(f"Searching: {district['name']} - IPC Section {section}")
-
-                count = 0
-                for case_data in self.search_by_act(
-                    state_code=GUJARAT_STATE_CODE,
-                    district_code=district["code"],
-                    act_type="IPC",
-                    section=section,
-                    year_from=year_from,
-                    year_to=year_to,
-                ):
-                    if count >= max_per_combo:
-                        break
-
-                    # Try to fetch the order
-                    order_text = self.fetch_case_orders(case_data)
-                    content = order_text or json.dumps(case_data, ensure_ascii=False)
-
-                    doc = ScrapedDocument(
-                        source=SourceName.ECOURTS,
-                        source_url=f"{self.SERVICES_URL}",
-                        document_type=DocumentType.COURT_RULING,
-                        title=f"{case_data.get('case_number', 'Unknown')} - IPC {section}",
-                        content=content,
-                        language="en",
-                        date_published=case_data.get("filing_date"),
-                        case_number=case_data.get("case_number"),
-                        court=f"{district['name']} District Court",
-                        sections_cited=[f"IPC Section {section}"],
-                        parties=case_data.get("parties", "").split(" vs "),
-                        metadata={
-                            "district": district["name"],
-                            "district_code": district["code"],
-                            "case_status": case_data.get("status"),
-                            "source": "ecourts",
-                            "has_order_text": order_text is not None,
-                        },
-                    )
-
-                    count += 1
-                    yield doc
-
-                self._state[state_key] = True
-                self._save_state()
-
-
-def create_ecourts_source(output_dir: str = "data/sources/ecourts") -> ECourtsDataSource:
+                combos.append((state_key, district, section))
+
+        def run_combo(combo: tuple) -> list[ScrapedDocument]:
+            _, district, section = combo
+            logger.info(f"Searching: {district['name']} - IPC Section {section}")
+            return list(self._scrape_combo(district, section, year_from, year_to, max_per_combo))
+
+        # Combos are independent searches: run them side by side and emit each
+        # one's documents as soon as it finishes, whatever the input order.
+        with ThreadPoolExecutor(max_workers=self._max_workers()) as pool:
+            futures = {pool.submit(run_combo, combo): combo for combo in combos}
+            try:
+                for future in as_completed(futures):
+                    yield from future.result()
+                    self._state[futures[future][0]] = True
+                    self._checkpoint_state()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _scrape_combo(
+        self,
+        district: dict,
+        section: str,
+        year_from: int,
+        year_to: int,
+        max_per_combo: int,
+    ) -> Generator[ScrapedDocument, None, None]:
+        """Scrape one district/section search and its linked orders."""
+        cases = list(islice(
+            self.search_by_act(
+                state_code=GUJARAT_STATE_CODE,
+                district_code=district["code"],
+                act_type="IPC",
+                section=section,
+                year_from=year_from,
+                year_to=year_to,
+            ),
+            max_per_combo,
+        ))
+
+        # Most rows (pending cases) have no order link: emit those
+        # directly and fan out order fetches only for the rest.
+        with_orders = []
+        for case_data in cases:
+            if "order_link" in case_data:
+                with_orders.append(case_data)
+            else:
+                yield self._build_case_document(case_data, None, district, section)
+
+        for case_data, order_text in self._map_concurrent(
+            lambda case: (case, self.fetch_case_orders(case)), with_orders
+        ):
+            yield self._build_case_document(case_data, order_text, district, section)
+
+
+def create_ecourts_source(
+    output_dir: str = "data/sources/ecourts", redis_url: Optional[str] = None
+) -> ECourtsDataSource:
     """Factory function to create an eCourts data source."""
     config = DataSourceConfig(
         base_url="https://services.ecourts.gov.in",
         output_dir=output_dir,
         delay_seconds=3.0,
-        max_concurrent=1,
+        max_concurrent=1,  # Starting point; AIMD raises it while the server is healthy
+        adaptive_concurrency=True,
+        max_concurrent_ceiling=8,
         max_retries=3,
         timeout=30,
+        redis_url=redis_url,
     )
     return ECourtsDataSource(config)
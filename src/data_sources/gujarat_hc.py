@@ -11,9 +11,11 @@ The Gujarat HC website has a judgment search interface that
 allows searching by date range, bench, and case type.
 """
 
+import hashlib
 import re
 import logging
-from typing import Generator, Optional
+import threading
+from typing import Generator, Optional, Union
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
@@ -47,6 +49,62 @@ CRIMINAL_CASE_TYPES_HC = [
 ]
 
 
+CONTENT_SELECTORS = [
+    "#judgment-text",
+    ".judgment-content",
+    ".field--name-body",
+    "#block-gujarathighcourt-content",
+    "article .content",
+    ".node__content",
+]
+
+
+def parse_judgment_html(
+    html: Union[str, bytes], url: str, encoding: Optional[str] = None
+) -> Optional[dict]:
+    """
+    Extract judgment text and metadata from a judgment page.
+
+    html may be the raw response body, decoded once by the parser using
+    encoding (the response's declared charset) when known.
+    Kept free of scraper state so pages can be parsed on worker threads
+    while other downloads are in flight.
+    """
+    soup = BeautifulSoup(html, "lxml", from_encoding=encoding)
+
+    # Try multiple selectors for judgment content
+    content_div = None
+    for selector in CONTENT_SELECTORS:
+        content_div = soup.select_one(selector)
+        if content_div:
+            break
+
+    if not content_div:
+        # Try to find a PDF link
+        pdf_link = soup.select_one("a[href$='.pdf']")
+        if pdf_link:
+            return {
+                "full_text": f"[PDF judgment - download from: {urljoin(url, pdf_link['href'])}]",
+                "pdf_url": urljoin(url, pdf_link["href"]),
+                "html_content": "",
+            }
+        logger.warning(f"Could not extract judgment content from {url}")
+        return None
+
+    full_text = content_div.get_text(separator="\n", strip=True)
+    html_content = str(content_div)
+
+    # Extract metadata from the judgment text
+    return {
+        "full_text": full_text,
+        "html_content": html_content,
+        "judges": GujaratHCDataSource._extract_judges(full_text[:2000]),
+        "case_number": GujaratHCDataSource._extract_case_number(full_text[:1000]),
+        "sections": GujaratHCDataSource._extract_sections(full_text),
+        "date": GujaratHCDataSource._extract_date(full_text[:2000]),
+    }
+
+
 class GujaratHCDataSource(BaseDataSource):
     """
     Scraper for Gujarat High Court judgments.
@@ -54,10 +112,49 @@ class GujaratHCDataSource(BaseDataSource):
 
     BASE_URL = "https://gujarathighcourt.nic.in"
     JUDGMENT_SEARCH_URL = "https://gujarathighcourt.nic.in/judgment-search"
+    SEEN_URL_TTL = 30 * 86400  # seconds a fetched judgment URL stays claimed
+
+    def __init__(self, config: DataSourceConfig):
+        super().__init__(config)
+        self._seen_urls: set[str] = set()
+        self._seen_lock = threading.Lock()
+        # Judgment URLs already handed out by this run's scrape; a cached
+        # judgment listed again under a later combo is not yielded twice
+        self._yielded_urls: set[str] = set()
 
     def source_name(self) -> SourceName:
         return SourceName.GUJARAT_HC
 
+    @staticmethod
+    def _url_key(prefix: str, url: str) -> str:
+        return f"gujhc:{prefix}:" + hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+    def _claim_url(self, url: str) -> bool:
+        """
+        Claim a judgment URL for fetching; False if it was already claimed.
+
+        Overlapping case types surface the same judgment under several
+        combos. With Redis the claim is a SET NX shared across runs and
+        workers, otherwise it only covers the current process.
+        """
+        if self._redis is not None:
+            return bool(
+                self._redis.set(self._url_key("seen", url), "1", nx=True, ex=self.SEEN_URL_TTL)
+            )
+        with self._seen_lock:
+            if url in self._seen_urls:
+                return False
+            self._seen_urls.add(url)
+            return True
+
+    def _release_url(self, url: str):
+        """Drop a claim so a failed fetch is retried later."""
+        if self._redis is not None:
+            self._redis.delete(self._url_key("seen", url))
+        else:
+            with self._seen_lock:
+                self._seen_urls.discard(url)
+
     def search_judgments(
         self,
         date_from: str = "2020-01-01",
@@ -86,7 +183,7 @@ class GujaratHCDataSource(BaseDataSource):
         if not response:
             return []
 
-        soup = BeautifulSoup(response.text, "lxml")
+        soup = BeautifulSoup(response.content, "lxml", from_encoding=response.encoding)
         results = []
 
         # Parse judgment listing
@@ -126,56 +223,10 @@ class GujaratHCDataSource(BaseDataSource):
         response = self.fetch_page(url)
         if not response:
             return None
+        return parse_judgment_html(response.content, url, response.encoding)
 
-        soup = BeautifulSoup(response.text, "lxml")
-
-        # Try multiple selectors for judgment content
-        content_selectors = [
-            "#judgment-text",
-            ".judgment-content",
-            ".field--name-body",
-            "#block-gujarathighcourt-content",
-            "article .content",
-            ".node__content",
-        ]
-
-        content_div = None
-        for selector in content_selectors:
-            content_div = soup.select_one(selector)
-            if content_div:
-                break
-
-        if not content_div:
-            # Try to find a PDF link
-            pdf_link = soup.select_one("a[href$='.pdf']")
-            if pdf_link:
-                return {
-                    "full_text": f"[PDF judgment - download from: {urljoin(url, pdf_link['href'])}]",
-                    "pdf_url": urljoin(url, pdf_link["href"]),
-                    "html_content": "",
-                }
-            logger.warning(f"Could not extract judgment content from {url}")
-            return None
-
-        full_text = content_div.get_text(separator="\n", strip=True)
-        html_content = str(content_div)
-
-        # Extract metadata from the judgment text
-        judges = self._extract_judges(full_text[:2000])
-        case_number = self._extract_case_number(full_text[:1000])
-        sections = self._extract_sections(full_text)
-        date = self._extract_date(full_text[:2000])
-
-        return {
-            "full_text": full_text,
-            "html_content": html_content,
-            "judges": judges,
-            "case_number": case_number,
-            "sections": sections,
-            "date": date,
-        }
-
-    def _extract_judges(self, text: str) -> list[str]:
+    @staticmethod
+    def _extract_judges(text: str) -> list[str]:
         """Extract judge names from judgment header."""
         patterns = [
             r"(?:HON'?BLE|HONOURABLE|Hon\.)\s+(?:MR\.?\s+|MS\.?\s+|SMT\.?\s+)?JUSTICE\s+([A-Z][A-Z\s.]+)",
@@ -187,7 +238,8 @@ class GujaratHCDataSource(BaseDataSource):
             judges.extend([m.strip() for m in matches if m.strip()])
         return judges[:5]
 
-    def _extract_case_number(self, text: str) -> Optional[str]:
+    @staticmethod
+    def _extract_case_number(text: str) -> Optional[str]:
         """Extract case number from judgment."""
         patterns = [
             r"(R/Criminal\s+\w+\s+Application\s+No\.\s*\d+\s+of\s+\d{4})",
@@ -201,7 +253,8 @@ class GujaratHCDataSource(BaseDataSource):
                 return match.group(1).strip()
         return None
 
-    def _extract_sections(self, text: str) -> list[str]:
+    @staticmethod
+    def _extract_sections(text: str) -> list[str]:
         """Extract legal sections cited."""
         sections = set()
         patterns = [
@@ -214,7 +267,8 @@ class GujaratHCDataSource(BaseDataSource):
                 sections.add(match.group(0).strip())
         return sorted(list(sections))[:30]
 
-    def _extract_date(self, text: str) -> Optional[str]:
+    @staticmethod
+    def _extract_date(text: str) -> Optional[str]:
         """Extract judgment date."""
         patterns = [
             r"[Dd]ated?\s*:?\s*(\d{1,2})[/.-](\d{1,2})[/.-](\d{4})",
@@ -278,51 +332,88 @@ class GujaratHCDataSource(BaseDataSource):
                     if not results:
                         break
 
+                    # Only claim as many as this combo can still take, so no
+                    # URL is left claimed without having been fetched
+                    fresh = []
                     for result in results:
-                        if count >= max_per_combo:
+                        if count + len(fresh) >= max_per_combo:
                             break
-
-                        judgment = self.fetch_judgment_text(result["url"])
-                        if not judgment or not judgment["full_text"]:
+                        if result["url"] in self._yielded_urls:
                             continue
-
-                        doc = ScrapedDocument(
-                            source=SourceName.GUJARAT_HC,
-                            source_url=result["url"],
-                            document_type=DocumentType.COURT_RULING,
-                            title=result["title"],
-                            content=judgment["full_text"],
-                            html_content=judgment.get("html_content", ""),
-                            language="en",
-                            date_published=judgment.get("date") or result.get("date"),
-                            case_number=judgment.get("case_number"),
-                            court=f"Gujarat High Court - {BENCHES.get(bench, bench)}",
-                            sections_cited=judgment.get("sections", []),
-                            judges=judgment.get("judges", [result.get("judge", "")]),
-                            metadata={
-                                "bench": bench,
-                                "case_type": case_type,
-                                "pdf_url": judgment.get("pdf_url"),
-                            },
+                        cached = self._get_cached_document(result["url"])
+                        if cached is not None:
+                            self._yielded_urls.add(result["url"])
+                            count += 1
+                            yield cached
+                            continue
+                        if self._claim_url(result["url"]):
+                            fresh.append(result)
+                        else:
+                            logger.debug(f"Skipping already seen judgment: {result['url']}")
+
+                    # Claims on judgments that are not cached by the end of the
+                    # page (failed fetch, error, closed generator) are dropped so
+                    # a later run retries them instead of skipping them
+                    unresolved = {r["url"] for r in fresh}
+                    try:
+                        # Download and parse the page's judgments concurrently
+                        judgments = self._map_concurrent(
+                            lambda r: (r, self.fetch_judgment_text(r["url"])), fresh
                         )
-
-                        count += 1
-                        yield doc
+                        for result, judgment in judgments:
+                            if not judgment or not judgment["full_text"]:
+                                continue
+
+                            doc = ScrapedDocument(
+                                source=SourceName.GUJARAT_HC,
+                                source_url=result["url"],
+                                document_type=DocumentType.COURT_RULING,
+                                title=result["title"],
+                                content=judgment["full_text"],
+                                html_content=judgment.get("html_content", ""),
+                                language="en",
+                                date_published=judgment.get("date") or result.get("date"),
+                                case_number=judgment.get("case_number"),
+                                court=f"Gujarat High Court - {BENCHES.get(bench, bench)}",
+                                sections_cited=judgment.get("sections", []),
+                                judges=judgment.get("judges", [result.get("judge", "")]),
+                                metadata={
+                                    "bench": bench,
+                                    "case_type": case_type,
+                                    "pdf_url": judgment.get("pdf_url"),
+                                },
+                            )
+
+                            # Cached documents are served from the cache on
+                            # resume, so their claims can stay in place
+                            self._cache_document(doc)
+                            unresolved.discard(result["url"])
+                            self._yielded_urls.add(result["url"])
+                            count += 1
+                            yield doc
+                    finally:
+                        for url in unresolved:
+                            self._release_url(url)
 
                     page += 1
 
                 self._state[state_key] = True
-                self._save_state()
+                self._checkpoint_state()
 
 
-def create_gujarat_hc_source(output_dir: str = "data/sources/gujhc") -> GujaratHCDataSource:
+def create_gujarat_hc_source(
+    output_dir: str = "data/sources/gujhc", redis_url: Optional[str] = None
+) -> GujaratHCDataSource:
     """Factory function to create Gujarat HC data source."""
     config = DataSourceConfig(
         base_url="https://gujarathighcourt.nic.in",
         output_dir=output_dir,
         delay_seconds=3.0,
-        max_concurrent=1,
+        max_concurrent=1,  # Starting point; AIMD raises it while the server is healthy
+        adaptive_concurrency=True,
+        max_concurrent_ceiling=8,
         max_retries=3,
         timeout=30,
+        redis_url=redis_url,
     )
     return GujaratHCDataSource(config)
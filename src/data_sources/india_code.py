@@ -5,22 +5,48 @@ Official repository of all Indian legislation. This module fetches bare acts
 and builds the critical IPC ↔ BNS section mapping table.
 """
 
+import hashlib
 import json
 import logging
+import os
 import re
-from typing import Generator, Optional
+import sys
+from types import MappingProxyType
+from typing import Callable, Generator, Mapping, NamedTuple, Optional
 from pathlib import Path
+
+import soupsieve
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+
+try:
+    import orjson
+except ImportError:  # Optional: faster mapping serialization
+    orjson = None
 
 from src.data_sources.base import (
     BaseDataSource, DataSourceConfig, DocumentType, ScrapedDocument, SourceName,
+    element_text, xpath_class,
 )
 
 logger = logging.getLogger(__name__)
 
+
+def _frozen_table(mapping: dict[str, str]) -> Mapping[str, str]:
+    """
+    Read-only section table with interned keys and values.
+
+    Interning lets section strings taken from these tables (and looked up
+    again downstream) compare by identity and share one hash cache.
+    """
+    return MappingProxyType({sys.intern(k): sys.intern(v) for k, v in mapping.items()})
+
+
 # === OFFICIAL IPC to BNS MAPPING ===
 # From MHA Gazette Notification (1 July 2024)
-IPC_TO_BNS = {
+# Decriminalized sections stay listed as "None" in their place, as published
+_IPC_TO_BNS_PUBLISHED = {
     # Offences affecting human body - Homicide
     "299": "100",  # Culpable homicide
     "300": "101",  # Murder
@@ -227,7 +253,7 @@ IPC_TO_BNS = {
 }
 
 # CrPC to BNSS mapping (key sections)
-CRPC_TO_BNSS = {
+CRPC_TO_BNSS = _frozen_table({
     "41": "35",    # When police may arrest without warrant
     "41A": "35",   # Notice of appearance before police
     "57": "58",    # Person arrested not to be detained more than 24 hours
@@ -307,10 +333,10 @@ CRPC_TO_BNSS = {
     "441": "485",  # Bond of accused and sureties
     "468": "512",  # Bar to taking cognizance after lapse of period
     "482": "528",  # Saving of inherent powers of High Court
-}
+})
 
 # Indian Evidence Act to Bharatiya Sakshya Adhiniyam
-IEA_TO_BSA = {
+IEA_TO_BSA = _frozen_table({
     "3": "2",     # Interpretation
     "4": "3",     # May presume
     "5": "4",     # Relevancy of facts
@@ -356,7 +382,130 @@ IEA_TO_BSA = {
     "145": "143", # Cross-examination as to previous statements
     "154": "151", # Questions by party to own witness
     "155": "152", # Impeaching credit of witness
+})
+
+# IPC sections with no BNS counterpart. Kept out of IPC_TO_BNS so every
+# forward entry is a real mapping.
+DECRIMINALIZED_IPC = frozenset(k for k, v in _IPC_TO_BNS_PUBLISHED.items() if v == "None")
+IPC_TO_BNS = _frozen_table(
+    {k: v for k, v in _IPC_TO_BNS_PUBLISHED.items() if k not in DECRIMINALIZED_IPC}
+)
+
+# Reverse tables, built once at import. All tables are read-only views so
+# they can be handed out without defensive copies.
+BNS_TO_IPC = _frozen_table({v: k for k, v in IPC_TO_BNS.items()})
+BNSS_TO_CRPC = _frozen_table({v: k for k, v in CRPC_TO_BNSS.items()})
+BSA_TO_IEA = _frozen_table({v: k for k, v in IEA_TO_BSA.items()})
+
+_MAPPINGS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "ipc_to_bns": IPC_TO_BNS,
+    "bns_to_ipc": BNS_TO_IPC,
+    "crpc_to_bnss": CRPC_TO_BNSS,
+    "bnss_to_crpc": BNSS_TO_CRPC,
+    "iea_to_bsa": IEA_TO_BSA,
+    "bsa_to_iea": BSA_TO_IEA,
+})
+_EMPTY: Mapping[str, str] = MappingProxyType({})
+
+# convert_section tables keyed by upper-cased (from_code, to_code)
+_CONVERT_TABLES: dict[tuple[str, str], Mapping[str, str]] = {
+    ("IPC", "BNS"): IPC_TO_BNS,
+    ("BNS", "IPC"): BNS_TO_IPC,
+    ("CRPC", "BNSS"): CRPC_TO_BNSS,
+    ("BNSS", "CRPC"): BNSS_TO_CRPC,
+    ("IEA", "BSA"): IEA_TO_BSA,
+    ("BSA", "IEA"): BSA_TO_IEA,
 }
+_UPPER_CODES = frozenset(code for pair in _CONVERT_TABLES for code in pair)
+
+# Per-direction converters: each is the table's bound .get, so a conversion
+# is a single C-level lookup with no dispatch on the direction
+_CONVERTERS: dict[tuple[str, str], Callable[[str], Optional[str]]] = {
+    pair: table.get for pair, table in _CONVERT_TABLES.items()
+}
+convert_ipc_to_bns = IPC_TO_BNS.get
+convert_bns_to_ipc = BNS_TO_IPC.get
+convert_crpc_to_bnss = CRPC_TO_BNSS.get
+convert_bnss_to_crpc = BNSS_TO_CRPC.get
+convert_iea_to_bsa = IEA_TO_BSA.get
+convert_bsa_to_iea = BSA_TO_IEA.get
+
+# Selectors compiled once and reused for every act page
+_SEL_SECTION_ITEM = soupsieve.compile(".section-item")
+_SEL_TR = soupsieve.compile("tr")
+_SEL_SECTION_NUMBER = soupsieve.compile(".section-number")
+_SEL_SECTION_TITLE = soupsieve.compile(".section-title")
+_SEL_SECTION_TEXT = soupsieve.compile(".section-text")
+_SEL_ACT_CONTENT = soupsieve.compile(".act-content")
+_SEL_CONTENT = soupsieve.compile("#content")
+_SEL_BODY = soupsieve.compile("body")
+
+# XPath equivalents of the section selectors, for the lxml fast path
+_XP_SECTION_ITEMS = etree.XPath(f"//*[{xpath_class('section-item')}]")
+_XP_TR = etree.XPath("//tr")
+_XP_SECTION_NUMBER = etree.XPath(f"(.//*[{xpath_class('section-number')}])[1]")
+_XP_SECTION_TITLE = etree.XPath(f"(.//*[{xpath_class('section-title')}])[1]")
+_XP_SECTION_TEXT = etree.XPath(f"(.//*[{xpath_class('section-text')}])[1]")
+
+
+def _xp_text(xpath: etree.XPath, element) -> str:
+    """Stripped text of the first xpath match, like BS4's get_text(strip=True)."""
+    found = xpath(element)
+    return element_text(found[0]) if found else ""
+
+
+# Main content block of an act page, in order of preference
+_XP_ACT_CONTENT = (
+    etree.XPath(f"(//*[{xpath_class('act-content')}])[1]"),
+    etree.XPath("(//*[@id='content'])[1]"),
+    etree.XPath("(//body)[1]"),
+)
+
+# Section input clean-up for convert_section: drop whitespace, dots and
+# hyphens, then a leading "Section"/"Sec"/"S" prefix
+_SECTION_STRIP = str.maketrans("", "", " .-\t\n")
+_SECTION_PREFIXES = ("SECTION", "SEC", "S")
+
+
+def _canon_section(section: str) -> str:
+    """
+    Canonical table key for user-supplied section text.
+
+    " Sec. 302 " -> "302", "s.498a" -> "498A", "305(A)" -> "305(a)". Table keys
+    use an upper-case suffix letter and lower-case clause letters.
+    """
+    compact = section.translate(_SECTION_STRIP)
+    upper = compact.upper()
+    for prefix in _SECTION_PREFIXES:
+        if upper.startswith(prefix) and upper[len(prefix):len(prefix) + 1].isdigit():
+            compact = compact[len(prefix):]
+            break
+    head, paren, clause = compact.partition("(")
+    return head.upper() + paren + clause.lower()
+
+# Files written by save_mappings (reverse tables keep their "*_from_*" names)
+_ALL_OUTPUTS: tuple[tuple[str, Mapping[str, str]], ...] = (
+    # The published file keeps decriminalized sections as "None", in their
+    # original place, which SectionNormalizer reports as decriminalized
+    ("ipc_to_bns", MappingProxyType(_IPC_TO_BNS_PUBLISHED)),
+    ("ipc_from_bns", BNS_TO_IPC),
+    ("crpc_to_bnss", CRPC_TO_BNSS),
+    ("crpc_from_bnss", BNSS_TO_CRPC),
+    ("iea_to_bsa", IEA_TO_BSA),
+    ("iea_from_bsa", BSA_TO_IEA),
+)
+
+
+class ActConfig(NamedTuple):
+    """A bare act to fetch, with its precomputed resume-state key."""
+    id: str
+    name: str
+    url_path: str
+    state_key: str
+
+
+def _act(act_id: str, name: str, url_path: str) -> ActConfig:
+    return ActConfig(act_id, name, url_path, f"indiacode:{act_id}")
 
 
 class IndiaCodeDataSource(BaseDataSource):
@@ -367,10 +516,25 @@ class IndiaCodeDataSource(BaseDataSource):
 
     BASE_URL = "https://www.indiacode.nic.in"
 
+    # Key acts to scrape
+    ACTS: tuple[ActConfig, ...] = (
+        _act("IPC", "Indian Penal Code, 1860", "/handle/123456789/2263"),
+        _act("BNS", "Bharatiya Nyaya Sanhita, 2023", "/handle/123456789/20062"),
+        _act("CrPC", "Code of Criminal Procedure, 1973", "/handle/123456789/1362"),
+        _act("BNSS", "Bharatiya Nagarik Suraksha Sanhita, 2023", "/handle/123456789/20063"),
+        _act("IEA", "Indian Evidence Act, 1872", "/handle/123456789/2188"),
+        _act("BSA", "Bharatiya Sakshya Adhiniyam, 2023", "/handle/123456789/20064"),
+        _act("NDPS", "Narcotic Drugs and Psychotropic Substances Act, 1985", "/handle/123456789/1791"),
+        _act("POCSO", "Protection of Children from Sexual Offences Act, 2012", "/handle/123456789/15532"),
+        _act("SCST", "Scheduled Castes and Scheduled Tribes (Prevention of Atrocities) Act, 1989", "/handle/123456789/1744"),
+        _act("ArmsAct", "Arms Act, 1959", "/handle/123456789/1398"),
+        _act("ITAct", "Information Technology Act, 2000", "/handle/123456789/1999"),
+    )
+
     def source_name(self) -> SourceName:
         return SourceName.INDIA_CODE
 
-    def get_section_mapping(self, direction: str = "ipc_to_bns") -> dict:
+    def get_section_mapping(self, direction: str = "ipc_to_bns") -> Mapping[str, str]:
         """
         Get section mapping between old and new codes.
 
@@ -378,15 +542,7 @@ class IndiaCodeDataSource(BaseDataSource):
             direction: "ipc_to_bns", "bns_to_ipc", "crpc_to_bnss",
                       "bnss_to_crpc", "iea_to_bsa", "bsa_to_iea"
         """
-        mappings = {
-            "ipc_to_bns": IPC_TO_BNS,
-            "bns_to_ipc": {v: k for k, v in IPC_TO_BNS.items() if v != "None"},
-            "crpc_to_bnss": CRPC_TO_BNSS,
-            "bnss_to_crpc": {v: k for k, v in CRPC_TO_BNSS.items()},
-            "iea_to_bsa": IEA_TO_BSA,
-            "bsa_to_iea": {v: k for k, v in IEA_TO_BSA.items()},
-        }
-        return mappings.get(direction, {})
+        return _MAPPINGS.get(direction, _EMPTY)
 
     def convert_section(self, section: str, from_code: str = "IPC", to_code: str = "BNS") -> Optional[str]:
         """
@@ -395,46 +551,51 @@ class IndiaCodeDataSource(BaseDataSource):
         Examples:
             convert_section("302", "IPC", "BNS") -> "103"
             convert_section("103", "BNS", "IPC") -> "302"
+            convert_section("Sec. 302", "IPC", "BNS") -> "103"
         """
-        direction_map = {
-            ("IPC", "BNS"): "ipc_to_bns",
-            ("BNS", "IPC"): "bns_to_ipc",
-            ("CrPC", "BNSS"): "crpc_to_bnss",
-            ("BNSS", "CrPC"): "bnss_to_crpc",
-            ("IEA", "BSA"): "iea_to_bsa",
-            ("BSA", "IEA"): "bsa_to_iea",
-        }
-        direction = direction_map.get((from_code.upper(), to_code.upper()))
-        if not direction:
+        if from_code not in _UPPER_CODES:
+            from_code = from_code.upper()
+        if to_code not in _UPPER_CODES:
+            to_code = to_code.upper()
+        convert = _CONVERTERS.get((from_code, to_code))
+        if convert is None:
             return None
-        mapping = self.get_section_mapping(direction)
-        return mapping.get(section)
+        # Canonical keys hit directly; only clean up input that misses
+        # (None or empty input has nothing to clean up)
+        result = convert(section)
+        if result is None and section:
+            canonical = _canon_section(section)
+            if canonical != section:
+                result = convert(canonical)
+        return result
+
+    @staticmethod
+    def _dump_mapping(mapping: Mapping[str, str]) -> bytes:
+        """Serialize a mapping as indented UTF-8 JSON."""
+        if orjson is not None:
+            return orjson.dumps(dict(mapping), option=orjson.OPT_INDENT_2)
+        return json.dumps(dict(mapping), indent=2, ensure_ascii=False).encode("utf-8")
 
     def save_mappings(self, output_dir: str = "configs"):
         """Save all code mappings as JSON files for the system to use."""
         output = Path(output_dir)
         output.mkdir(parents=True, exist_ok=True)
 
-        mappings = {
-            "ipc_to_bns": IPC_TO_BNS,
-            "crpc_to_bnss": CRPC_TO_BNSS,
-            "iea_to_bsa": IEA_TO_BSA,
-        }
-
-        for name, mapping in mappings.items():
+        for name, mapping in _ALL_OUTPUTS:
             filepath = output / f"{name}_mapping.json"
-            with open(filepath, "w") as f:
-                json.dump(mapping, f, indent=2, ensure_ascii=False)
-            logger.info(f"Saved mapping: {filepath} ({len(mapping)} entries)")
+            payload = self._dump_mapping(mapping)
+            try:
+                current = hashlib.sha256(filepath.read_bytes()).digest()
+            except FileNotFoundError:
+                current = None
+            if current == hashlib.sha256(payload).digest():
+                logger.debug(f"Mapping unchanged: {filepath}")
+                continue
 
-        # Also save reverse mappings
-        for name, mapping in mappings.items():
-            reverse_name = name.replace("_to_", "_from_")
-            reverse_mapping = {v: k for k, v in mapping.items() if v != "None"}
-            filepath = output / f"{reverse_name}_mapping.json"
-            with open(filepath, "w") as f:
-                json.dump(reverse_mapping, f, indent=2, ensure_ascii=False)
-            logger.info(f"Saved reverse mapping: {filepath} ({len(reverse_mapping)} entries)")
+            tmp_path = filepath.with_name(filepath.name + ".tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, filepath)
+            logger.info(f"Saved mapping: {filepath} ({len(mapping)} entries)")
 
     def fetch_act_sections(self, act_id: str) -> Generator[dict, None, None]:
         """Fetch sections of a specific act from India Code."""
@@ -444,13 +605,31 @@ class IndiaCodeDataSource(BaseDataSource):
         if not response:
             return
 
-        soup = BeautifulSoup(response.text, "lxml")
-        sections = soup.select(".section-item") or soup.select("tr")
+        try:
+            tree = lxml_html.fromstring(response.content)
+        except (etree.ParserError, ValueError) as e:
+            logger.debug(f"lxml could not parse sections for {act_id} ({e}) - using BeautifulSoup")
+            yield from self._parse_sections_bs4(response.text)
+            return
 
+        sections = _XP_SECTION_ITEMS(tree) or _XP_TR(tree)
         for section in sections:
-            section_num = section.select_one(".section-number")
-            section_title = section.select_one(".section-title")
-            section_text = section.select_one(".section-text")
+            yield {
+                "number": _xp_text(_XP_SECTION_NUMBER, section),
+                "title": _xp_text(_XP_SECTION_TITLE, section),
+                "text": _xp_text(_XP_SECTION_TEXT, section),
+            }
+
+    @staticmethod
+    def _parse_sections_bs4(html: str) -> Generator[dict, None, None]:
+        """BeautifulSoup fallback for pages lxml cannot parse directly."""
+        soup = BeautifulSoup(html, "lxml")
+        sections = _SEL_SECTION_ITEM.select(soup) or _SEL_TR.select(soup)
+
+        for section in sections:
+            section_num = _SEL_SECTION_NUMBER.select_one(section)
+            section_title = _SEL_SECTION_TITLE.select_one(section)
+            section_text = _SEL_SECTION_TEXT.select_one(section)
 
             yield {
                 "number": section_num.get_text(strip=True) if section_num else "",
@@ -458,6 +637,40 @@ class IndiaCodeDataSource(BaseDataSource):
                 "text": section_text.get_text(strip=True) if section_text else "",
             }
 
+    @staticmethod
+    def _extract_act_content(response) -> Optional[tuple[str, str]]:
+        """
+        Return (text, html) of an act page's main content block.
+
+        Parses the raw response bytes with lxml, so the page is never decoded
+        into one large str first. Falls back to BeautifulSoup for documents
+        lxml rejects.
+        """
+        try:
+            parser = lxml_html.HTMLParser(encoding=response.encoding, recover=True)
+            tree = lxml_html.fromstring(response.content, parser=parser)
+        except (etree.ParserError, LookupError, ValueError):
+            tree = None
+
+        if tree is not None:
+            content = next((found[0] for xp in _XP_ACT_CONTENT if (found := xp(tree))), None)
+            if content is None:
+                return None
+            return (
+                element_text(content, "\n"),
+                lxml_html.tostring(content, encoding="unicode", with_tail=False),
+            )
+
+        soup = BeautifulSoup(response.content, "lxml", from_encoding=response.encoding)
+        content = (
+            _SEL_ACT_CONTENT.select_one(soup)
+            or _SEL_CONTENT.select_one(soup)
+            or _SEL_BODY.select_one(soup)
+        )
+        if not content:
+            return None
+        return content.get_text(separator="\n", strip=True), str(content)
+
     def scrape(
         self,
         acts: list[str] = None,
@@ -470,63 +683,58 @@ class IndiaCodeDataSource(BaseDataSource):
         if save_mappings:
             self.save_mappings()
 
-        # Key acts to scrape
-        act_configs = [
-            {"id": "IPC", "name": "Indian Penal Code, 1860", "url_path": "/handle/123456789/2263"},
-            {"id": "BNS", "name": "Bharatiya Nyaya Sanhita, 2023", "url_path": "/handle/123456789/20062"},
-            {"id": "CrPC", "name": "Code of Criminal Procedure, 1973", "url_path": "/handle/123456789/1362"},
-            {"id": "BNSS", "name": "Bharatiya Nagarik Suraksha Sanhita, 2023", "url_path": "/handle/123456789/20063"},
-            {"id": "IEA", "name": "Indian Evidence Act, 1872", "url_path": "/handle/123456789/2188"},
-            {"id": "BSA", "name": "Bharatiya Sakshya Adhiniyam, 2023", "url_path": "/handle/123456789/20064"},
-            {"id": "NDPS", "name": "Narcotic Drugs and Psychotropic Substances Act, 1985", "url_path": "/handle/123456789/1791"},
-            {"id": "POCSO", "name": "Protection of Children from Sexual Offences Act, 2012", "url_path": "/handle/123456789/15532"},
-            {"id": "SCST", "name": "Scheduled Castes and Scheduled Tribes (Prevention of Atrocities) Act, 1989", "url_path": "/handle/123456789/1744"},
-            {"id": "ArmsAct", "name": "Arms Act, 1959", "url_path": "/handle/123456789/1398"},
-            {"id": "ITAct", "name": "Information Technology Act, 2000", "url_path": "/handle/123456789/1999"},
-        ]
-
-        for act_config in act_configs:
-            state_key = f"indiacode:{act_config['id']}"
-            if self._state.get(state_key):
-                continue
-
-            logger.info(f"Fetching: {act_config['name']}")
-            url = f"{self.BASE_URL}{act_config['url_path']}"
-
-            response = self.fetch_page(url)
-            if not response:
-                continue
 
-            soup = BeautifulSoup(response.text, "lxml")
-            content = soup.select_one(".act-content") or soup.select_one("#content") or soup.select_one("body")
-
-            if content:
-                doc = ScrapedDocument(
-                    source=SourceName.INDIA_CODE,
-                    source_url=url,
-                    document_type=DocumentType.BARE_ACT,
-                    title=act_config["name"],
-                    content=content.get_text(separator="\n", strip=True),
-                    html_content=str(content),
-                    language="en",
-                    metadata={
-                        "act_id": act_config["id"],
-                        "act_name": act_config["name"],
-                    },
-                )
-                yield doc
-
-            self._state[state_key] = True
-            self._save_state()
-
-
-def create_india_code_source(output_dir: str = "data/sources/indiacode") -> IndiaCodeDataSource:
+        pending = [act for act in self.ACTS if act.state_key not in self._state]
+
+        def fetch_act(act: ActConfig):
+            logger.info(f"Fetching: {act.name}")
+            return act, self.fetch_page(f"{self.BASE_URL}{act.url_path}")
+
+        # State is written once when the loop ends (or is interrupted)
+        # instead of once per act
+        dirty = False
+        try:
+            # Acts are independent pages; fetch them concurrently (still rate limited)
+            for act, response in self._map_concurrent(fetch_act, pending):
+                url = f"{self.BASE_URL}{act.url_path}"
+                if not response:
+                    continue
+
+                extracted = self._extract_act_content(response)
+                if extracted:
+                    text, html_content = extracted
+                    doc = ScrapedDocument(
+                        source=SourceName.INDIA_CODE,
+                        source_url=url,
+                        document_type=DocumentType.BARE_ACT,
+                        title=act.name,
+                        content=text,
+                        html_content=html_content,
+                        language="en",
+                        metadata={
+                            "act_id": act.id,
+                            "act_name": act.name,
+                        },
+                    )
+                    yield doc
+
+                self._state[act.state_key] = True
+                dirty = True
+        finally:
+            if dirty:
+                self._save_state()
+
+
+def create_india_code_source(
+    output_dir: str = "data/sources/indiacode", redis_url: Optional[str] = None
+) -> IndiaCodeDataSource:
     config = DataSourceConfig(
         base_url="https://www.indiacode.nic.in",
         output_dir=output_dir,
         delay_seconds=2.0,
-        max_concurrent=1,
+        max_concurrent=4,
         max_retries=3,
         timeout=30,
+        redis_url=redis_url,
     )
     return IndiaCodeDataSource(config)
@@ -23,12 +23,19 @@ Contact them at contact@indiankanoon.org for bulk data access.
 For the POC, we use respectful web scraping with rate limits.
 """
 
+import heapq
+import os
 import re
 import logging
-from typing import Generator, Optional
-from urllib.parse import urljoin, quote_plus
+from datetime import datetime
+from pathlib import Path
+from typing import Generator, Optional, Sequence, Union
+from urllib.parse import urlencode, urljoin
 
+import soupsieve
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from src.data_sources.base import (
     BaseDataSource,
@@ -36,12 +43,108 @@ from src.data_sources.base import (
     DocumentType,
     ScrapedDocument,
     SourceName,
+    element_text,
+    xpath_class,
 )
+from src.ingestion.utils import script_counts
 
 logger = logging.getLogger(__name__)
 
+# Metadata patterns, compiled once at import
+_DATE_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in [
+        r"(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s*,?\s*(\d{4})",
+        r"(\d{1,2})[/-](\d{1,2})[/-](\d{4})",
+        r"dated\s+(\d{1,2})[./-](\d{1,2})[./-](\d{4})",
+    ]
+]
+
+_COURT_PATTERNS = [
+    (court_name, re.compile(p, re.IGNORECASE)) for court_name, p in {
+        "Supreme Court of India": r"Supreme\s+Court",
+        "Gujarat High Court": r"Gujarat\s+High\s+Court|High\s+Court\s+of\s+Gujarat",
+        "Ahmedabad District Court": r"Ahmedabad.*District|District.*Ahmedabad",
+        "Surat District Court": r"Surat.*District|District.*Surat",
+        "Vadodara District Court": r"Vadodara.*District|District.*Vadodara|Baroda.*District",
+        "Rajkot District Court": r"Rajkot.*District|District.*Rajkot",
+    }.items()
+]
+
+_CASE_NUMBER_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in [
+        r"(Criminal\s+Appeal\s+No\.\s*\d+\s*/\s*\d{4})",
+        r"(Criminal\s+Misc\.\s*Application\s+No\.\s*\d+\s*/\s*\d{4})",
+        r"(Special\s+Criminal\s+Application\s+No\.\s*\d+\s*/\s*\d{4})",
+        r"(Bail\s+Application\s+No\.\s*\d+\s*/\s*\d{4})",
+        r"(CR\.?MA?\s*No\.\s*\d+\s*/\s*\d{4})",
+        r"(Sessions\s+Case\s+No\.\s*\d+\s*/\s*\d{4})",
+        r"(FIR\s+No\.\s*[A-Z0-9/-]+)",
+        r"(\d{4}\s*\(\d+\)\s*SCC\s*\d+)",
+        r"(\d{4}\s*\(\d+\)\s*GLR\s*\d+)",
+        r"(AIR\s+\d{4}\s+\w+\s+\d+)",
+    ]
+]
+
+# Section citations, one alternative per act; matched case-sensitively on
+# purpose ("IPC", not "ipc"). Fused into a single pattern so a judgment is
+# scanned once rather than once per act; at any position the first listed
+# alternative that matches wins. The alternation sits in a lookahead, so a
+# match is tried at every position and overlapping citations ("Section 302
+# IPC Sec 34") are all found; group 1 holds the citation text.
+_SECTION_PATTERN = re.compile("(?=(" + "|".join(
+    f"(?:{p})" for p in [
+        # IPC sections
+        r"[Ss]ection\s+(\d+[A-Z]?)\s+(?:of\s+)?(?:the\s+)?(?:Indian\s+Penal\s+Code|I\.?P\.?C\.?)",
+        r"(?:IPC|I\.P\.C\.?)\s*[Ss](?:ection|ec\.?)\s*(\d+[A-Z]?)",
+        r"[Ss]\.?\s*(\d+[A-Z]?)\s+IPC",
+        # CrPC sections
+        r"[Ss]ection\s+(\d+[A-Z]?)\s+(?:of\s+)?(?:the\s+)?(?:Code\s+of\s+Criminal\s+Procedure|Cr\.?P\.?C\.?|CrPC)",
+        # BNSS (before BNS, whose "BNS" would otherwise match the start of "BNSS")
+        r"[Ss]ection\s+(\d+[A-Z]?)\s+(?:of\s+)?(?:the\s+)?(?:Bharatiya\s+Nagarik\s+Suraksha\s+Sanhita|B\.?N\.?S\.?S\.?|BNSS)",
+        # BNS sections
+        r"[Ss]ection\s+(\d+[A-Z]?)\s+(?:of\s+)?(?:the\s+)?(?:Bharatiya\s+Nyaya\s+Sanhita|B\.?N\.?S\.?)",
+        r"(?:BNS|B\.N\.S\.?)\s*[Ss](?:ection|ec\.?)\s*(\d+[A-Z]?)",
+        # NDPS
+        r"[Ss]ection\s+(\d+[A-Z]?)\s+(?:of\s+)?(?:the\s+)?(?:NDPS\s+Act|Narcotic)",
+        # POCSO
+        r"[Ss]ection\s+(\d+[A-Z]?)\s+(?:of\s+)?(?:the\s+)?POCSO",
+        # Arms Act
+        r"[Ss]ection\s+(\d+[A-Z]?)\s+(?:of\s+)?(?:the\s+)?Arms\s+Act",
+    ]
+) + "))")
+
+# Common pattern: "X vs Y" or "X v. Y" or "X versus Y"
+_PARTIES_PATTERN = re.compile(r"(.+?)\s+(?:vs?\.?|versus)\s+(.+?)(?:\s+on\s+|\s*$)", re.IGNORECASE)
+
+# Precompiled XPath for the search-result and judgment page parsers
+_XP_RESULTS = etree.XPath(f"//*[{xpath_class('result')}]")
+_XP_RESULT_TITLE_LINK = etree.XPath(f"(.//*[{xpath_class('result_title')}]//a)[1]")
+_XP_HEADLINE = etree.XPath(f"(.//*[{xpath_class('headline')}])[1]")
+_XP_DOCSOURCE = etree.XPath(f"(.//*[{xpath_class('docsource')}])[1]")
+_XP_ARTICLE = etree.XPath(f"(//article[{xpath_class('middle_column')}])[1]")
+_XP_AKOMA = etree.XPath(f"(.//div[{xpath_class('akoma-ntoso')}])[1]")
+_XP_FIRST_DIV = etree.XPath("(.//div)[1]")
+_XP_DOC_TITLE = etree.XPath(f"(//h2[{xpath_class('doc_title')}])[1]")
+_XP_TITLE = etree.XPath("(//title)[1]")
+_XP_DOCSOURCE_MAIN = etree.XPath(f"(//*[{xpath_class('docsource_main')}])[1]")
+_XP_DOC_AUTHOR_LINKS = etree.XPath(f"(//*[{xpath_class('doc_author')}])[1]//a")
+
+# Selectors compiled once for the BeautifulSoup fallbacks
+_SEL_RESULT = soupsieve.compile(".result")
+_SEL_RESULT_TITLE_LINK = soupsieve.compile(".result_title a")
+_SEL_HEADLINE = soupsieve.compile(".headline")
+_SEL_DOCSOURCE = soupsieve.compile(".docsource")
+_SEL_ARTICLE = soupsieve.compile("article.middle_column")
+_SEL_AKOMA = soupsieve.compile("div.akoma-ntoso")
+_SEL_DIV = soupsieve.compile("div")
+_SEL_DOC_TITLE = soupsieve.compile("h2.doc_title")
+_SEL_TITLE = soupsieve.compile("title")
+_SEL_DOCSOURCE_MAIN = soupsieve.compile(".docsource_main")
+_SEL_DOC_AUTHOR = soupsieve.compile(".doc_author")
+_SEL_LINK = soupsieve.compile("a")
+
 # Gujarat-relevant search queries for building the corpus
-DEFAULT_QUERIES = [
+DEFAULT_QUERIES: tuple[str, ...] = (
     # Criminal law queries
     "Gujarat murder Section 302 IPC",
     "Gujarat theft Section 379 IPC",
@@ -86,7 +189,7 @@ DEFAULT_QUERIES = [
     "Gujarat High Court landmark criminal",
     "Gujarat acquittal chargesheet deficiency",
     "Gujarat conviction rate analysis",
-]
+)
 
 # Court filters for Indian Kanoon
 COURT_FILTERS = {
@@ -97,6 +200,56 @@ COURT_FILTERS = {
 }
 
 
+def parse_judgment_page(
+    html: Union[str, bytes], url: str, encoding: Optional[str] = None
+) -> Optional[dict]:
+    """
+    Parse a full judgment page to extract structured data.
+
+    html may be the raw response body; lxml then decodes it while parsing
+    (using encoding, if known), so the page is never held as one big str.
+    Holds no scraper state, so it can run in a parse worker process.
+    """
+    try:
+        page = IndianKanoonDataSource._judgment_parts_lxml(html, url, encoding)
+    except (etree.ParserError, LookupError, ValueError) as e:
+        logger.debug(f"lxml could not parse {url} ({e}) - using BeautifulSoup")
+        page = IndianKanoonDataSource._judgment_parts_bs4(html, url, encoding)
+    if page is None:
+        return None
+
+    full_text, html_content, title, source_text, judges = page
+    logger.debug(f"Extracted text length: {len(full_text)}, first 200 chars: {full_text[:200]}")
+
+    # Extract date
+    date_published = IndianKanoonDataSource._extract_date(source_text + " " + full_text[:500])
+
+    # Extract court name
+    court = IndianKanoonDataSource._extract_court(source_text)
+
+    # Extract case number
+    case_number = IndianKanoonDataSource._extract_case_number(title + " " + full_text[:500])
+
+    # Extract IPC/BNS sections cited
+    sections = IndianKanoonDataSource._extract_sections(full_text)
+
+    # Extract party names
+    parties = IndianKanoonDataSource._extract_parties(title)
+
+    return {
+        "title": title,
+        "full_text": full_text,
+        "html_content": html_content,
+        "court": court,
+        "date_published": date_published,
+        "case_number": case_number,
+        "judges": judges,
+        "sections": sections,
+        "parties": parties,
+        "source_text": source_text,
+    }
+
+
 class IndianKanoonDataSource(BaseDataSource):
     """
     Scraper for Indian Kanoon (indiankanoon.org).
@@ -105,51 +258,90 @@ class IndianKanoonDataSource(BaseDataSource):
 
     BASE_URL = "https://indiankanoon.org"
 
+    def __init__(self, config: DataSourceConfig):
+        super().__init__(config)
+        # Overlapping queries surface the same judgments. _seen_doc_ids holds
+        # doc_ids whose documents were saved (by this or an earlier run) and
+        # _yielded_doc_ids the ones already handed out by this run's scrape
+        self._seen_doc_ids: set[str] = self._load_seen_doc_ids()
+        self._yielded_doc_ids: set[str] = set()
+
     def source_name(self) -> SourceName:
         return SourceName.INDIAN_KANOON
 
+    def _seen_doc_ids_key(self) -> str:
+        return f"scrape:seen_doc_ids:{self.source_name().value}"
+
+    def _load_seen_doc_ids(self) -> set[str]:
+        """Load saved doc_ids from the Redis set or the append-only id file."""
+        seen = set(self._state.get("seen_doc_ids", []))  # Written into state by older versions
+        if self._redis is not None:
+            seen.update(m.decode() for m in self._redis.smembers(self._seen_doc_ids_key()))
+        else:
+            id_file = self.output_dir / ".seen_doc_ids"
+            if id_file.exists():
+                seen.update(id_file.read_text().split())
+        return seen
+
+    def _mark_doc_id_saved(self, doc_id: str):
+        """Record one saved doc_id incrementally (SADD / one appended line)."""
+        if doc_id in self._seen_doc_ids:
+            return
+        self._seen_doc_ids.add(doc_id)
+        if self._redis is not None:
+            self._redis.sadd(self._seen_doc_ids_key(), doc_id)
+        else:
+            with open(self.output_dir / ".seen_doc_ids", "a") as f:
+                f.write(f"{doc_id}\n")
+
+    def save_document(self, doc: ScrapedDocument) -> Optional[Path]:
+        """Save a document, then mark its doc_id so later queries and runs skip it."""
+        path = super().save_document(doc)
+        doc_id = doc.metadata.get("doc_id")
+        if doc_id:
+            self._mark_doc_id_saved(doc_id)
+        return path
+
+    def _search_url_prefix(self, query: str, court_filter: str = None) -> str:
+        """Search URL for a query (and court filter) without the page number."""
+        params = [("formInput", query)]
+        if court_filter in COURT_FILTERS:
+            params.append((COURT_FILTERS[court_filter], "true"))
+        return f"{self.BASE_URL}/search/?{urlencode(params)}"
+
     def _build_search_url(
         self,
         query: str,
         page: int = 0,
         court_filter: str = None,
+        prefix: str = None,
     ) -> str:
-        """Build the search URL for Indian Kanoon."""
-        encoded_query = quote_plus(query)
-        url = f"{self.BASE_URL}/search/?formInput={encoded_query}"
-
-        if court_filter and court_filter in COURT_FILTERS:
-            url += f"&pagenum={page}&{COURT_FILTERS[court_filter]}=true"
-        elif page > 0:
-            url += f"&pagenum={page}"
+        """
+        Build the search URL for Indian Kanoon.
 
-        return url
+        Callers paging through one query can pass its _search_url_prefix()
+        once as prefix instead of re-encoding the query for every page.
+        """
+        if prefix is None:
+            prefix = self._search_url_prefix(query, court_filter)
+        return f"{prefix}&pagenum={page}" if page else prefix
+
+    def _parse_search_results(
+        self, html: Union[str, bytes], encoding: Optional[str] = None
+    ) -> list[dict]:
+        """Parse search results page (raw body, decoded using encoding) to extract case links."""
+        try:
+            rows = self._search_rows_lxml(html, encoding)
+        except (etree.ParserError, LookupError, ValueError) as e:
+            logger.debug(f"lxml could not parse search page ({e}) - using BeautifulSoup")
+            rows = self._search_rows_bs4(html, encoding)
 
-    def _parse_search_results(self, html: str) -> list[dict]:
-        """Parse search results page to extract case links."""
-        soup = BeautifulSoup(html, "lxml")
         results = []
-
-        for result_div in soup.select(".result"):
-            title_elem = result_div.select_one(".result_title a")
-            if not title_elem:
-                continue
-
-            link = title_elem.get("href", "")
+        for link, title, snippet, meta_text in rows:
             # Accept both /doc/ and /docfragment/ URLs
             if not (link.startswith("/doc/") or link.startswith("/docfragment/")):
                 continue
 
-            title = title_elem.get_text(strip=True)
-
-            # Extract snippet - updated to use 'headline' class
-            snippet_elem = result_div.select_one(".headline")
-            snippet = snippet_elem.get_text(strip=True) if snippet_elem else ""
-
-            # Extract metadata (court, date)
-            meta_elem = result_div.select_one(".docsource")
-            meta_text = meta_elem.get_text(strip=True) if meta_elem else ""
-
             # Extract doc_id from either /doc/ or /docfragment/
             if "/doc/" in link:
                 doc_id = link.split("/doc/")[1].split("/")[0].split("?")[0]
@@ -172,96 +364,126 @@ class IndianKanoonDataSource(BaseDataSource):
 
         return results
 
-    def _parse_judgment_page(self, html: str, url: str) -> Optional[dict]:
+    @staticmethod
+    def _search_rows_lxml(
+        html: Union[str, bytes], encoding: Optional[str] = None
+    ) -> list[tuple[str, str, str, str]]:
+        """(href, title, snippet, meta) per search result, via lxml XPath."""
+        tree = lxml_html.fromstring(html, parser=lxml_html.HTMLParser(encoding=encoding))
+        rows = []
+        for result_div in _XP_RESULTS(tree):
+            title_elem = _XP_RESULT_TITLE_LINK(result_div)
+            if not title_elem:
+                continue
+            snippet_elem = _XP_HEADLINE(result_div)
+            meta_elem = _XP_DOCSOURCE(result_div)
+            rows.append((
+                title_elem[0].get("href", ""),
+                element_text(title_elem[0]),
+                element_text(snippet_elem[0]) if snippet_elem else "",
+                element_text(meta_elem[0]) if meta_elem else "",
+            ))
+        return rows
+
+    @staticmethod
+    def _search_rows_bs4(
+        html: Union[str, bytes], encoding: Optional[str] = None
+    ) -> list[tuple[str, str, str, str]]:
+        """BeautifulSoup fallback for search pages lxml cannot parse directly."""
+        soup = BeautifulSoup(html, "lxml", from_encoding=encoding)
+        rows = []
+        for result_div in _SEL_RESULT.select(soup):
+            title_elem = _SEL_RESULT_TITLE_LINK.select_one(result_div)
+            if not title_elem:
+                continue
+            # Extract snippet - updated to use 'headline' class
+            snippet_elem = _SEL_HEADLINE.select_one(result_div)
+            # Extract metadata (court, date)
+            meta_elem = _SEL_DOCSOURCE.select_one(result_div)
+            rows.append((
+                title_elem.get("href", ""),
+                title_elem.get_text(strip=True),
+                snippet_elem.get_text(strip=True) if snippet_elem else "",
+                meta_elem.get_text(strip=True) if meta_elem else "",
+            ))
+        return rows
+
+    def _parse_judgment_page(
+        self, html: Union[str, bytes], url: str, encoding: Optional[str] = None
+    ) -> Optional[dict]:
         """Parse a full judgment page to extract structured data."""
-        soup = BeautifulSoup(html, "lxml")
+        return parse_judgment_page(html, url, encoding)
+
+    @staticmethod
+    def _judgment_parts_lxml(
+        html: Union[str, bytes], url: str, encoding: Optional[str] = None
+    ) -> Optional[tuple]:
+        """(full_text, html_content, title, source_text, judges) via lxml XPath."""
+        # huge_tree lifts libxml2's depth/size limits for very long judgments
+        parser = lxml_html.HTMLParser(encoding=encoding, huge_tree=True)
+        tree = lxml_html.fromstring(html, parser=parser)
 
         # Main judgment text - in article.middle_column > div.akoma-ntoso
-        article = soup.select_one("article.middle_column")
+        article = _XP_ARTICLE(tree)
         if not article:
             logger.warning(f"Could not find article.middle_column on {url}")
             return None
-        
-        judgment_div = article.select_one("div.akoma-ntoso")
-        logger.debug(f"Found div.akoma-ntoso: {judgment_div is not None}")
 
+        # Fall back to the article's first div when there is no akoma-ntoso block
+        judgment_div = _XP_AKOMA(article[0]) or _XP_FIRST_DIV(article[0])
         if not judgment_div:
-            # Try alternative: any div with substantial text
-            logger.debug(f"Trying to find any div in article")
-            judgment_div = article.select_one("div")
-            logger.debug(f"Found alternative div: {judgment_div is not None}")
+            logger.warning(f"Could not find judgment text container on {url}")
+            return None
+        judgment_div = judgment_div[0]
+
+        title_elem = _XP_DOC_TITLE(tree) or _XP_TITLE(tree)
+        source_elem = _XP_DOCSOURCE_MAIN(tree)
+        return (
+            element_text(judgment_div, "\n"),
+            lxml_html.tostring(judgment_div, encoding="unicode", with_tail=False),
+            element_text(title_elem[0]) if title_elem else "Unknown",
+            element_text(source_elem[0]) if source_elem else "",
+            [element_text(a) for a in _XP_DOC_AUTHOR_LINKS(tree)],
+        )
+
+    @staticmethod
+    def _judgment_parts_bs4(
+        html: Union[str, bytes], url: str, encoding: Optional[str] = None
+    ) -> Optional[tuple]:
+        """BeautifulSoup fallback for judgment pages lxml cannot parse directly."""
+        soup = BeautifulSoup(html, "lxml", from_encoding=encoding)
+
+        article = _SEL_ARTICLE.select_one(soup)
+        if not article:
+            logger.warning(f"Could not find article.middle_column on {url}")
+            return None
 
+        judgment_div = _SEL_AKOMA.select_one(article) or _SEL_DIV.select_one(article)
         if not judgment_div:
             logger.warning(f"Could not find judgment text container on {url}")
             return None
 
-        # Debug: print the actual HTML structure
-        logger.debug(f"judgment_div tag: {judgment_div.name if judgment_div else 'None'}, classes: {judgment_div.get('class') if judgment_div else 'None'}")
-        logger.debug(f"judgment_div HTML (first 500 chars): {str(judgment_div)[:500]}")
-
-        # Get full text
-        full_text = judgment_div.get_text(separator="\n", strip=True)
-        html_content = str(judgment_div)
-
-        logger.debug(f"Extracted text length: {len(full_text)}, first 200 chars: {full_text[:200]}")
-
-        # Extract title
-        title_elem = soup.select_one("h2.doc_title") or soup.select_one("title")
-        title = title_elem.get_text(strip=True) if title_elem else "Unknown"
-
-        # Extract court and date from doc source
-        source_elem = soup.select_one(".docsource_main")
-        source_text = source_elem.get_text(strip=True) if source_elem else ""
-
-        # Extract judge names
-        author_elem = soup.select_one(".doc_author")
-        judges = []
-        if author_elem:
-            judges = [a.get_text(strip=True) for a in author_elem.select("a")]
-
-        # Extract date
-        date_published = self._extract_date(source_text + " " + full_text[:500])
-
-        # Extract court name
-        court = self._extract_court(source_text)
-
-        # Extract case number
-        case_number = self._extract_case_number(title + " " + full_text[:500])
-
-        # Extract IPC/BNS sections cited
-        sections = self._extract_sections(full_text)
-
-        # Extract party names
-        parties = self._extract_parties(title)
-
-        return {
-            "title": title,
-            "full_text": full_text,
-            "html_content": html_content,
-            "court": court,
-            "date_published": date_published,
-            "case_number": case_number,
-            "judges": judges,
-            "sections": sections,
-            "parties": parties,
-            "source_text": source_text,
-        }
-
-    def _extract_date(self, text: str) -> Optional[str]:
+        title_elem = _SEL_DOC_TITLE.select_one(soup) or _SEL_TITLE.select_one(soup)
+        source_elem = _SEL_DOCSOURCE_MAIN.select_one(soup)
+        author_elem = _SEL_DOC_AUTHOR.select_one(soup)
+        return (
+            judgment_div.get_text(separator="\n", strip=True),
+            str(judgment_div),
+            title_elem.get_text(strip=True) if title_elem else "Unknown",
+            source_elem.get_text(strip=True) if source_elem else "",
+            [a.get_text(strip=True) for a in _SEL_LINK.select(author_elem)] if author_elem else [],
+        )
+
+    @staticmethod
+    def _extract_date(text: str) -> Optional[str]:
         """Extract date from judgment text."""
-        patterns = [
-            r"(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s*,?\s*(\d{4})",
-            r"(\d{1,2})[/-](\d{1,2})[/-](\d{4})",
-            r"dated\s+(\d{1,2})[./-](\d{1,2})[./-](\d{4})",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 try:
                     groups = match.groups()
                     if len(groups) == 3 and not groups[1].isdigit():
                         # Month name format
-                        from datetime import datetime
                         date_str = f"{groups[0]} {groups[1]} {groups[2]}"
                         dt = datetime.strptime(date_str, "%d %B %Y")
                         return dt.strftime("%Y-%m-%d")
@@ -271,98 +493,61 @@ class IndianKanoonDataSource(BaseDataSource):
                     continue
         return None
 
-    def _extract_court(self, text: str) -> str:
+    @staticmethod
+    def _extract_court(text: str) -> str:
         """Extract court name from source text."""
-        court_patterns = {
-            "Supreme Court of India": r"Supreme\s+Court",
-            "Gujarat High Court": r"Gujarat\s+High\s+Court|High\s+Court\s+of\s+Gujarat",
-            "Ahmedabad District Court": r"Ahmedabad.*District|District.*Ahmedabad",
-            "Surat District Court": r"Surat.*District|District.*Surat",
-            "Vadodara District Court": r"Vadodara.*District|District.*Vadodara|Baroda.*District",
-            "Rajkot District Court": r"Rajkot.*District|District.*Rajkot",
-        }
-        for court_name, pattern in court_patterns.items():
-            if re.search(pattern, text, re.IGNORECASE):
+        for court_name, pattern in _COURT_PATTERNS:
+            if pattern.search(text):
                 return court_name
         return text[:100] if text else "Unknown"
 
-    def _extract_case_number(self, text: str) -> Optional[str]:
+    @staticmethod
+    def _extract_case_number(text: str) -> Optional[str]:
         """Extract case number/citation."""
-        patterns = [
-            r"(Criminal\s+Appeal\s+No\.\s*\d+\s*/\s*\d{4})",
-            r"(Criminal\s+Misc\.\s*Application\s+No\.\s*\d+\s*/\s*\d{4})",
-            r"(Special\s+Criminal\s+Application\s+No\.\s*\d+\s*/\s*\d{4})",
-            r"(Bail\s+Application\s+No\.\s*\d+\s*/\s*\d{4})",
-            r"(CR\.?MA?\s*No\.\s*\d+\s*/\s*\d{4})",
-            r"(Sessions\s+Case\s+No\.\s*\d+\s*/\s*\d{4})",
-            r"(FIR\s+No\.\s*[A-Z0-9/-]+)",
-            r"(\d{4}\s*\(\d+\)\s*SCC\s*\d+)",
-            r"(\d{4}\s*\(\d+\)\s*GLR\s*\d+)",
-            r"(AIR\s+\d{4}\s+\w+\s+\d+)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _CASE_NUMBER_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return None
 
-    def _extract_sections(self, text: str) -> list[str]:
+    @staticmethod
+    def _extract_sections(text: str) -> list[str]:
         """Extract IPC/BNS/CrPC/BNSS sections cited in judgment."""
-        sections = set()
-        patterns = [
-            # IPC sections
-            r"[Ss]ection\s+(\d+[A-Z]?)\s+(?:of\s+)?(?:the\s+)?(?:Indian\s+Penal\s+Code|I\.?P\.?C\.?)",
-            r"(?:IPC|I\.P\.C\.?)\s*[Ss](?:ection|ec\.?)\s*(\d+[A-Z]?)",
-            r"[Ss]\.?\s*(\d+[A-Z]?)\s+IPC",
-            # BNS sections
-            r"[Ss]ection\s+(\d+[A-Z]?)\s+(?:of\s+)?(?:the\s+)?(?:Bharatiya\s+Nyaya\s+Sanhita|B\.?N\.?S\.?)",
-            r"(?:BNS|B\.N\.S\.?)\s*[Ss](?:ection|ec\.?)\s*(\d+[A-Z]?)",
-            # CrPC sections
-            r"[Ss]ection\s+(\d+[A-Z]?)\s+(?:of\s+)?(?:the\s+)?(?:Code\s+of\s+Criminal\s+Procedure|Cr\.?P\.?C\.?|CrPC)",
-            # BNSS
-            r"[Ss]ection\s+(\d+[A-Z]?)\s+(?:of\s+)?(?:the\s+)?(?:Bharatiya\s+Nagarik\s+Suraksha\s+Sanhita|B\.?N\.?S\.?S\.?|BNSS)",
-            # NDPS
-            r"[Ss]ection\s+(\d+[A-Z]?)\s+(?:of\s+)?(?:the\s+)?(?:NDPS\s+Act|Narcotic)",
-            # POCSO
-            r"[Ss]ection\s+(\d+[A-Z]?)\s+(?:of\s+)?(?:the\s+)?POCSO",
-            # Arms Act
-            r"[Ss]ection\s+(\d+[A-Z]?)\s+(?:of\s+)?(?:the\s+)?Arms\s+Act",
-        ]
-        for pattern in patterns:
-            for match in re.finditer(pattern, text):
-                section_num = match.group(1)
-                # Reconstruct with context
-                full_match = match.group(0)
-                sections.add(full_match.strip())
-
-        return sorted(list(sections))[:50]  # Cap at 50 sections
-
-    def _extract_parties(self, title: str) -> list[str]:
+        sections = {match.group(1).strip() for match in _SECTION_PATTERN.finditer(text)}
+
+        return heapq.nsmallest(50, sections)  # Cap at 50 sections, without sorting them all
+
+    @staticmethod
+    def _extract_parties(title: str) -> list[str]:
         """Extract party names from case title."""
-        # Common pattern: "X vs Y" or "X v. Y" or "X versus Y"
-        vs_pattern = r"(.+?)\s+(?:vs?\.?|versus)\s+(.+?)(?:\s+on\s+|\s*$)"
-        match = re.search(vs_pattern, title, re.IGNORECASE)
+        match = _PARTIES_PATTERN.search(title)
         if match:
             return [match.group(1).strip(), match.group(2).strip()]
         return []
 
     def _detect_language(self, text: str) -> str:
         """Simple language detection for Indian legal text."""
-        # Check for Gujarati Unicode range (U+0A80 - U+0AFF)
-        gujarati_chars = len(re.findall(r'[\u0A80-\u0AFF]', text))
-        # Check for Hindi/Devanagari Unicode range (U+0900 - U+097F)
-        hindi_chars = len(re.findall(r'[\u0900-\u097F]', text))
         total_chars = len(text)
-
-        if total_chars == 0:
+        if total_chars == 0 or text.isascii():
             return "en"
 
+        gujarati_chars, hindi_chars = script_counts(text)
+
         if gujarati_chars / total_chars > 0.1:
             return "gu"
         elif hindi_chars / total_chars > 0.1:
             return "hi"
         return "en"
 
+    def _fetch_judgment(self, url: str) -> tuple[bool, Optional[dict]]:
+        """Fetch and parse one judgment; returns (fetched, parsed)."""
+        response = self.fetch_page(url)
+        if not response:
+            return False, None
+        return True, self._parse_in_pool(
+            parse_judgment_page, response.content, url, response.encoding
+        )
+
     def scrape_search(
         self,
         query: str,
@@ -373,28 +558,48 @@ class IndianKanoonDataSource(BaseDataSource):
         page = 0
         results_fetched = 0
         max_pages = max_results // 10 + 1
+        url_prefix = self._search_url_prefix(query, court_filter)
 
         while results_fetched < max_results and page < max_pages:
-            url = self._build_search_url(query, page, court_filter)
+            url = self._build_search_url(query, page, court_filter, prefix=url_prefix)
             response = self.fetch_page(url)
             if not response:
                 break
 
-            results = self._parse_search_results(response.text)
+            results = self._parse_search_results(response.content, response.encoding)
             if not results:
                 logger.info(f"No more results for query: {query}, page: {page}")
                 break
 
+            # Judgments are immutable per doc_id, so ones parsed on an earlier
+            # run come from the document cache instead of being re-fetched
+            fresh = []
             for result in results:
+                if results_fetched + len(fresh) >= max_results:
+                    break
+                doc_id = result["doc_id"]
+                if doc_id in self._seen_doc_ids or doc_id in self._yielded_doc_ids:
+                    logger.debug(f"Skipping judgment already scraped: {result['url']}")
+                    continue
+                cached = self._get_cached_document(result["url"])
+                if cached is not None:
+                    self._yielded_doc_ids.add(doc_id)
+                    results_fetched += 1
+                    yield cached
+                else:
+                    fresh.append(result)
+
+            # Fetch and parse the page's judgments concurrently, in result order
+            judgments = self._map_concurrent(
+                lambda r: (r, self._fetch_judgment(r["url"])), fresh
+            )
+            for result, (fetched, parsed) in judgments:
                 if results_fetched >= max_results:
+                    judgments.close()
                     break
 
-                # Fetch full judgment
-                judgment_response = self.fetch_page(result["url"])
-                if not judgment_response:
+                if not fetched:
                     continue
-
-                parsed = self._parse_judgment_page(judgment_response.text, result["url"])
                 if not parsed:
                     logger.warning(f"Failed to parse judgment page: {result['url']}")
                     continue
@@ -427,17 +632,19 @@ class IndianKanoonDataSource(BaseDataSource):
                     },
                 )
 
+                self._cache_document(doc)
+                self._yielded_doc_ids.add(result["doc_id"])
                 results_fetched += 1
                 yield doc
 
             page += 1
             # Save state for resume
             self._state[f"query:{query}:page"] = page
-            self._save_state()
+            self._checkpoint_state()
 
     def scrape(
         self,
-        queries: list[str] = None,
+        queries: Sequence[str] = None,
         court_filter: str = None,
         max_results_per_query: int = 50,
     ) -> Generator[ScrapedDocument, None, None]:
@@ -468,17 +675,23 @@ class IndianKanoonDataSource(BaseDataSource):
             )
 
             self._state[state_key] = True
-            self._save_state()
+            self._checkpoint_state()
 
 
-def create_indian_kanoon_source(output_dir: str = "data/sources/indiankanoon") -> IndianKanoonDataSource:
+def create_indian_kanoon_source(
+    output_dir: str = "data/sources/indiankanoon", redis_url: Optional[str] = None
+) -> IndianKanoonDataSource:
     """Factory function to create an Indian Kanoon data source with default config."""
     config = DataSourceConfig(
         base_url="https://indiankanoon.org",
         output_dir=output_dir,
         delay_seconds=3.0,  # Be respectful to Indian Kanoon servers
-        max_concurrent=1,
+        max_concurrent=1,  # Starting point; AIMD raises it while the server is healthy
+        adaptive_concurrency=True,
+        max_concurrent_ceiling=8,
         max_retries=3,
         timeout=30,
+        parse_processes=min(4, os.cpu_count() or 1),
+        redis_url=redis_url,
     )
     return IndianKanoonDataSource(config)
@@ -20,13 +20,23 @@ from typing import Generator, Optional
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from src.data_sources.base import (
     BaseDataSource, DataSourceConfig, DocumentType, ScrapedDocument, SourceName,
+    element_text, xpath_class,
 )
 
 logger = logging.getLogger(__name__)
 
+# Precompiled XPath for table pages
+_XP_TABLES = etree.XPath("//table")
+_XP_ROWS = etree.XPath(".//tr")
+_XP_CELLS = etree.XPath(".//td | .//th")
+_XP_BODY_FIELD = etree.XPath(f"(//*[{xpath_class('field--name-body')}])[1]")
+_XP_CONTENT = etree.XPath("(//*[@id='content'])[1]")
+
 # NCRB report URLs for recent years
 NCRB_REPORT_URLS = {
     "2022": "https://ncrb.gov.in/crime-in-india-year-2022",
@@ -77,7 +87,7 @@ class NCRBDataSource(BaseDataSource):
         if not response:
             return []
 
-        soup = BeautifulSoup(response.text, "lxml")
+        soup = BeautifulSoup(response.content, "lxml", from_encoding=response.encoding)
         tables = []
 
         # Find links to tables/chapters
@@ -120,24 +130,47 @@ class NCRBDataSource(BaseDataSource):
         if not response:
             return None
 
-        soup = BeautifulSoup(response.text, "lxml")
+        try:
+            parser = lxml_html.HTMLParser(encoding=response.encoding)
+            tree = lxml_html.fromstring(response.content, parser=parser)
+        except (etree.ParserError, LookupError, ValueError):
+            return self._extract_table_text_bs4(response.text)
 
-        # Find data tables
-        tables = soup.select("table")
-        if tables:
-            # Extract Gujarat-specific rows
-            gujarat_data = []
-            for table in tables:
-                for row in table.select("tr"):
-                    row_text = row.get_text(strip=True).lower()
-                    if "gujarat" in row_text or "total" in row_text:
-                        cells = [td.get_text(strip=True) for td in row.select("td, th")]
-                        gujarat_data.append(" | ".join(cells))
+        # Extract Gujarat-specific rows from any data tables
+        gujarat_data = []
+        for table in _XP_TABLES(tree):
+            for row in _XP_ROWS(table):
+                row_text = element_text(row).lower()
+                if "gujarat" in row_text or "total" in row_text:
+                    cells = [element_text(cell) for cell in _XP_CELLS(row)]
+                    gujarat_data.append(" | ".join(cells))
 
-            if gujarat_data:
-                return "\n".join(gujarat_data)
+        if gujarat_data:
+            return "\n".join(gujarat_data)
 
         # Fallback: get all text
+        content = _XP_BODY_FIELD(tree) or _XP_CONTENT(tree)
+        if content:
+            return element_text(content[0], "\n")
+
+        return None
+
+    @staticmethod
+    def _extract_table_text_bs4(html: str) -> Optional[str]:
+        """BeautifulSoup fallback for table pages lxml cannot parse directly."""
+        soup = BeautifulSoup(html, "lxml")
+
+        gujarat_data = []
+        for table in soup.select("table"):
+            for row in table.select("tr"):
+                row_text = row.get_text(strip=True).lower()
+                if "gujarat" in row_text or "total" in row_text:
+                    cells = [td.get_text(strip=True) for td in row.select("td, th")]
+                    gujarat_data.append(" | ".join(cells))
+
+        if gujarat_data:
+            return "\n".join(gujarat_data)
+
         content = soup.select_one(".field--name-body") or soup.select_one("#content")
         if content:
             return content.get_text(separator="\n", strip=True)
@@ -161,8 +194,9 @@ class NCRBDataSource(BaseDataSource):
             logger.info(f"Fetching NCRB data for year {year}")
             tables = self.fetch_report_index(year)
 
-            for table_info in tables:
-                content = self.fetch_table_data(table_info)
+            # Tables are independent pages; fetch them concurrently, in order
+            contents = self._map_concurrent(self.fetch_table_data, tables)
+            for table_info, content in zip(tables, contents):
                 if not content:
                     continue
 
@@ -188,13 +222,16 @@ class NCRBDataSource(BaseDataSource):
             self._save_state()
 
 
-def create_ncrb_source(output_dir: str = "data/sources/ncrb") -> NCRBDataSource:
+def create_ncrb_source(
+    output_dir: str = "data/sources/ncrb", redis_url: Optional[str] = None
+) -> NCRBDataSource:
     config = DataSourceConfig(
         base_url="https://ncrb.gov.in",
         output_dir=output_dir,
         delay_seconds=2.0,
-        max_concurrent=1,
+        max_concurrent=4,
         max_retries=3,
         timeout=60,
+        redis_url=redis_url,
     )
     return NCRBDataSource(config)
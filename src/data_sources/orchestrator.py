@@ -2,7 +2,7 @@
 Data Source Orchestrator
 
 Manages all data sources and provides a unified interface for:
-1. Running all scrapers with proper sequencing
+1. Running all scrapers concurrently (each with its own rate limit)
 2. Progress tracking across sources
 3. Resume capability for interrupted runs
 4. Unified statistics and reporting
@@ -18,6 +18,8 @@ Usage:
 import json
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -33,47 +35,113 @@ from src.data_sources.ncrb import NCRBDataSource, create_ncrb_source
 logger = logging.getLogger(__name__)
 
 
+def _scan_json(root: str) -> tuple[int, int]:
+    """(count, total bytes) of the *.json files under root, in one os.scandir walk."""
+    count = size = 0
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json") and entry.is_file():
+                    count += 1
+                    size += entry.stat().st_size
+    return count, size
+
+
+def _scan_source_dir(path: str) -> tuple[dict, int]:
+    """({type dir: JSON count}, total JSON bytes) for one source output directory."""
+    counts, size = {}, 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                counts[entry.name], type_size = _scan_json(entry.path)
+                size += type_size
+            elif entry.name.endswith(".json") and entry.is_file():
+                size += entry.stat().st_size
+    return counts, size
+
+
 class DataSourceOrchestrator:
     """
     Orchestrates data collection from all verified sources.
     """
 
-    def __init__(self, base_output_dir: str = "data/sources"):
+    def __init__(self, base_output_dir: str = "data/sources", redis_url: Optional[str] = None):
         self.base_output_dir = Path(base_output_dir)
         self.base_output_dir.mkdir(parents=True, exist_ok=True)
+        # Sources keep resume state in Redis only when this is given
+        self.redis_url = redis_url
+        # run_log.json holds the compacted history; runs since then are
+        # appended one JSON line each to run_log.jsonl
         self._run_log_path = self.base_output_dir / "run_log.json"
+        self._run_journal_path = self.base_output_dir / "run_log.jsonl"
         self._run_log = self._load_run_log()
+        self._run_log_lock = threading.Lock()  # run_source may run on several threads
+        # Set on Ctrl-C in run_all; sources on worker threads stop on it
+        self._stop_event = threading.Event()
+        self._completed_sources: set[str] = {
+            r["source"] for r in self._run_log["runs"] if r["status"] == "completed"
+        }
 
     def _load_run_log(self) -> dict:
+        run_log = {"runs": []}
         if self._run_log_path.exists():
             with open(self._run_log_path) as f:
-                return json.load(f)
-        return {"runs": []}
+                run_log = json.load(f)
+
+        if self._run_journal_path.exists():
+            # Skip entries already compacted into run_log.json (a crash can
+            # land between the summary rename and the journal truncation)
+            seen = {(r["source"], r["start_time"]) for r in run_log["runs"]}
+            with open(self._run_journal_path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning("Ignoring truncated run log entry")
+                        continue
+                    if (entry["source"], entry["start_time"]) not in seen:
+                        run_log["runs"].append(entry)
+        return run_log
+
+    def _append_run(self, run_entry: dict):
+        """Record one run durably by appending it to the run journal."""
+        self._run_log["runs"].append(run_entry)
+        with open(self._run_journal_path, "a") as f:
+            f.write(json.dumps(run_entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
 
     def _save_run_log(self):
-        with open(self._run_log_path, "w") as f:
+        """Compact the journal into run_log.json (written atomically), then clear it."""
+        tmp_path = self._run_log_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
             json.dump(self._run_log, f, indent=2)
+        os.replace(tmp_path, self._run_log_path)
+        self._run_journal_path.unlink(missing_ok=True)
 
     def _create_source(self, source_name: str):
         """Factory method to create data source instances."""
         factories = {
             "indian_kanoon": lambda: create_indian_kanoon_source(
-                str(self.base_output_dir / "indiankanoon")
+                str(self.base_output_dir / "indiankanoon"), self.redis_url
             ),
             "ecourts": lambda: create_ecourts_source(
-                str(self.base_output_dir / "ecourts")
+                str(self.base_output_dir / "ecourts"), self.redis_url
             ),
             "gujarat_hc": lambda: create_gujarat_hc_source(
-                str(self.base_output_dir / "gujhc")
+                str(self.base_output_dir / "gujhc"), self.redis_url
             ),
             "supreme_court": lambda: create_supreme_court_source(
-                str(self.base_output_dir / "scr")
+                str(self.base_output_dir / "scr"), self.redis_url
             ),
             "india_code": lambda: create_india_code_source(
-                str(self.base_output_dir / "indiacode")
+                str(self.base_output_dir / "indiacode"), self.redis_url
             ),
             "ncrb": lambda: create_ncrb_source(
-                str(self.base_output_dir / "ncrb")
+                str(self.base_output_dir / "ncrb"), self.redis_url
             ),
         }
         factory = factories.get(source_name)
@@ -87,16 +155,16 @@ class DataSourceOrchestrator:
         logger.info(f"Starting data source: {source_name}")
         logger.info(f"=" * 60)
 
-        source = self._create_source(source_name)
         start_time = datetime.utcnow().isoformat()
 
-        try:
-            stats = source.run(**kwargs)
-            status = "completed"
-        except Exception as e:
-            logger.error(f"Source {source_name} failed: {e}")
-            stats = source.get_stats()
-            status = f"failed: {str(e)}"
+        with self._create_source(source_name) as source:
+            try:
+                stats = source.run(stop_event=self._stop_event, **kwargs)
+                status = "interrupted" if stats.get("interrupted") else "completed"
+            except Exception as e:
+                logger.error(f"Source {source_name} failed: {e}")
+                stats = source.get_stats()
+                status = f"failed: {str(e)}"
 
         run_entry = {
             "source": source_name,
@@ -106,8 +174,10 @@ class DataSourceOrchestrator:
             "stats": stats,
             "kwargs": {k: str(v) for k, v in kwargs.items()},
         }
-        self._run_log["runs"].append(run_entry)
-        self._save_run_log()
+        with self._run_log_lock:
+            self._append_run(run_entry)
+            if status == "completed":
+                self._completed_sources.add(source_name)
 
         return stats
 
@@ -115,9 +185,15 @@ class DataSourceOrchestrator:
         self,
         sources: list[str] = None,
         skip_completed: bool = True,
+        max_parallel: Optional[int] = None,
     ) -> dict:
         """
-        Run all data source scrapers in recommended order.
+        Run all data source scrapers concurrently.
+
+        Each source scrapes an independent site and is rate-limited on its
+        own, so they run side by side (up to max_parallel at once; default
+        all). Sources are started in the recommended order below, which
+        also decides the order when max_parallel limits concurrency.
 
         Recommended order:
         1. India Code (bare acts + section mappings) - fastest, foundational
@@ -137,20 +213,41 @@ class DataSourceOrchestrator:
                 "ncrb",
             ]
 
+        self._stop_event.clear()
         all_stats = {}
+        to_run = []
         for source_name in sources:
-            if skip_completed:
-                # Check if source was completed in a previous run
-                completed_runs = [
-                    r for r in self._run_log.get("runs", [])
-                    if r["source"] == source_name and r["status"] == "completed"
-                ]
-                if completed_runs:
-                    logger.info(f"Skipping {source_name} (completed previously)")
-                    all_stats[source_name] = {"status": "skipped (previously completed)"}
-                    continue
-
-            all_stats[source_name] = self.run_source(source_name)
+            # Check if source was completed in a previous run
+            if skip_completed and source_name in self._completed_sources:
+                logger.info(f"Skipping {source_name} (completed previously)")
+                all_stats[source_name] = {"status": "skipped (previously completed)"}
+                continue
+            all_stats[source_name] = None  # keeps the report in source order
+            to_run.append(source_name)
+
+        if to_run:
+            workers = max(1, min(max_parallel or len(to_run), len(to_run)))
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="source")
+            futures = {name: pool.submit(self.run_source, name) for name in to_run}
+            try:
+                # Poll so the main thread regularly returns to the interpreter
+                # and handles SIGINT even if it was delivered to a worker
+                while wait(futures.values(), timeout=0.5).not_done:
+                    pass
+            except KeyboardInterrupt:
+                # Only the main thread sees Ctrl-C: tell the running sources
+                # to stop and wait for them to save their state
+                logger.warning("Interrupted - stopping sources and saving state")
+                self._stop_event.set()
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+            for source_name, future in futures.items():
+                if future.cancelled():
+                    all_stats[source_name] = {"status": "interrupted (not started)"}
+                else:
+                    all_stats[source_name] = future.result()
+
+        self._save_run_log()
 
         # Generate summary report
         self._generate_report(all_stats)
@@ -170,7 +267,10 @@ class DataSourceOrchestrator:
         for source_name, stats in all_stats.items():
             saved = stats.get("total_saved", 0) if isinstance(stats, dict) else 0
             total_docs += saved
-            status = stats.get("status", "completed") if isinstance(stats, dict) else str(stats)
+            if isinstance(stats, dict):
+                status = stats.get("status", "interrupted" if stats.get("interrupted") else "completed")
+            else:
+                status = str(stats)
             lines.append(f"### {source_name}")
             lines.append(f"- Status: {status}")
             lines.append(f"- Documents saved: {saved}")
@@ -183,11 +283,7 @@ class DataSourceOrchestrator:
         lines.append(f"\n## Total Documents Collected: {total_docs}")
 
         # Disk usage
-        total_size = sum(
-            f.stat().st_size
-            for f in self.base_output_dir.rglob("*.json")
-            if f.is_file()
-        )
+        _, total_size = self._scan_output_dir()
         lines.append(f"## Total Disk Usage: {total_size / (1024*1024):.1f} MB")
 
         with open(report_path, "w") as f:
@@ -195,17 +291,33 @@ class DataSourceOrchestrator:
 
         logger.info(f"Report saved to: {report_path}")
 
+    def _scan_output_dir(self) -> tuple[dict, int]:
+        """
+        Walk the output tree once: per-source, per-type document counts plus
+        the total size of all JSON files.
+
+        Each source directory is scanned on its own thread.
+        """
+        source_dirs, total_size = [], 0
+        with os.scandir(self.base_output_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    source_dirs.append(entry)
+                elif entry.name.endswith(".json") and entry.is_file():
+                    total_size += entry.stat().st_size
+
+        counts = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(source_dirs)))) as pool:
+            scans = pool.map(_scan_source_dir, [entry.path for entry in source_dirs])
+            for entry, (type_counts, size) in zip(source_dirs, scans):
+                total_size += size
+                if not entry.name.startswith("."):
+                    counts[entry.name] = type_counts
+        return counts, total_size
+
     def get_document_counts(self) -> dict:
         """Count documents per source and type."""
-        counts = {}
-        for source_dir in self.base_output_dir.iterdir():
-            if source_dir.is_dir() and not source_dir.name.startswith("."):
-                source_name = source_dir.name
-                counts[source_name] = {}
-                for type_dir in source_dir.iterdir():
-                    if type_dir.is_dir():
-                        doc_count = len(list(type_dir.rglob("*.json")))
-                        counts[source_name][type_dir.name] = doc_count
+        counts, _ = self._scan_output_dir()
         return counts
 
     def validate_data(self) -> dict:
@@ -16,6 +16,8 @@ from typing import Generator, Optional
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from src.data_sources.base import (
     BaseDataSource,
@@ -23,10 +25,24 @@ from src.data_sources.base import (
     DocumentType,
     ScrapedDocument,
     SourceName,
+    element_text,
+    xpath_class,
 )
 
 logger = logging.getLogger(__name__)
 
+# Precompiled XPath for the listing and judgment page parsers
+_XP_TABLE_ROWS = etree.XPath("//table//tbody//tr")
+_XP_LIST_ITEMS = etree.XPath(f"//*[{xpath_class('judgment-list')}]//*[{xpath_class('item')}]")
+_XP_FIRST_LINK = etree.XPath("(.//a[@href])[1]")
+_XP_CELLS = etree.XPath(".//td")
+_XP_JUDGMENT_TEXT = etree.XPath("(//*[@id='judgment-text'])[1]")
+_XP_JUDGMENT_CONTENT = etree.XPath(f"(//*[{xpath_class('judgment-content')}])[1]")
+_XP_PDF_LINK = etree.XPath(
+    "(//a[substring(@href, string-length(@href) - 3) = '.pdf'])[1]"
+)
+_XP_JUDGMENT_LINK = etree.XPath("(//a[contains(@href, 'judgment')])[1]")
+
 # Key SCI criminal law search queries for Gujarat Police corpus
 SCI_QUERIES = [
     # Core criminal procedure
@@ -113,31 +129,59 @@ class SupremeCourtDataSource(BaseDataSource):
         if not response:
             return []
 
-        soup = BeautifulSoup(response.text, "lxml")
-        results = []
-
-        # Parse judgment listing
-        rows = soup.select("table tbody tr") or soup.select(".judgment-list .item")
-        for row in rows:
-            link = row.select_one("a[href]")
-            if not link:
-                continue
-
-            href = link.get("href", "")
-            title = link.get_text(strip=True)
+        try:
+            rows = self._listing_rows_lxml(response.content, response.encoding)
+        except (etree.ParserError, LookupError, ValueError) as e:
+            logger.debug(f"lxml could not parse SCI listing ({e}) - using BeautifulSoup")
+            rows = self._listing_rows_bs4(response.text)
 
-            cols = row.select("td")
-            date_text = cols[1].get_text(strip=True) if len(cols) > 1 else ""
-            bench_text = cols[2].get_text(strip=True) if len(cols) > 2 else ""
-
-            results.append({
+        return [
+            {
                 "title": title,
                 "url": urljoin(self.BASE_URL, href),
                 "date": date_text,
                 "bench": bench_text,
-            })
-
-        return results
+            }
+            for href, title, date_text, bench_text in rows
+        ]
+
+    @staticmethod
+    def _listing_rows_lxml(
+        html: bytes, encoding: Optional[str] = None
+    ) -> list[tuple[str, str, str, str]]:
+        """(href, title, date, bench) per judgment listing row, via lxml XPath."""
+        tree = lxml_html.fromstring(html, parser=lxml_html.HTMLParser(encoding=encoding))
+        rows = []
+        for row in _XP_TABLE_ROWS(tree) or _XP_LIST_ITEMS(tree):
+            link = _XP_FIRST_LINK(row)
+            if not link:
+                continue
+            cols = _XP_CELLS(row)
+            rows.append((
+                link[0].get("href", ""),
+                element_text(link[0]),
+                element_text(cols[1]) if len(cols) > 1 else "",
+                element_text(cols[2]) if len(cols) > 2 else "",
+            ))
+        return rows
+
+    @staticmethod
+    def _listing_rows_bs4(html: str) -> list[tuple[str, str, str, str]]:
+        """BeautifulSoup fallback for listing pages lxml cannot parse directly."""
+        soup = BeautifulSoup(html, "lxml")
+        rows = []
+        for row in soup.select("table tbody tr") or soup.select(".judgment-list .item"):
+            link = row.select_one("a[href]")
+            if not link:
+                continue
+            cols = row.select("td")
+            rows.append((
+                link.get("href", ""),
+                link.get_text(strip=True),
+                cols[1].get_text(strip=True) if len(cols) > 1 else "",
+                cols[2].get_text(strip=True) if len(cols) > 2 else "",
+            ))
+        return rows
 
     def fetch_judgment(self, url: str) -> Optional[dict]:
         """Fetch full judgment text."""
@@ -145,7 +189,30 @@ class SupremeCourtDataSource(BaseDataSource):
         if not response:
             return None
 
-        soup = BeautifulSoup(response.text, "lxml")
+        try:
+            parser = lxml_html.HTMLParser(encoding=response.encoding)
+            tree = lxml_html.fromstring(response.content, parser=parser)
+        except (etree.ParserError, LookupError, ValueError):
+            return self._judgment_bs4(response.text, url)
+
+        content = _XP_JUDGMENT_TEXT(tree) or _XP_JUDGMENT_CONTENT(tree)
+        if not content:
+            # SCI often serves PDFs
+            pdf_link = _XP_PDF_LINK(tree) or _XP_JUDGMENT_LINK(tree)
+            if pdf_link:
+                pdf_url = urljoin(url, pdf_link[0].get("href"))
+                return {"full_text": f"[PDF - {pdf_url}]", "pdf_url": pdf_url}
+            return None
+
+        return {
+            "full_text": element_text(content[0], "\n"),
+            "html_content": lxml_html.tostring(content[0], encoding="unicode", with_tail=False),
+        }
+
+    @staticmethod
+    def _judgment_bs4(html: str, url: str) -> Optional[dict]:
+        """BeautifulSoup fallback for judgment pages lxml cannot parse directly."""
+        soup = BeautifulSoup(html, "lxml")
 
         content = soup.select_one("#judgment-text") or soup.select_one(".judgment-content")
         if not content:
@@ -233,7 +300,9 @@ class SupremeCourtDataSource(BaseDataSource):
             self._save_state()
 
 
-def create_supreme_court_source(output_dir: str = "data/sources/scr") -> SupremeCourtDataSource:
+def create_supreme_court_source(
+    output_dir: str = "data/sources/scr", redis_url: Optional[str] = None
+) -> SupremeCourtDataSource:
     config = DataSourceConfig(
         base_url="https://main.sci.gov.in",
         output_dir=output_dir,
@@ -241,5 +310,6 @@ def create_supreme_court_source(output_dir: str = "data/sources/scr") -> Supreme
         max_concurrent=1,
         max_retries=3,
         timeout=30,
+        redis_url=redis_url,
     )
     return SupremeCourtDataSource(config)
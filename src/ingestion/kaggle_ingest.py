@@ -15,8 +15,13 @@ import os
 import re
 import hashlib
 import logging
+import multiprocessing
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional
 
 import pandas as pd
 
@@ -31,30 +36,45 @@ CHROMA_COLLECTION = "sc_judgments"
 CHUNK_SIZE = 512          # words per chunk
 CHUNK_OVERLAP = 64        # overlapping words
 BATCH_SIZE = 100          # ChromaDB upsert batch size
+CSV_CHUNK_ROWS = 10_000   # rows read per CSV chunk
+TEXT_COLUMN_SAMPLE_ROWS = 1000  # rows sampled when guessing the text column
+ENCODE_BATCH_SIZE = 256   # texts per model forward pass
+ENCODE_BLOCK_SIZE = 2048  # chunks encoded per call, overlapped with the previous block's upserts
 EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+CHUNK_WORKERS = int(os.environ.get("CHUNK_WORKERS", os.cpu_count() or 1))  # chunking processes
 
 
 # ============================================================
 # TEXT CLEANING
 # ============================================================
+_WS_RE = re.compile(r'\s+')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Common boilerplate, each removed at its first occurrence only
+_BOILERPLATE_RES = tuple(re.compile(p) for p in (
+    r'REPORTABLE\s*',
+    r'NON-REPORTABLE\s*',
+    r'IN THE SUPREME COURT OF INDIA\s*',
+    r'CIVIL APPELLATE JURISDICTION\s*',
+    r'CRIMINAL APPELLATE JURISDICTION\s*',
+))
+
+
 def clean_judgment_text(text: str) -> str:
     """Clean and normalize judgment text."""
     if not isinstance(text, str):
         return ""
 
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-
-    # Remove common boilerplate (first occurrence only)
-    boilerplate = [
-        r'REPORTABLE\s*',
-        r'NON-REPORTABLE\s*',
-        r'IN THE SUPREME COURT OF INDIA\s*',
-        r'CIVIL APPELLATE JURISDICTION\s*',
-        r'CRIMINAL APPELLATE JURISDICTION\s*',
-    ]
-    for pattern in boilerplate:
-        text = re.sub(pattern, '', text, count=1)
+    text = _WS_RE.sub(' ', text).strip()
+
+    return remove_boilerplate(text)
+
+
+def remove_boilerplate(text: str) -> str:
+    """Strip common judgment boilerplate from whitespace-normalized text."""
+    for pattern in _BOILERPLATE_RES:
+        text = pattern.sub('', text, count=1)
 
     return text.strip()
 
@@ -62,6 +82,16 @@ def clean_judgment_text(text: str) -> str:
 # ============================================================
 # CHUNKING
 # ============================================================
+def _chunk_id(chunk: str) -> str:
+    """
+    Stable ChromaDB ID for a chunk, from its first 200 characters.
+
+    MD5 is kept (as a non-security digest) so re-ingesting upserts over the
+    IDs already stored rather than duplicating every chunk.
+    """
+    return hashlib.md5(chunk[:200].encode(), usedforsecurity=False).hexdigest()
+
+
 def chunk_text(
     text: str,
     chunk_size: int = CHUNK_SIZE,
@@ -76,10 +106,11 @@ def chunk_text(
         return []
 
     # Split into sentences
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
 
     chunks = []
-    current_sentences: List[str] = []
+    # (sentence, word count) pairs, so trimming the overlap never re-splits
+    current_sentences: deque = deque()
     current_word_count = 0
 
     for sentence in sentences:
@@ -87,8 +118,8 @@ def chunk_text(
 
         if current_word_count + word_count > chunk_size and current_sentences:
             # Save current chunk
-            chunk_text_str = ' '.join(current_sentences)
-            chunk_id = hashlib.md5(chunk_text_str[:200].encode()).hexdigest()
+            chunk_text_str = ' '.join(s for s, _ in current_sentences)
+            chunk_id = _chunk_id(chunk_text_str)
 
             chunks.append({
                 "id": chunk_id,
@@ -99,16 +130,15 @@ def chunk_text(
 
             # Keep overlap: remove oldest sentences until under overlap threshold
             while current_word_count > overlap and current_sentences:
-                removed = current_sentences.pop(0)
-                current_word_count -= len(removed.split())
+                current_word_count -= current_sentences.popleft()[1]
 
-        current_sentences.append(sentence)
+        current_sentences.append((sentence, word_count))
         current_word_count += word_count
 
     # Final chunk
     if current_sentences and current_word_count >= 20:
-        chunk_text_str = ' '.join(current_sentences)
-        chunk_id = hashlib.md5(chunk_text_str[:200].encode()).hexdigest()
+        chunk_text_str = ' '.join(s for s, _ in current_sentences)
+        chunk_id = _chunk_id(chunk_text_str)
         chunks.append({
             "id": chunk_id,
             "text": chunk_text_str,
@@ -119,11 +149,66 @@ def chunk_text(
     return chunks
 
 
+def _chunk_one(task) -> List[Dict]:
+    """chunk_text() for one (text, metadata) pair; top-level so worker processes can run it."""
+    text, metadata = task
+    return chunk_text(text, metadata=metadata)
+
+
+def iter_chunks(tasks: Iterable[tuple]) -> Iterator[Dict]:
+    """
+    Chunk (text, metadata) judgments on CHUNK_WORKERS processes, in order.
+
+    At most a fixed window of judgments is in flight ahead of the consumer, so
+    chunking never runs far ahead of embedding and memory stays bounded.
+    """
+    produced = 0
+
+    if CHUNK_WORKERS <= 1:
+        results = map(_chunk_one, tasks)
+        pool = None
+    else:
+        window = threading.BoundedSemaphore(CHUNK_WORKERS * 64 * 4)
+        stop = threading.Event()
+
+        def throttled():
+            # Runs on the pool's task-handler thread, which terminate() joins,
+            # so it must notice an early stop instead of blocking on the window
+            for task in tasks:
+                while not window.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                if stop.is_set():
+                    return
+                yield task
+
+        pool = multiprocessing.Pool(CHUNK_WORKERS)
+        results = pool.imap(_chunk_one, throttled(), chunksize=64)
+
+    try:
+        for pos, chunks in enumerate(results):
+            if pool:
+                window.release()
+            produced += len(chunks)
+            yield from chunks
+
+            if (pos + 1) % 1000 == 0:
+                logger.info(f"  Chunked {pos + 1} judgments → {produced} chunks")
+    finally:
+        if pool:
+            stop.set()
+            pool.terminate()
+
+
 # ============================================================
 # DATASET LOADING
 # ============================================================
-def load_dataset(data_dir: str = DATA_DIR) -> pd.DataFrame:
-    """Load all CSV files from the Kaggle dataset directory."""
+def iter_dataset(data_dir: str = DATA_DIR) -> Iterator[pd.DataFrame]:
+    """
+    Yield the Kaggle dataset as DataFrames of at most CSV_CHUNK_ROWS rows.
+
+    CSV files are read in chunks, so only one chunk is in memory at a time.
+    """
     data_path = Path(data_dir)
 
     if not data_path.exists():
@@ -134,33 +219,45 @@ def load_dataset(data_dir: str = DATA_DIR) -> pd.DataFrame:
             f"  unzip legal-dataset-sc-judgments-india-19502024.zip -d {data_dir}"
         )
 
-    all_frames = []
-    for f in sorted(data_path.glob("*.csv")):
+    csv_files = sorted(data_path.glob("*.csv"))
+    json_files = sorted(data_path.glob("*.json"))
+    if not csv_files and not json_files:
+        raise FileNotFoundError(f"No CSV/JSON files found in {data_dir}")
+
+    for f in csv_files:
         logger.info(f"Loading {f.name}...")
+        rows = 0
         try:
-            df = pd.read_csv(f, on_bad_lines='skip', low_memory=False)
-            all_frames.append(df)
-            logger.info(f"  → {len(df)} rows, columns: {list(df.columns)}")
+            reader = pd.read_csv(
+                f, on_bad_lines='skip', low_memory=False, chunksize=CSV_CHUNK_ROWS
+            )
+            for df in reader:
+                rows += len(df)
+                yield df
+            logger.info(f"  → {rows} rows")
         except Exception as e:
-            logger.warning(f"  → Failed to load {f.name}: {e}")
+            logger.warning(f"  → Failed to load {f.name} after {rows} rows: {e}")
 
-    # Also check for .txt or .json files
-    for f in sorted(data_path.glob("*.json")):
+    # Also check for .json files
+    for f in json_files:
         logger.info(f"Loading {f.name}...")
         try:
             df = pd.read_json(f, lines=True)
-            all_frames.append(df)
-            logger.info(f"  → {len(df)} rows")
         except Exception:
             try:
                 df = pd.read_json(f)
-                all_frames.append(df)
-                logger.info(f"  → {len(df)} rows")
             except Exception as e:
                 logger.warning(f"  → Failed to load {f.name}: {e}")
+                continue
+        logger.info(f"  → {len(df)} rows")
+        yield df
 
+
+def load_dataset(data_dir: str = DATA_DIR) -> pd.DataFrame:
+    """Load all CSV/JSON files from the Kaggle dataset directory into one DataFrame."""
+    all_frames = list(iter_dataset(data_dir))
     if not all_frames:
-        raise FileNotFoundError(f"No CSV/JSON files found in {data_dir}")
+        raise FileNotFoundError(f"No loadable CSV/JSON files in {data_dir}")
 
     combined = pd.concat(all_frames, ignore_index=True)
     logger.info(f"Total loaded: {len(combined)} judgments")
@@ -183,11 +280,24 @@ def detect_text_column(df: pd.DataFrame) -> str:
     if len(str_cols) == 0:
         raise ValueError(f"No text columns found. Columns: {list(df.columns)}")
 
-    best_col = max(str_cols, key=lambda c: df[c].astype(str).str.len().mean())
+    # A sample of rows is enough to tell the judgment text from short fields
+    sample = df.head(TEXT_COLUMN_SAMPLE_ROWS)
+    best_col = max(str_cols, key=lambda c: sample[c].astype(str).str.len().mean())
     logger.info(f"Auto-detected text column: '{best_col}' (longest avg string)")
     return best_col
 
 
+# Metadata fields: (key, candidate columns in priority order, max length)
+_METADATA_COLUMNS = (
+    ("case_name", ('case_name', 'case_title', 'title', 'Title', 'case', 'Case'), 500),
+    ("petitioner", ('Petitioner', 'petitioner'), 300),
+    ("respondent", ('Respondent', 'respondent'), 300),
+    ("judgment_date", ('date', 'judgment_date', 'decided_on', 'Date', 'judgment_date_str'), 50),
+    ("bench", ('bench', 'judges', 'coram', 'Bench', 'Judge'), 500),
+    ("category", ('category', 'case_type', 'type', 'Category'), 100),
+)
+
+
 def extract_metadata(row: pd.Series, df_columns: List[str]) -> Dict:
     """Extract available metadata from a row."""
     metadata: Dict[str, str] = {
@@ -195,46 +305,65 @@ def extract_metadata(row: pd.Series, df_columns: List[str]) -> Dict:
         "document_type": "supreme_court_judgment",
     }
 
-    # Case name/title
-    for col in ['case_name', 'case_title', 'title', 'Title', 'case', 'Case']:
-        if col in df_columns and pd.notna(row.get(col)):
-            metadata['case_name'] = str(row[col])[:500]
-            break
-
-    # Petitioner / Respondent
-    for col in ['petitioner', 'Petitioner']:
-        if col in df_columns and pd.notna(row.get(col)):
-            metadata['petitioner'] = str(row[col])[:300]
-    for col in ['respondent', 'Respondent']:
-        if col in df_columns and pd.notna(row.get(col)):
-            metadata['respondent'] = str(row[col])[:300]
-
-    # Date
-    for col in ['date', 'judgment_date', 'decided_on', 'Date', 'judgment_date_str']:
-        if col in df_columns and pd.notna(row.get(col)):
-            metadata['judgment_date'] = str(row[col])[:50]
-            break
-
-    # Bench / Judges
-    for col in ['bench', 'judges', 'coram', 'Bench', 'Judge']:
-        if col in df_columns and pd.notna(row.get(col)):
-            metadata['bench'] = str(row[col])[:500]
-            break
-
-    # Category
-    for col in ['category', 'case_type', 'type', 'Category']:
-        if col in df_columns and pd.notna(row.get(col)):
-            metadata['category'] = str(row[col])[:100]
-            break
+    # Each field takes the first candidate column with a value in this row
+    for key, candidates, limit in _METADATA_COLUMNS:
+        for col in candidates:
+            if col in df_columns and pd.notna(row.get(col)):
+                metadata[key] = str(row[col])[:limit]
+                break
 
     return metadata
 
 
+def extract_all_metadata(df: pd.DataFrame) -> List[Dict]:
+    """
+    extract_metadata() for every row of df, resolving columns once.
+
+    Reads whole columns as lists instead of boxing each row into a Series.
+    """
+    fields = []
+    for key, candidates, limit in _METADATA_COLUMNS:
+        present = [
+            (df[col].tolist(), df[col].notna().tolist())
+            for col in candidates if col in df.columns
+        ]
+        if present:
+            fields.append((key, limit, present))
+
+    all_metadata = []
+    for pos in range(len(df)):
+        metadata: Dict[str, str] = {
+            "source": "kaggle_sc_judgments",
+            "document_type": "supreme_court_judgment",
+        }
+        for key, limit, present in fields:
+            for values, notna in present:
+                if notna[pos]:
+                    metadata[key] = str(values[pos])[:limit]
+                    break
+        all_metadata.append(metadata)
+    return all_metadata
+
+
 # ============================================================
 # EMBEDDING + STORAGE
 # ============================================================
-def create_embeddings_and_store(chunks: List[Dict]):
-    """Embed all chunks and upsert into ChromaDB."""
+def _embedding_device() -> str:
+    """'cuda' when a GPU is available to torch, else 'cpu'."""
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def create_embeddings_and_store(chunks: Iterable[Dict]) -> Optional[int]:
+    """
+    Embed chunks and upsert them into ChromaDB, returning how many were stored.
+
+    chunks may be a lazy iterator; it is consumed one block at a time.
+    Returns None when the embedding dependencies are missing.
+    """
     try:
         from sentence_transformers import SentenceTransformer
         import chromadb
@@ -243,10 +372,13 @@ def create_embeddings_and_store(chunks: List[Dict]):
             "Missing dependencies. Install with:\n"
             "  pip install sentence-transformers chromadb --break-system-packages"
         )
-        return
+        return None
 
-    logger.info(f"Loading embedding model: {EMBEDDING_MODEL}")
-    model = SentenceTransformer(EMBEDDING_MODEL)
+    device = _embedding_device()
+    logger.info(f"Loading embedding model: {EMBEDDING_MODEL} on {device}")
+    model = SentenceTransformer(EMBEDDING_MODEL, device=device)
+    if device == "cuda":
+        model.half()  # FP16 forward pass on tensor cores; stored vectors stay float32
 
     logger.info("Connecting to ChromaDB...")
     chroma_path = os.environ.get("CHROMA_PATH", "data/chroma_db")
@@ -256,34 +388,67 @@ def create_embeddings_and_store(chunks: List[Dict]):
         metadata={"description": "Supreme Court Judgments 1950-2024"}
     )
 
-    total = len(chunks)
-    logger.info(f"Embedding and storing {total} chunks in batches of {BATCH_SIZE}...")
-
-    for i in range(0, total, BATCH_SIZE):
-        batch = chunks[i:i + BATCH_SIZE]
-
-        texts = [c["text"] for c in batch]
-        ids = [c["id"] for c in batch]
-        metadatas = [
-            {k: v for k, v in c.items() if k not in ("text", "id", "word_count")}
-            for c in batch
-        ]
-
-        embeddings = model.encode(texts, show_progress_bar=False).tolist()
-
-        collection.upsert(
-            ids=ids,
-            documents=texts,
-            embeddings=embeddings,
-            metadatas=metadatas
-        )
-
-        done = min(i + BATCH_SIZE, total)
-        if done % 500 == 0 or done == total:
-            logger.info(f"  Progress: {done}/{total} chunks ({done*100//total}%)")
-
+    logger.info(
+        f"Embedding chunks in blocks of {ENCODE_BLOCK_SIZE}, "
+        f"storing in batches of {BATCH_SIZE}..."
+    )
+    # Chunk IDs repeat when judgments share their opening text (or appear in
+    # more than one file); only the first such chunk is embedded
+    seen_ids: set = set()
+    skipped_duplicates = 0
+
+    def unique_chunks():
+        nonlocal skipped_duplicates
+        for chunk in chunks:
+            if chunk["id"] in seen_ids:
+                skipped_duplicates += 1
+                continue
+            seen_ids.add(chunk["id"])
+            yield chunk
+
+    chunk_iter = unique_chunks()
+
+    def next_block():
+        block = list(islice(chunk_iter, ENCODE_BLOCK_SIZE))
+        embeddings = model.encode(
+            [c["text"] for c in block],
+            batch_size=ENCODE_BATCH_SIZE,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        ) if block else None
+        return block, embeddings
+
+    # A worker thread pulls and encodes the next block (torch releases the
+    # GIL) while this thread upserts the previous one into ChromaDB
+    total = 0
+    with ThreadPoolExecutor(max_workers=1) as encoder:
+        pending = encoder.submit(next_block)
+        while True:
+            block, embeddings = pending.result()
+            if not block:
+                break
+            pending = encoder.submit(next_block)
+
+            for i in range(0, len(block), BATCH_SIZE):
+                batch = block[i:i + BATCH_SIZE]
+                collection.upsert(
+                    ids=[c["id"] for c in batch],
+                    documents=[c["text"] for c in batch],
+                    embeddings=embeddings[i:i + BATCH_SIZE].tolist(),
+                    metadatas=[
+                        {k: v for k, v in c.items() if k not in ("text", "id", "word_count")}
+                        for c in batch
+                    ],
+                )
+
+            total += len(block)
+            logger.info(f"  Progress: {total} chunks stored")
+
+    if skipped_duplicates:
+        logger.info(f"Skipped {skipped_duplicates} chunks with duplicate IDs")
     logger.info(f"✅ Stored {total} chunks in ChromaDB collection '{CHROMA_COLLECTION}'")
     logger.info(f"   Collection now has {collection.count()} total chunks")
+    return total
 
 
 # ============================================================
@@ -295,47 +460,41 @@ def run():
     logger.info("KAGGLE SC JUDGMENTS INGESTION PIPELINE")
     logger.info("=" * 60)
 
-    # 1. Load dataset
-    df = load_dataset()
-
-    # 2. Detect text column
-    text_col = detect_text_column(df)
-    columns = list(df.columns)
-
-    # 3. Chunk all judgments
-    all_chunks: List[Dict] = []
-    skipped = 0
-
-    for idx, row in df.iterrows():
-        raw_text = str(row.get(text_col, ''))
-        text = clean_judgment_text(raw_text)
-
-        if len(text) < 100:
-            skipped += 1
-            continue
-
-        metadata = extract_metadata(row, columns)
-        chunks = chunk_text(text, metadata=metadata)
-        all_chunks.extend(chunks)
-
-        if (idx + 1) % 1000 == 0:
-            logger.info(
-                f"  Processed {idx + 1}/{len(df)} judgments → "
-                f"{len(all_chunks)} chunks (skipped {skipped})"
-            )
+    stats = {"loaded": 0, "skipped": 0}
+
+    def judgments():
+        """(cleaned text, metadata) per usable judgment, one dataset chunk at a time."""
+        text_cols: Dict[tuple, str] = {}
+        for df in iter_dataset():
+            # Detect the text column once per distinct column layout (i.e. per file)
+            layout = tuple(df.columns)
+            if layout not in text_cols:
+                text_cols[layout] = detect_text_column(df)
+            text_col = text_cols[layout]
+
+            # Clean with batched pandas string ops, then drop short judgments
+            texts = df[text_col].map(str).str.replace(_WS_RE, ' ', regex=True).str.strip()
+            texts = texts.map(remove_boilerplate)
+            keep = texts.str.len() >= 100
+            stats["loaded"] += len(df)
+            stats["skipped"] += int((~keep).sum())
+            yield from zip(texts[keep].tolist(), extract_all_metadata(df[keep]))
+
+    # Load, clean, chunk, embed and store as one stream, a dataset chunk at a time
+    stored = create_embeddings_and_store(iter_chunks(judgments()))
+    if stored is None:
+        return
 
-    logger.info(f"\nChunking complete:")
-    logger.info(f"  Judgments processed: {len(df) - skipped}")
-    logger.info(f"  Judgments skipped (too short): {skipped}")
-    logger.info(f"  Total chunks: {len(all_chunks)}")
+    logger.info(f"\nIngestion summary:")
+    logger.info(f"  Judgments loaded: {stats['loaded']}")
+    logger.info(f"  Judgments processed: {stats['loaded'] - stats['skipped']}")
+    logger.info(f"  Judgments skipped (too short): {stats['skipped']}")
+    logger.info(f"  Total chunks: {stored}")
 
-    if not all_chunks:
+    if not stored:
         logger.error("No chunks generated! Check your data.")
         return
 
-    # 4. Embed and store
-    create_embeddings_and_store(all_chunks)
-
     logger.info("\n" + "=" * 60)
     logger.info("✅ INGESTION COMPLETE")
     logger.info("=" * 60)
@@ -3,31 +3,75 @@ Gujarat Police SLM - OCR Pipeline
 Multilingual OCR for Gujarati, Hindi, English documents.
 """
 
-import json
 import logging
 import os
+import tempfile
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from src.ingestion.utils import dump_json, script_counts
+
 logger = logging.getLogger(__name__)
 
+PDF_PAGE_CHUNK = 10  # pages rasterized per pdf2image call
+TEXT_LAYER_MIN_CHARS = 200  # embedded text needed to skip OCR for a page
+OCR_EXTENSIONS = frozenset({'.pdf', '.png', '.jpg', '.jpeg', '.tiff', '.tif', '.bmp'})
+
+
+def _find_ocr_inputs(root: str, extensions: frozenset) -> list:
+    """Files under root whose lower-cased suffix is in extensions, in one os.scandir walk."""
+    found = []
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    stack.append(entry.path)
+                    continue
+                name = entry.name
+                dot = name.rfind('.')
+                if dot > 0 and name[dot:].lower() in extensions:
+                    found.append(Path(entry.path))
+    return found
+
+
+def _language_from_counts(gu_chars: int, hi_chars: int, total: int) -> str:
+    """Language code for a text of total characters with the given script counts."""
+    if total and gu_chars / total > 0.1:
+        return "gu"
+    if total and hi_chars / total > 0.1:
+        return "hi"
+    return "en"
+
 
 def detect_language(text: str) -> str:
     """Detect language from Unicode character ranges."""
     if not text.strip():
         return "en"
-    gu_chars = sum(1 for c in text if '\u0A80' <= c <= '\u0AFF')
-    hi_chars = sum(1 for c in text if '\u0900' <= c <= '\u097F')
-    total = len(text)
-    if total == 0:
-        return "en"
-    if gu_chars / total > 0.1:
-        return "gu"
-    if hi_chars / total > 0.1:
-        return "hi"
-    return "en"
+    return _language_from_counts(*script_counts(text), len(text))
+
+
+def _split_paragraphs(text: str, confidence: float) -> tuple:
+    """
+    Split OCR text into paragraph dicts and detect the page language.
+    Page counts are the sum of the paragraph counts (the '\n\n' separators and
+    blank paragraphs hold no Indic characters), so the text is scanned once.
+    """
+    paragraphs = []
+    page_gu = page_hi = 0
+    for para_text in text.split('\n\n'):
+        if para_text.strip():
+            gu, hi = script_counts(para_text)
+            page_gu += gu
+            page_hi += hi
+            paragraphs.append({
+                "text": para_text.strip(),
+                "language": _language_from_counts(gu, hi, len(para_text)),
+                "confidence": confidence,
+            })
+    return paragraphs, _language_from_counts(page_gu, page_hi, len(text))
 
 
 class OCRPipeline:
@@ -38,23 +82,36 @@ class OCRPipeline:
         self.confidence_threshold = confidence_threshold
         self._tesseract_available = False
         self._paddle_available = False
+        self._tess_api = None  # persistent tesserocr API, when installed
+        self._paddle_ocr = None
         self._check_engines()
 
     def _check_engines(self):
+        """Detect OCR engines and build each one once for reuse across pages."""
         try:
-            import pytesseract
-            pytesseract.get_tesseract_version()
+            import tesserocr
+            self._tess_api = tesserocr.PyTessBaseAPI(lang=self.languages)
             self._tesseract_available = True
-            logger.info("Tesseract OCR available")
-        except Exception:
-            logger.warning("Tesseract not available - install tesseract-ocr")
+            logger.info("Tesseract OCR available (tesserocr)")
+        except (ImportError, RuntimeError):
+            try:
+                import pytesseract
+                pytesseract.get_tesseract_version()
+                self._tesseract_available = True
+                logger.info("Tesseract OCR available")
+            except Exception:
+                logger.warning("Tesseract not available - install tesseract-ocr")
 
         try:
             from paddleocr import PaddleOCR
+            self._paddle_ocr = PaddleOCR(use_angle_cls=True, lang='en', show_log=False)
             self._paddle_available = True
             logger.info("PaddleOCR available")
         except ImportError:
             logger.warning("PaddleOCR not available - handwritten fallback disabled")
+        except Exception as e:
+            # e.g. model download or paddlepaddle runtime failure
+            logger.warning(f"PaddleOCR failed to initialize ({e}) - handwritten fallback disabled")
 
     def preprocess_image(self, image):
         """Preprocess scanned image for better OCR."""
@@ -78,6 +135,20 @@ class OCRPipeline:
 
     def ocr_page_tesseract(self, image) -> dict:
         """OCR a single page using Tesseract."""
+        if self._tess_api is not None:
+            from PIL import Image
+            if isinstance(image, (str, os.PathLike)):
+                # process_image passes the file path when OpenCV is missing
+                with Image.open(image) as opened:
+                    return self.ocr_page_tesseract(opened)
+            if not isinstance(image, Image.Image):
+                image = Image.fromarray(image)
+            self._tess_api.SetImage(image)
+            words = [(w, c) for w, c in self._tess_api.MapWordConfidences()
+                     if c > 0 and w.strip()]
+            avg_conf = sum(c for _, c in words) / len(words) / 100.0 if words else 0.0
+            return {"text": ' '.join(w for w, _ in words), "confidence": avg_conf}
+
         import pytesseract
         data = pytesseract.image_to_data(image, lang=self.languages, output_type=pytesseract.Output.DICT)
         text_parts = []
@@ -91,11 +162,20 @@ class OCRPipeline:
         avg_conf = sum(confidences) / len(confidences) / 100.0 if confidences else 0.0
         return {"text": full_text, "confidence": avg_conf}
 
-    def ocr_page_paddle(self, image_path: str) -> dict:
-        """OCR using PaddleOCR (fallback for handwritten content)."""
-        from paddleocr import PaddleOCR
-        ocr = PaddleOCR(use_angle_cls=True, lang='en')
-        result = ocr.ocr(image_path, cls=True)
+    @staticmethod
+    def _to_paddle_array(image):
+        """PIL image -> BGR ndarray (the layout PaddleOCR gets from cv2.imread)."""
+        import numpy as np
+        return np.ascontiguousarray(np.asarray(image.convert("RGB"))[:, :, ::-1])
+
+    def ocr_page_paddle(self, image) -> dict:
+        """
+        OCR using PaddleOCR (fallback for handwritten content).
+        Accepts an image path, a BGR ndarray or a PIL image; no temp file is written.
+        """
+        if not isinstance(image, (str, os.PathLike)) and not hasattr(image, "shape"):
+            image = self._to_paddle_array(image)
+        result = self._paddle_ocr.ocr(image, cls=True)
         texts, confidences = [], []
         if result and result[0]:
             for line in result[0]:
@@ -106,54 +186,113 @@ class OCRPipeline:
             "confidence": sum(confidences) / len(confidences) if confidences else 0.0,
         }
 
+    @staticmethod
+    def _text_layer_pages(pdf_path: str) -> Optional[list]:
+        """Embedded text of each page via PyMuPDF, or None when it cannot be read."""
+        try:
+            import fitz  # PyMuPDF
+        except ImportError:
+            return None
+        try:
+            with fitz.open(pdf_path) as doc:
+                return [page.get_text("text") for page in doc]
+        except Exception as e:
+            logger.debug(f"No readable text layer in {pdf_path}: {e}")
+            return None
+
+    @staticmethod
+    def _iter_pdf_pages(pdf_path: str, page_numbers: Optional[list] = None,
+                        chunk_size: int = PDF_PAGE_CHUNK):
+        """
+        Yield (page number, image) one page at a time, for page_numbers (all pages
+        when None). Runs of at most chunk_size consecutive pages are rasterized
+        per pdf2image call into a temp folder, so peak memory stays O(chunk_size).
+        """
+        from pdf2image import convert_from_path, pdfinfo_from_path
+        from PIL import Image
+
+        if page_numbers is None:
+            page_numbers = range(1, pdfinfo_from_path(pdf_path)["Pages"] + 1)
+
+        windows, first, last = [], None, None
+        for n in page_numbers:
+            if first is not None and n == last + 1 and n - first < chunk_size:
+                last = n
+                continue
+            if first is not None:
+                windows.append((first, last))
+            first = last = n
+        if first is not None:
+            windows.append((first, last))
+
+        for first, last in windows:
+            with tempfile.TemporaryDirectory(prefix="ocr_pages_") as tmpdir:
+                paths = convert_from_path(
+                    pdf_path, dpi=300, first_page=first, last_page=last,
+                    output_folder=tmpdir, paths_only=True,
+                )
+                for page_number, path in zip(range(first, last + 1), paths):
+                    with Image.open(path) as image:
+                        image.load()
+                        yield page_number, image
+
+    def _ocr_page(self, image) -> dict:
+        """OCR one page image, falling back to PaddleOCR on low Tesseract confidence."""
+        preprocessed = self.preprocess_image(image)
+
+        if self._tesseract_available:
+            result = self.ocr_page_tesseract(preprocessed)
+        elif self._paddle_available:
+            result = self.ocr_page_paddle(self._to_paddle_array(image))
+        else:
+            result = {"text": "", "confidence": 0.0}
+
+        # Fallback to PaddleOCR if Tesseract confidence is low; the page is
+        # only converted for PaddleOCR when this path is taken
+        if (self._tesseract_available and self._paddle_available
+                and result["confidence"] < self.confidence_threshold):
+            paddle_result = self.ocr_page_paddle(self._to_paddle_array(image))
+            if paddle_result["confidence"] > result["confidence"]:
+                result = paddle_result
+        return result
+
     def process_pdf(self, pdf_path: str) -> dict:
-        """Process a PDF file through OCR."""
+        """
+        Process a PDF file through OCR.
+        Pages with an embedded text layer of at least TEXT_LAYER_MIN_CHARS are
+        taken as-is (confidence 1.0); only the remaining pages are rasterized.
+        """
         doc_id = str(uuid.uuid4())
         pages = []
 
-        try:
-            from pdf2image import convert_from_path
-            images = convert_from_path(pdf_path, dpi=300)
-        except ImportError:
-            logger.error("pdf2image not installed. Run: pip install pdf2image")
-            return {"document_id": doc_id, "error": "pdf2image not available", "pages": []}
-
-        for i, image in enumerate(images):
-            preprocessed = self.preprocess_image(image)
-
-            if self._tesseract_available:
-                result = self.ocr_page_tesseract(preprocessed)
-            elif self._paddle_available:
-                # Save temp image for PaddleOCR
-                temp_path = f"/tmp/ocr_temp_{doc_id}_{i}.png"
-                image.save(temp_path)
-                result = self.ocr_page_paddle(temp_path)
-                os.remove(temp_path)
-            else:
-                result = {"text": "", "confidence": 0.0}
+        results = {}  # page number -> {"text", "confidence"}
+        ocr_pages = None  # None: OCR every page
+        text_layer = self._text_layer_pages(pdf_path)
+        if text_layer is not None:
+            ocr_pages = []
+            for page_number, text in enumerate(text_layer, 1):
+                if len(text.strip()) >= TEXT_LAYER_MIN_CHARS:
+                    results[page_number] = {"text": text, "confidence": 1.0}
+                else:
+                    ocr_pages.append(page_number)
 
-            # Fallback to PaddleOCR if Tesseract confidence is low
-            if result["confidence"] < self.confidence_threshold and self._paddle_available:
-                temp_path = f"/tmp/ocr_temp_{doc_id}_{i}.png"
-                image.save(temp_path)
-                paddle_result = self.ocr_page_paddle(temp_path)
-                os.remove(temp_path)
-                if paddle_result["confidence"] > result["confidence"]:
-                    result = paddle_result
+        if ocr_pages is None or ocr_pages:
+            try:
+                import pdf2image  # noqa: F401
+            except ImportError:
+                logger.error("pdf2image not installed. Run: pip install pdf2image")
+                if not results:
+                    return {"document_id": doc_id, "error": "pdf2image not available", "pages": []}
+            else:
+                for page_number, image in self._iter_pdf_pages(pdf_path, ocr_pages):
+                    results[page_number] = self._ocr_page(image)
 
+        for i in sorted(results):
+            result = results[i]
             # Split into paragraphs and detect language
-            paragraphs = []
-            for para_text in result["text"].split('\n\n'):
-                if para_text.strip():
-                    paragraphs.append({
-                        "text": para_text.strip(),
-                        "language": detect_language(para_text),
-                        "confidence": result["confidence"],
-                    })
-
-            lang_primary = detect_language(result["text"])
+            paragraphs, lang_primary = _split_paragraphs(result["text"], result["confidence"])
             pages.append({
-                "page_number": i + 1,
+                "page_number": i,
                 "confidence": result["confidence"],
                 "language_primary": lang_primary,
                 "paragraphs": paragraphs,
@@ -181,20 +320,13 @@ class OCRPipeline:
         else:
             result = {"text": "", "confidence": 0.0}
 
-        paragraphs = []
-        for para in result["text"].split('\n\n'):
-            if para.strip():
-                paragraphs.append({
-                    "text": para.strip(),
-                    "language": detect_language(para),
-                    "confidence": result["confidence"],
-                })
+        paragraphs, lang_primary = _split_paragraphs(result["text"], result["confidence"])
 
         return {
             "document_id": doc_id,
             "source_file": str(image_path),
             "pages": [{"page_number": 1, "confidence": result["confidence"],
-                       "language_primary": detect_language(result["text"]),
+                       "language_primary": lang_primary,
                        "paragraphs": paragraphs}],
             "overall_confidence": result["confidence"],
             "needs_manual_review": result["confidence"] < self.confidence_threshold,
@@ -207,8 +339,7 @@ class OCRPipeline:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        extensions = {'.pdf', '.png', '.jpg', '.jpeg', '.tiff', '.tif', '.bmp'}
-        files = [f for f in input_path.rglob('*') if f.suffix.lower() in extensions]
+        files = _find_ocr_inputs(str(input_path), OCR_EXTENSIONS)
 
         processed = 0
         errors = 0
@@ -223,8 +354,8 @@ class OCRPipeline:
                 else:
                     result = self.process_image(str(f))
 
-                with open(out_file, 'w', encoding='utf-8') as fh:
-                    json.dump(result, fh, ensure_ascii=False, indent=2)
+                with open(out_file, 'wb') as fh:
+                    fh.write(dump_json(result))
                 processed += 1
                 logger.info(f"Processed: {f.name} (conf: {result['overall_confidence']:.2f})")
             except Exception as e:
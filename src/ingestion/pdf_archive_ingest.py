@@ -14,6 +14,11 @@ import os
 import re
 import hashlib
 import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
@@ -33,32 +38,43 @@ CHUNK_SIZE = 512          # words per chunk
 CHUNK_OVERLAP = 64        # overlapping words
 BATCH_SIZE = 50           # Process N documents before embedding
 EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+ENCODE_BATCH_SIZE = 256   # texts per model.encode forward pass
+EXTRACT_WORKERS = int(os.environ.get("EXTRACT_WORKERS", os.cpu_count() or 1))  # PDF processes
 
 
 # ============================================================
 # TEXT CLEANING
 # ============================================================
+_WS_RE = re.compile(r'\s+')
+_ARTIFACT_RE = re.compile(r'[^\x00-\x7F\u0900-\u097F]+')  # Keep ASCII + Devanagari
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Common boilerplate, each removed at its first occurrence only
+_BOILERPLATE_RES = tuple(re.compile(p) for p in (
+    r'REPORTABLE\s*',
+    r'NON-REPORTABLE\s*',
+    r'IN THE SUPREME COURT OF INDIA\s*',
+    r'CIVIL APPELLATE JURISDICTION\s*',
+    r'CRIMINAL APPELLATE JURISDICTION\s*',
+))
+
+
 def clean_text(text: str) -> str:
     """Clean and normalize OCR'd judgment text."""
     if not text:
         return ""
 
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WS_RE.sub(' ', text).strip()
 
-    # Remove common OCR artifacts
-    text = re.sub(r'[^\x00-\x7F\u0900-\u097F]+', '', text)  # Keep ASCII + Devanagari
+    # Remove common OCR artifacts; pure-ASCII text has none to remove.
+    # Collapse again so "held ☐ that" keeps single spaces for chunk_text.
+    if not text.isascii():
+        text = _WS_RE.sub(' ', _ARTIFACT_RE.sub('', text)).strip()
 
     # Remove boilerplate
-    boilerplate = [
-        r'REPORTABLE\s*',
-        r'NON-REPORTABLE\s*',
-        r'IN THE SUPREME COURT OF INDIA\s*',
-        r'CIVIL APPELLATE JURISDICTION\s*',
-        r'CRIMINAL APPELLATE JURISDICTION\s*',
-    ]
-    for pattern in boilerplate:
-        text = re.sub(pattern, '', text, count=1)
+    for pattern in _BOILERPLATE_RES:
+        text = pattern.sub('', text, count=1)
 
     return text.strip()
 
@@ -66,6 +82,19 @@ def clean_text(text: str) -> str:
 # ============================================================
 # CHUNKING
 # ============================================================
+def _chunk_id(source_file: str, chunk_idx: int, chunk: str) -> str:
+    """
+    Stable ChromaDB ID from source file, chunk index and first 200 characters.
+
+    MD5 is kept (as a non-security digest) so re-ingesting upserts over the
+    IDs already stored rather than duplicating every chunk.
+    """
+    h = hashlib.md5(source_file.encode(), usedforsecurity=False)
+    h.update(f"_{chunk_idx}_".encode())
+    h.update(chunk[:200].encode())
+    return h.hexdigest()
+
+
 def chunk_text(
     text: str,
     chunk_size: int = CHUNK_SIZE,
@@ -75,29 +104,32 @@ def chunk_text(
     """
     Sentence-aware chunking with overlap.
     Returns list of chunk dictionaries with id, text, and metadata.
+    Expects clean_text() output, where words are separated by single spaces.
     """
-    if not text or len(text.split()) < 30:
+    if not text:
         return []
 
     # Split into sentences (handles ., !, ?)
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
+    # Word counts via C-level str.count; exact on single-space-separated text
+    wc = [s.count(' ') + 1 if s else 0 for s in sentences]
+    if sum(wc) < 30:
+        return []
 
     chunks = []
-    current_sentences: List[str] = []
+    start = 0  # current chunk is sentences[start:i]
     current_word_count = 0
 
     # Get source file for unique ID generation
     source_file = metadata.get("file_path", "unknown") if metadata else "unknown"
 
-    for sentence in sentences:
-        word_count = len(sentence.split())
-
+    for i, word_count in enumerate(wc):
         # Create chunk when size limit reached
-        if current_word_count + word_count > chunk_size and current_sentences:
-            chunk_text_str = ' '.join(current_sentences)
+        if current_word_count + word_count > chunk_size and start < i:
+            chunk_text_str = ' '.join(sentences[start:i])
             # Generate unique ID using source file + chunk index + text hash
             chunk_idx = len(chunks)
-            chunk_id = hashlib.md5(f"{source_file}_{chunk_idx}_{chunk_text_str[:200]}".encode()).hexdigest()
+            chunk_id = _chunk_id(source_file, chunk_idx, chunk_text_str)
 
             chunks.append({
                 "id": chunk_id,
@@ -106,20 +138,19 @@ def chunk_text(
                 **(metadata or {})
             })
 
-            # Keep overlap: remove oldest sentences
-            while current_word_count > overlap and current_sentences:
-                removed = current_sentences.pop(0)
-                current_word_count -= len(removed.split())
+            # Keep overlap: drop oldest sentences
+            while current_word_count > overlap and start < i:
+                current_word_count -= wc[start]
+                start += 1
 
-        current_sentences.append(sentence)
         current_word_count += word_count
 
     # Final chunk
-    if current_sentences and current_word_count >= 20:
-        chunk_text_str = ' '.join(current_sentences)
+    if start < len(sentences) and current_word_count >= 20:
+        chunk_text_str = ' '.join(sentences[start:])
         # Generate unique ID using source file + chunk index + text hash
         chunk_idx = len(chunks)
-        chunk_id = hashlib.md5(f"{source_file}_{chunk_idx}_{chunk_text_str[:200]}".encode()).hexdigest()
+        chunk_id = _chunk_id(source_file, chunk_idx, chunk_text_str)
         chunks.append({
             "id": chunk_id,
             "text": chunk_text_str,
@@ -138,13 +169,15 @@ def extract_text_from_pdf(pdf_path: Path) -> str:
     try:
         import fitz  # PyMuPDF
 
-        doc = fitz.open(str(pdf_path))
-        text_parts = []
+        # Plain text stream only: no ligature preservation, no reading-order sort
+        flags = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES
+        with fitz.open(str(pdf_path)) as doc:
+            text_parts = [page.get_text("text", flags=flags, sort=False) for page in doc]
 
-        for page in doc:
-            text_parts.append(page.get_text())
+        # Scanned PDFs have (almost) no text layer; nothing to clean
+        if sum(len(p) for p in text_parts) < 200:
+            return ""
 
-        doc.close()
         full_text = "\n".join(text_parts)
         return clean_text(full_text)
 
@@ -153,6 +186,20 @@ def extract_text_from_pdf(pdf_path: Path) -> str:
         return ""
 
 
+def find_pdfs(root: Path) -> List[Path]:
+    """Sorted *.pdf files under root, any suffix case, in one os.scandir walk."""
+    found = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    stack.append(entry.path)
+                elif entry.name[-4:].lower() == ".pdf" and len(entry.name) > 4:
+                    found.append(Path(entry.path))
+    return sorted(found)
+
+
 def extract_metadata_from_path(pdf_path: Path) -> Dict:
     """Extract metadata from file path structure."""
     year = pdf_path.parent.name  # Folder name is year
@@ -182,17 +229,60 @@ def extract_metadata_from_path(pdf_path: Path) -> Dict:
     }
 
 
+def _extract_and_chunk(pdf_path: Path) -> Optional[List[Dict]]:
+    """
+    Extract and chunk one PDF; runs in a worker process.
+    Returns None when the PDF is too short or extraction failed; errors are
+    caught here so one bad file cannot end the ordered result stream.
+    """
+    try:
+        metadata = extract_metadata_from_path(pdf_path)
+        text = extract_text_from_pdf(pdf_path)
+        if not text or len(text.split()) < 50:
+            return None
+        return chunk_text(text, metadata=metadata)
+    except Exception as e:
+        logger.error(f"  ❌ Error in {pdf_path.name}: {e}")
+        return None
+
+
 # ============================================================
 # EMBEDDING + STORAGE
 # ============================================================
+@lru_cache(maxsize=1)
+def _get_model():
+    """Load the embedding model once; it stays resident across batches."""
+    from sentence_transformers import SentenceTransformer
+    try:
+        import torch
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+    except ImportError:
+        device = "cpu"
+    model = SentenceTransformer(EMBEDDING_MODEL, device=device)
+    if device == "cuda":
+        model.half()  # FP16 forward pass on tensor cores; stored vectors stay float32
+    return model
+
+
+@lru_cache(maxsize=1)
+def _get_collection():
+    """Open the ChromaDB collection once and reuse it across batches."""
+    import chromadb
+    client = chromadb.PersistentClient(path="data/chroma")
+    return client.get_or_create_collection(
+        name=CHROMA_COLLECTION,
+        metadata={"description": "Supreme Court judgments from PDF archive"}
+    )
+
+
 def embed_and_store(chunks: List[Dict]):
     """Embed chunks and upsert into ChromaDB."""
     if not chunks:
         return
 
     try:
-        from sentence_transformers import SentenceTransformer
-        import chromadb
+        model = _get_model()
+        collection = _get_collection()
     except ImportError:
         logger.error(
             "Missing dependencies. Install with:\n"
@@ -202,36 +292,33 @@ def embed_and_store(chunks: List[Dict]):
 
     logger.info(f"Embedding {len(chunks)} chunks...")
 
-    # Load model (will cache after first load)
-    model = SentenceTransformer(EMBEDDING_MODEL)
-
-    # Get ChromaDB collection
-    client = chromadb.PersistentClient(path="data/chroma")
-    collection = client.get_or_create_collection(
-        name=CHROMA_COLLECTION,
-        metadata={"description": "Supreme Court judgments from PDF archive"}
-    )
-
-    # Prepare data
-    texts = [c["text"] for c in chunks]
-    ids = [c["id"] for c in chunks]
-    metadatas = [{k: v for k, v in c.items() if k not in ("id", "text", "word_count")}
-                 for c in chunks]
-
-    # Embed
-    embeddings = model.encode(texts, batch_size=32, show_progress_bar=False)
-
-    # Store in batches
-    batch_size = 100
-    for i in range(0, len(chunks), batch_size):
-        end = min(i + batch_size, len(chunks))
-        collection.upsert(
-            ids=ids[i:end],
-            documents=texts[i:end],
-            embeddings=embeddings[i:end].tolist(),
-            metadatas=metadatas[i:end]
+    def encode(start: int):
+        texts = [c["text"] for c in chunks[start:start + ENCODE_BATCH_SIZE]]
+        return texts, model.encode(
+            texts,
+            batch_size=ENCODE_BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
         )
 
+    # Encode and upsert one ENCODE_BATCH_SIZE slice at a time; a worker thread
+    # encodes the next slice (torch releases the GIL) while this one is stored
+    with ThreadPoolExecutor(max_workers=1) as encoder:
+        pending = encoder.submit(encode, 0)
+        for i in range(0, len(chunks), ENCODE_BATCH_SIZE):
+            texts, embeddings = pending.result()
+            if i + ENCODE_BATCH_SIZE < len(chunks):
+                pending = encoder.submit(encode, i + ENCODE_BATCH_SIZE)
+            batch = chunks[i:i + ENCODE_BATCH_SIZE]
+            collection.upsert(
+                ids=[c["id"] for c in batch],
+                documents=texts,
+                embeddings=embeddings.tolist(),
+                metadatas=[{k: v for k, v in c.items() if k not in ("id", "text", "word_count")}
+                           for c in batch]
+            )
+
     logger.info(f"✅ Stored {len(chunks)} chunks in ChromaDB")
 
 
@@ -250,10 +337,8 @@ def run_full_ingestion():
         logger.error(f"Archive path not found: {ARCHIVE_PATH}")
         return
 
-    # Use set to avoid duplicates on Windows (case-insensitive filesystem)
-    pdf_files = sorted(set(
-        list(archive_path.rglob("*.PDF")) + list(archive_path.rglob("*.pdf"))
-    ))
+    # One case-insensitive walk, so no duplicates on case-insensitive filesystems
+    pdf_files = find_pdfs(archive_path)
     total_pdfs = len(pdf_files)
     logger.info(f"Found {total_pdfs} PDF files")
 
@@ -271,47 +356,63 @@ def run_full_ingestion():
     skipped = 0
     start_time = datetime.now()
 
-    for idx, pdf_path in enumerate(pdf_files, 1):
-        try:
-            # Extract metadata
-            metadata = extract_metadata_from_path(pdf_path)
-
-            # OCR
-            logger.info(f"[{idx}/{total_pdfs}] Processing: {pdf_path.name}")
-            text = extract_text_from_pdf(pdf_path)
-
-            if not text or len(text.split()) < 50:
-                logger.warning(f"  ⏭️  Skipping (too short or OCR failed)")
+    # Extraction + chunking fan out over EXTRACT_WORKERS processes; results come
+    # back in order and embedding stays in this process with one warm model.
+    # Only a fixed window of PDFs is in flight, so extracted chunks never pile
+    # up in this process while embedding is the slower side.
+    executor = ProcessPoolExecutor(max_workers=EXTRACT_WORKERS)
+    upcoming = iter(pdf_files)
+    window = deque(
+        executor.submit(_extract_and_chunk, pdf) for pdf in islice(upcoming, EXTRACT_WORKERS * 4)
+    )
+    try:
+        for idx, pdf_path in enumerate(pdf_files, 1):
+            try:
+                logger.info(f"[{idx}/{total_pdfs}] Processing: {pdf_path.name}")
+                future = window.popleft()
+                next_pdf = next(upcoming, None)
+                if next_pdf is not None:
+                    window.append(executor.submit(_extract_and_chunk, next_pdf))
+                chunks = future.result()
+
+                if chunks is None:
+                    logger.warning(f"  ⏭️  Skipping (too short or OCR failed)")
+                    skipped += 1
+                    continue
+
+                all_chunks.extend(chunks)
+                processed += 1
+
+                logger.info(f"  ✅ {len(chunks)} chunks | {len(all_chunks)} total queued")
+
+                # Batch embed every N documents
+                if len(all_chunks) >= BATCH_SIZE * 10:
+                    embed_and_store(all_chunks)
+                    all_chunks = []
+
+            except KeyboardInterrupt:
+                logger.info("\n\n⚠️  Interrupted by user. Saving progress...")
+                break
+            except BrokenProcessPool as e:
+                # A worker died (e.g. a crash inside the PDF library); no later
+                # result can arrive, so stop instead of failing every file
+                logger.error(f"  ❌ Extraction pool failed at {pdf_path.name}: {e}")
+                skipped += total_pdfs - idx + 1
+                break
+            except Exception as e:
+                logger.error(f"  ❌ Error: {e}")
                 skipped += 1
-                continue
-
-            # Chunk
-            chunks = chunk_text(text, metadata=metadata)
-            all_chunks.extend(chunks)
-            processed += 1
-
-            logger.info(f"  ✅ {len(chunks)} chunks | {len(all_chunks)} total queued")
-
-            # Batch embed every N documents
-            if len(all_chunks) >= BATCH_SIZE * 10:
-                embed_and_store(all_chunks)
-                all_chunks = []
-
-        except KeyboardInterrupt:
-            logger.info("\n\n⚠️  Interrupted by user. Saving progress...")
-            break
-        except Exception as e:
-            logger.error(f"  ❌ Error: {e}")
-            skipped += 1
-
-        # Progress update every 100 files
-        if idx % 100 == 0:
-            elapsed = (datetime.now() - start_time).total_seconds()
-            rate = elapsed / idx
-            remaining = (total_pdfs - idx) * rate
-            logger.info(f"\n📊 Progress: {idx}/{total_pdfs} | "
-                       f"ETA: {remaining/3600:.1f}h | "
-                       f"Rate: {rate:.1f}s/PDF\n")
+
+            # Progress update every 100 files
+            if idx % 100 == 0:
+                elapsed = (datetime.now() - start_time).total_seconds()
+                rate = elapsed / idx
+                remaining = (total_pdfs - idx) * rate
+                logger.info(f"\n📊 Progress: {idx}/{total_pdfs} | "
+                           f"ETA: {remaining/3600:.1f}h | "
+                           f"Rate: {rate:.1f}s/PDF\n")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
     # Final batch
     if all_chunks:
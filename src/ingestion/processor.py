@@ -16,6 +16,7 @@ from typing import Optional, Dict, List
 from dataclasses import dataclass
 
 from src.ingestion.section_normalizer import SectionNormalizer
+from src.ingestion.utils import dump_json, script_counts
 from src.data_sources.base import ScrapedDocument, DocumentType, SourceName
 
 logger = logging.getLogger(__name__)
@@ -206,9 +207,10 @@ class DocumentProcessor:
         # Gujarati: 0A80–0AFF
 
         sample = text[:1000]  # Check first 1000 chars
+        if sample.isascii():
+            return "en"
 
-        devanagari_count = sum(1 for c in sample if '\u0900' <= c <= '\u097F')
-        gujarati_count = sum(1 for c in sample if '\u0A80' <= c <= '\u0AFF')
+        gujarati_count, devanagari_count = script_counts(sample)
 
         if gujarati_count > 10:
             return "gu"
@@ -245,8 +247,8 @@ class DocumentProcessor:
         filepath = subdir / filename
 
         # Save
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(doc, f, ensure_ascii=False, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(dump_json(doc))
 
     def _print_stats(self):
         """Print processing statistics."""
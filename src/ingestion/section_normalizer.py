@@ -6,11 +6,85 @@ Handles all common formats: "sec. 302", "Section 302", "s.302", "IPC 302", "u/s
 import json
 import re
 import logging
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Every SECTION_PATTERNS entry needs one of these code names; texts without
+# any are skipped with this single scan instead of one pass per pattern
+_CODE_HINT_RE = re.compile(
+    r'IPC|I\.?P\.?C|BNS|B\.?N\.?S|Cr\.?P\.?C|IEA|BSA|NDPS|POCSO', re.IGNORECASE
+)
+# Lower-case literals covering every _CODE_HINT_RE spelling; plain substring
+# tests reject ASCII text faster than the regex
+_CODE_HINT_LITERALS = (
+    "ipc", "i.p", "ip.c", "bns", "b.n", "bn.s", "crpc", "cr.p", "crp.c",
+    "iea", "bsa", "ndps", "pocso",
+)
+
+# Upper-cased, dot-free code name variants -> canonical code name
+_CODE_ALIASES = {
+    "IPC": "IPC", "INDPENALCODE": "IPC",
+    "BNS": "BNS", "BHARATIYANYAYASANHITA": "BNS",
+    "CRPC": "CrPC", "CODEOFCRIMINALPROCEDURE": "CrPC",
+    "BNSS": "BNSS",
+    "IEA": "IEA", "INDIANEVIDENCEACT": "IEA",
+    "BSA": "BSA",
+    "NDPS": "NDPS", "POCSO": "POCSO",
+}
+
+# Hardcoded fallback for the most common IPC→BNS mappings
+_FALLBACK_IPC_TO_BNS = {
+    "302": "103", "304": "105", "304A": "106", "304B": "80",
+    "306": "108", "307": "109", "323": "115(2)", "324": "118(1)",
+    "325": "117(2)", "326": "118(2)", "326A": "124", "354": "74",
+    "354A": "75", "363": "137(2)", "364A": "140(2)", "375": "63",
+    "376": "64", "376D": "70", "378": "303", "379": "303(2)",
+    "380": "305(a)", "392": "309(2)", "395": "310(2)", "396": "310(3)",
+    "403": "316", "406": "316(2)", "409": "316(5)", "415": "318",
+    "420": "318(4)", "441": "329", "447": "329(2)", "448": "330(2)",
+    "463": "336", "465": "336(2)", "468": "340", "498A": "85",
+    "499": "356", "503": "351", "506": "351(2)(3)", "107": "45",
+    "109": "48", "114": "52", "120B": "61(2)", "141": "189",
+    "147": "190(2)", "148": "190(3)", "149": "191", "153A": "196",
+    "299": "100", "300": "101", "309": "None", "511": "62",
+}
+
+
+@lru_cache(maxsize=None)
+def _load_tables(configs_dir: str) -> dict:
+    """
+    Load the forward mapping files under configs_dir and build their reverse maps.
+    Cached per directory, so every SectionNormalizer in a process shares one read-only copy.
+    """
+    mapping_files = {
+        "ipc_to_bns_mapping.json": ("ipc_to_bns", "bns_to_ipc"),
+        "crpc_to_bnss_mapping.json": ("crpc_to_bnss", "bnss_to_crpc"),
+        "iea_to_bsa_mapping.json": ("iea_to_bsa", "bsa_to_iea"),
+    }
+
+    tables = {}
+    for filename, (forward_attr, reverse_attr) in mapping_files.items():
+        filepath = Path(configs_dir) / filename
+        if filepath.exists():
+            with open(filepath, 'r') as f:
+                forward = json.load(f)
+            reverse = {v: k for k, v in forward.items() if v and v != "None"}
+            logger.info(f"Loaded {len(forward)} mappings from {filename}")
+        else:
+            logger.warning(f"Mapping file not found: {filepath}")
+            forward, reverse = {}, {}
+            # Use hardcoded fallback for critical mappings
+            if "ipc_to_bns" in forward_attr:
+                forward = _FALLBACK_IPC_TO_BNS
+                reverse = {v: k for k, v in forward.items() if v != "None"}
+        tables[forward_attr] = MappingProxyType(forward)
+        tables[reverse_attr] = MappingProxyType(reverse)
+    return tables
+
 
 class SectionNormalizer:
     """Normalize and convert section references between old and new criminal codes."""
@@ -24,48 +98,20 @@ class SectionNormalizer:
         self.iea_to_bsa = {}
         self.bsa_to_iea = {}
         self._load_mappings()
-
-    def _load_mappings(self):
-        """Load mapping files from configs directory."""
-        mapping_files = {
-            "ipc_to_bns_mapping.json": ("ipc_to_bns", "bns_to_ipc"),
-            "crpc_to_bnss_mapping.json": ("crpc_to_bnss", "bnss_to_crpc"),
-            "iea_to_bsa_mapping.json": ("iea_to_bsa", "bsa_to_iea"),
+        # code -> (equivalent code, mapping), built once for convert()
+        self._conversions = {
+            "IPC": ("BNS", self.ipc_to_bns),
+            "BNS": ("IPC", self.bns_to_ipc),
+            "CrPC": ("BNSS", self.crpc_to_bnss),
+            "BNSS": ("CrPC", self.bnss_to_crpc),
+            "IEA": ("BSA", self.iea_to_bsa),
+            "BSA": ("IEA", self.bsa_to_iea),
         }
 
-        for filename, (forward_attr, reverse_attr) in mapping_files.items():
-            filepath = self.configs_dir / filename
-            if filepath.exists():
-                with open(filepath, 'r') as f:
-                    forward = json.load(f)
-                    setattr(self, forward_attr, forward)
-                    reverse = {v: k for k, v in forward.items() if v and v != "None"}
-                    setattr(self, reverse_attr, reverse)
-                logger.info(f"Loaded {len(forward)} mappings from {filename}")
-            else:
-                logger.warning(f"Mapping file not found: {filepath}")
-                # Use hardcoded fallback for critical mappings
-                if "ipc_to_bns" in forward_attr:
-                    self._load_hardcoded_ipc_bns()
-
-    def _load_hardcoded_ipc_bns(self):
-        """Hardcoded fallback for most common IPC→BNS mappings."""
-        self.ipc_to_bns = {
-            "302": "103", "304": "105", "304A": "106", "304B": "80",
-            "306": "108", "307": "109", "323": "115(2)", "324": "118(1)",
-            "325": "117(2)", "326": "118(2)", "326A": "124", "354": "74",
-            "354A": "75", "363": "137(2)", "364A": "140(2)", "375": "63",
-            "376": "64", "376D": "70", "378": "303", "379": "303(2)",
-            "380": "305(a)", "392": "309(2)", "395": "310(2)", "396": "310(3)",
-            "403": "316", "406": "316(2)", "409": "316(5)", "415": "318",
-            "420": "318(4)", "441": "329", "447": "329(2)", "448": "330(2)",
-            "463": "336", "465": "336(2)", "468": "340", "498A": "85",
-            "499": "356", "503": "351", "506": "351(2)(3)", "107": "45",
-            "109": "48", "114": "52", "120B": "61(2)", "141": "189",
-            "147": "190(2)", "148": "190(3)", "149": "191", "153A": "196",
-            "299": "100", "300": "101", "309": "None", "511": "62",
-        }
-        self.bns_to_ipc = {v: k for k, v in self.ipc_to_bns.items() if v != "None"}
+    def _load_mappings(self):
+        """Bind the (process-wide, read-only) mapping tables for configs_dir."""
+        for attr, table in _load_tables(str(self.configs_dir.resolve())).items():
+            setattr(self, attr, table)
 
     SECTION_PATTERNS = [
         # "Section 302 of IPC" / "Section 302 IPC"
@@ -79,14 +125,21 @@ class SectionNormalizer:
         # "302 IPC"
         r'(\d+[A-Z]?)\s+(IPC|I\.?P\.?C\.?|BNS)',
     ]
+    _COMPILED_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in SECTION_PATTERNS)
 
     def parse_section_reference(self, text: str) -> list[dict]:
         """Parse section references from text, return structured output."""
         results = []
         seen = set()
-
-        for pattern in self.SECTION_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        if text.isascii():
+            lowered = text.lower()
+            if not any(token in lowered for token in _CODE_HINT_LITERALS):
+                return results
+        if not _CODE_HINT_RE.search(text):
+            return results
+
+        for pattern in self._COMPILED_PATTERNS:
+            for match in pattern.finditer(text):
                 groups = match.groups()
                 # Determine which group is section and which is code
                 if groups[0].isdigit() or (groups[0] and groups[0][0].isdigit()):
@@ -114,35 +167,17 @@ class SectionNormalizer:
 
     def _normalize_code_name(self, code: str) -> str:
         """Normalize code name variations."""
-        code_upper = re.sub(r'\.', '', code).upper().strip()
-        mapping = {
-            "IPC": "IPC", "INDPENALCODE": "IPC",
-            "BNS": "BNS", "BHARATIYANYAYASANHITA": "BNS",
-            "CRPC": "CrPC", "CODEOFCRIMINALPROCEDURE": "CrPC",
-            "BNSS": "BNSS",
-            "IEA": "IEA", "INDIANEVIDENCEACT": "IEA",
-            "BSA": "BSA",
-            "NDPS": "NDPS", "POCSO": "POCSO",
-        }
-        return mapping.get(code_upper, code_upper)
+        code_upper = code.replace('.', '').upper().strip()
+        return _CODE_ALIASES.get(code_upper, code_upper)
 
     def convert(self, section: str, from_code: str) -> Optional[dict]:
         """Convert a section to its equivalent in the other code system."""
         from_code = self._normalize_code_name(from_code)
 
-        conversions = {
-            "IPC": ("BNS", self.ipc_to_bns),
-            "BNS": ("IPC", self.bns_to_ipc),
-            "CrPC": ("BNSS", self.crpc_to_bnss),
-            "BNSS": ("CrPC", self.bnss_to_crpc),
-            "IEA": ("BSA", self.iea_to_bsa),
-            "BSA": ("IEA", self.bsa_to_iea),
-        }
-
-        if from_code not in conversions:
+        to_code, mapping = self._conversions.get(from_code, (None, None))
+        if mapping is None:
             return None
 
-        to_code, mapping = conversions[from_code]
         equivalent_section = mapping.get(section)
 
         if equivalent_section and equivalent_section != "None":
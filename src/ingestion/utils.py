@@ -0,0 +1,37 @@
+"""
+Shared text helpers for the scrapers and ingestion pipelines.
+
+Kept free of project imports so both src.data_sources and src.ingestion
+can use it.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON serialization
+    orjson = None
+
+# str.translate table folding the Gujarati (U+0A80 - U+0AFF) and Devanagari
+# (U+0900 - U+097F) blocks onto one marker each, so a single translate pass plus
+# two C-level str.count calls yields both counts; literal markers are dropped
+_SCRIPT_TABLE = str.maketrans(
+    {**dict.fromkeys(range(0x0A80, 0x0B00), "\x01"),
+     **dict.fromkeys(range(0x0900, 0x0980), "\x02"),
+     0x01: None, 0x02: None}
+)
+
+
+def script_counts(text: str) -> tuple:
+    """(Gujarati, Devanagari) character counts of text."""
+    if text.isascii():
+        return 0, 0  # No Indic characters at all
+    marked = text.translate(_SCRIPT_TABLE)
+    return marked.count("\x01"), marked.count("\x02")
+
+
+def dump_json(doc) -> bytes:
+    """Serialize a document as indented UTF-8 JSON (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(doc, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(doc, ensure_ascii=False, indent=2).encode("utf-8")
@@ -8,14 +8,34 @@ Supports:
 """
 
 import os
+import json
+import hashlib
 import logging
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterator, Optional
 from dataclasses import dataclass
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import anthropic
+except ImportError:  # Optional: only the development Claude backend needs it
+    anthropic = None
 
 logger = logging.getLogger(__name__)
 
+RESPONSE_CACHE_SIZE = 1024        # most recent (prompt, params) -> response pairs kept
+CACHE_MAX_TEMPERATURE = 0.2       # only near-deterministic generations are cached
+HEALTH_CHECK_TTL = 30.0           # seconds a backend health result is reused
+
+# (backend, base_url) -> (monotonic time, healthy), shared by every client
+_HEALTH_CACHE: dict = {}
+
 
 @dataclass
 class LLMConfig:
@@ -50,6 +70,16 @@ class LLMClient:
         self.model_name = model_name
         self.timeout = timeout
 
+        # One keep-alive pool reused by every generate/health call, so the
+        # llama.cpp/Ollama server connection is not re-opened per request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._anthropic_client = None  # created on first Claude call, then reused
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+
         logger.info(f"Initializing LLM client with backend: {backend}")
 
         # Validate backend-specific requirements
@@ -66,7 +96,8 @@ class LLMClient:
         prompt: str,
         max_tokens: int = 2048,
         temperature: float = 0.1,
-        stop_sequences: Optional[list] = None
+        stop_sequences: Optional[list] = None,
+        use_cache: bool = True
     ) -> str:
         """
         Generate text from prompt.
@@ -76,18 +107,142 @@ class LLMClient:
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (0.0 = deterministic)
             stop_sequences: Optional list of stop sequences
+            use_cache: Reuse the response to an identical earlier call when
+                temperature <= CACHE_MAX_TEMPERATURE
 
         Returns:
             Generated text
         """
+        key = None
+        if use_cache and temperature <= CACHE_MAX_TEMPERATURE:
+            key = (
+                self.backend, self.base_url, self.model_name,
+                hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest(),
+                max_tokens, round(temperature, 3), tuple(stop_sequences or ()),
+            )
+            with self._cache_lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    logger.debug(f"Response cache hit for {self.backend}")
+                    return cached
+
         logger.debug(f"Generating with {self.backend}: prompt_len={len(prompt)}, max_tokens={max_tokens}")
 
         if self.backend == "llamacpp":
-            return self._llamacpp_generate(prompt, max_tokens, temperature, stop_sequences)
+            text = self._llamacpp_generate(prompt, max_tokens, temperature, stop_sequences)
         elif self.backend == "ollama":
-            return self._ollama_generate(prompt, max_tokens, temperature, stop_sequences)
+            text = self._ollama_generate(prompt, max_tokens, temperature, stop_sequences)
         elif self.backend == "claude":
-            return self._claude_generate(prompt, max_tokens, temperature, stop_sequences)
+            text = self._claude_generate(prompt, max_tokens, temperature, stop_sequences)
+        else:
+            raise ValueError(f"Unknown backend: {self.backend}")
+
+        if key is not None:
+            with self._cache_lock:
+                self._cache[key] = text
+                self._cache.move_to_end(key)
+                if len(self._cache) > RESPONSE_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        return text
+
+    def generate_batch(
+        self,
+        prompts: list,
+        max_tokens: int = 2048,
+        temperature: float = 0.1,
+        stop_sequences: Optional[list] = None,
+        concurrency: int = 8
+    ) -> list:
+        """
+        Generate for several prompts concurrently, returning results in prompt order.
+
+        Requests run on up to `concurrency` threads sharing the pooled session
+        (or the Anthropic client), so wall time is bounded by backend
+        parallelism instead of the sum of round-trips.
+        """
+        if not prompts:
+            return []
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(prompts))) as pool:
+            return list(pool.map(
+                lambda p: self.generate(p, max_tokens, temperature, stop_sequences),
+                prompts,
+            ))
+
+    def generate_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 2048,
+        temperature: float = 0.1,
+        stop_sequences: Optional[list] = None
+    ) -> Iterator[str]:
+        """
+        Generate text from prompt, yielding pieces as the backend produces them.
+
+        Lets callers post-process (or stop early) while generation is still
+        running; streamed output is not stored in the response cache.
+        """
+        logger.debug(
+            f"Streaming with {self.backend}: prompt_len={len(prompt)}, max_tokens={max_tokens}"
+        )
+
+        if self.backend == "llamacpp":
+            payload = {
+                "prompt": prompt,
+                "n_predict": max_tokens,
+                "temperature": temperature,
+                "stop": stop_sequences or [],
+                "stream": True,
+            }
+            with self._session.post(
+                f"{self.base_url}/completion", json=payload, timeout=self.timeout, stream=True
+            ) as response:
+                response.raise_for_status()
+                # Server-sent events: "data: {...}" lines
+                for line in response.iter_lines():
+                    if line.startswith(b"data: "):
+                        event = json.loads(line[6:])
+                        if event.get("content"):
+                            yield event["content"]
+                        if event.get("stop"):
+                            break
+
+        elif self.backend == "ollama":
+            payload = {
+                "model": self.model_name,
+                "prompt": prompt,
+                "stream": True,
+                "options": {
+                    "temperature": temperature,
+                    "num_predict": max_tokens,
+                }
+            }
+            if stop_sequences:
+                payload["options"]["stop"] = stop_sequences
+            with self._session.post(
+                "http://localhost:11434/api/generate",
+                json=payload, timeout=self.timeout, stream=True
+            ) as response:
+                response.raise_for_status()
+                # One JSON object per line
+                for line in response.iter_lines():
+                    if line:
+                        event = json.loads(line)
+                        if event.get("response"):
+                            yield event["response"]
+                        if event.get("done"):
+                            break
+
+        elif self.backend == "claude":
+            with self._anthropic().messages.stream(
+                model="claude-sonnet-4-20250514",
+                max_tokens=max_tokens,
+                temperature=temperature,
+                messages=[{"role": "user", "content": prompt}],
+                stop_sequences=stop_sequences
+            ) as stream:
+                yield from stream.text_stream
+
         else:
             raise ValueError(f"Unknown backend: {self.backend}")
 
@@ -107,7 +262,7 @@ class LLMClient:
                 "stop": stop_sequences or [],
             }
 
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/completion",
                 json=payload,
                 timeout=self.timeout
@@ -143,7 +298,7 @@ class LLMClient:
             if stop_sequences:
                 payload["options"]["stop"] = stop_sequences
 
-            response = requests.post(
+            response = self._session.post(
                 "http://localhost:11434/api/generate",
                 json=payload,
                 timeout=self.timeout
@@ -157,6 +312,17 @@ class LLMClient:
             logger.error(f"Ollama generation failed: {e}")
             raise
 
+    def _anthropic(self):
+        """The shared Anthropic client, created on first use."""
+        if self._anthropic_client is None:
+            if anthropic is None:
+                raise ImportError("anthropic is not installed. Run: pip install anthropic")
+            api_key = os.environ.get("ANTHROPIC_API_KEY")
+            if not api_key:
+                raise ValueError("ANTHROPIC_API_KEY not set in environment")
+            self._anthropic_client = anthropic.Anthropic(api_key=api_key)
+        return self._anthropic_client
+
     def _claude_generate(
         self,
         prompt: str,
@@ -171,15 +337,7 @@ class LLMClient:
         Production must use on-premise llama.cpp or Ollama.
         """
         try:
-            import anthropic
-
-            api_key = os.environ.get("ANTHROPIC_API_KEY")
-            if not api_key:
-                raise ValueError("ANTHROPIC_API_KEY not set in environment")
-
-            client = anthropic.Anthropic(api_key=api_key)
-
-            message = client.messages.create(
+            message = self._anthropic().messages.create(
                 model="claude-sonnet-4-20250514",
                 max_tokens=max_tokens,
                 temperature=temperature,
@@ -200,16 +358,30 @@ class LLMClient:
         """
         Check if LLM backend is available.
 
+        Results are reused for HEALTH_CHECK_TTL seconds per (backend, base_url).
+
         Returns:
             True if backend is healthy, False otherwise
         """
+        key = (self.backend, self.base_url)
+        now = time.monotonic()
+        cached = _HEALTH_CACHE.get(key)
+        if cached is not None and now - cached[0] < HEALTH_CHECK_TTL:
+            return cached[1]
+
+        healthy = self._check_backend()
+        _HEALTH_CACHE[key] = (now, healthy)
+        return healthy
+
+    def _check_backend(self) -> bool:
+        """Probe the backend once (uncached)."""
         try:
             if self.backend == "llamacpp":
-                response = requests.get(f"{self.base_url}/health", timeout=5)
+                response = self._session.get(f"{self.base_url}/health", timeout=5)
                 return response.status_code == 200
 
             elif self.backend == "ollama":
-                response = requests.get("http://localhost:11434/api/tags", timeout=5)
+                response = self._session.get("http://localhost:11434/api/tags", timeout=5)
                 return response.status_code == 200
 
             elif self.backend == "claude":
@@ -222,9 +394,17 @@ class LLMClient:
             logger.debug(f"Health check failed: {e}")
             return False
 
+    def close(self):
+        """Release pooled HTTP connections."""
+        self._session.close()
+        if self._anthropic_client is not None:
+            self._anthropic_client.close()
+            self._anthropic_client = None
+
 
+@lru_cache(maxsize=8)
 def create_llm_client(backend: str = "claude") -> LLMClient:
-    """Factory function to create an LLM client."""
+    """Factory function returning the shared LLM client for a backend."""
     return LLMClient(backend=backend)
 
 
@@ -7,10 +7,18 @@ and ChromaDB for vector storage.
 
 import json
 import logging
+import os
+import shutil
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
 try:
     from sentence_transformers import SentenceTransformer
 except ImportError:
@@ -24,10 +32,106 @@ except ImportError:
     print("Please install chromadb: pip install chromadb")
     raise
 
+try:
+    import onnxruntime as ort
+except ImportError:  # Optional: only needed for the ONNX backend
+    ort = None
+
+try:
+    import bm25s
+except ImportError:  # Optional: keyword index is skipped without it
+    bm25s = None
+
 from src.retrieval.chunker import DocumentChunker
 
 logger = logging.getLogger(__name__)
 
+# Pre-exported ONNX weights shipped in the sentence-transformers model repos.
+# The int8 file uses VNNI dot-product kernels on recent Xeon/EPYC CPUs; the
+# O4 file is the fp16 graph optimized for CUDA.
+ONNX_CPU_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+ONNX_CUDA_FILE = "onnx/model_O4.onnx"
+
+# ONNX Runtime intra-op threads; 0 keeps ORT's default (one per physical core).
+# A small value (e.g. 4) lowers batch-1 search latency on shared API hosts.
+ORT_INTRA_OP_THREADS = int(os.getenv("EMBED_ORT_THREADS", "0"))
+
+# Number of chunks gathered across documents before one encode call
+ENCODE_BUFFER_SIZE = 256
+
+# Rows per collection.upsert call; each call is one SQLite transaction
+FLUSH_BATCH_SIZE = 1024
+
+# HNSW index settings for new collections. Cosine suits the bounded
+# 1 - distance / 2 score in search(); the env vars let operators sweep the
+# recall/latency trade-off without code changes. Existing persisted
+# collections keep the settings they were created with.
+HNSW_SPACE = os.getenv("CHROMA_HNSW_SPACE", "cosine")
+HNSW_M = int(os.getenv("CHROMA_HNSW_M", "32"))
+HNSW_CONSTRUCTION_EF = int(os.getenv("CHROMA_HNSW_CONSTRUCTION_EF", "200"))
+HNSW_SEARCH_EF = int(os.getenv("CHROMA_HNSW_SEARCH_EF", "100"))
+
+# Threads loading and chunking JSON documents ahead of the encoder
+LOAD_WORKERS = int(os.getenv("EMBED_LOAD_WORKERS", os.cpu_count() or 1))
+
+QUERY_CACHE_SIZE = 1024  # most recent query -> embedding pairs kept
+
+# BM25 keyword indexes live next to the Chroma files, one directory per
+# collection, and are rebuilt at the end of each embed_directory run
+BM25_DIR_NAME = "bm25"
+
+
+# Chroma clients and collection handles shared by every pipeline in the
+# process, keyed by resolved persist dir (and collection name), so repeated
+# pipelines skip the SQLite metadata round trips
+COLLECTION_NAMES = ("all_documents", "court_rulings", "bare_acts")
+_CLIENTS: Dict[str, "chromadb.ClientAPI"] = {}
+_COLLECTIONS: Dict[Tuple[str, str], "chromadb.Collection"] = {}
+_CHROMA_LOCK = threading.Lock()
+
+
+def _get_client(persist_dir: str):
+    """Return the process-wide PersistentClient for a directory."""
+    with _CHROMA_LOCK:
+        client = _CLIENTS.get(persist_dir)
+        if client is None:
+            client = _CLIENTS[persist_dir] = chromadb.PersistentClient(path=persist_dir)
+        return client
+
+
+def _ort_session_options():
+    """Session options for the ONNX encoder (None without onnxruntime)."""
+    if ort is None:
+        return None
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    # A single encoder graph gains nothing from inter-op parallelism
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    options.inter_op_num_threads = 1
+    options.intra_op_num_threads = ORT_INTRA_OP_THREADS
+    return options
+
+
+def _load_model(model_name: str, device: str, backend: str) -> SentenceTransformer:
+    """Load the encoder, preferring the ONNX Runtime backend when requested."""
+    if backend == "onnx":
+        if device == "cpu":
+            model_kwargs = {"file_name": ONNX_CPU_FILE}
+        else:
+            model_kwargs = {"file_name": ONNX_CUDA_FILE, "provider": "CUDAExecutionProvider"}
+        session_options = _ort_session_options()
+        if session_options is not None:
+            model_kwargs["session_options"] = session_options
+        try:
+            return SentenceTransformer(
+                model_name, device=device, backend="onnx", model_kwargs=model_kwargs
+            )
+        except Exception as e:
+            # sentence-transformers < 3.2, optimum/onnxruntime missing, or the
+            # model repo has no pre-exported file for this device
+            logger.warning(f"ONNX backend unavailable ({e}), falling back to PyTorch")
+    return SentenceTransformer(model_name, device=device)
+
 
 @dataclass
 class SearchResult:
@@ -56,7 +160,8 @@ class EmbeddingPipeline:
         self,
         model_name: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
         chroma_persist_dir: str = "data/embeddings/chroma",
-        device: str = "cpu"
+        device: str = "cpu",
+        backend: str = "onnx"
     ):
         """
         Initialize embedding pipeline.
@@ -65,37 +170,63 @@ class EmbeddingPipeline:
             model_name: Sentence transformer model name
             chroma_persist_dir: Directory to persist ChromaDB
             device: 'cpu' or 'cuda'
+            backend: 'onnx' (quantized int8 on CPU, fp16 on CUDA) or 'torch'
         """
-        logger.info(f"Loading embedding model: {model_name}")
-        self.model = SentenceTransformer(model_name, device=device)
+        logger.info(f"Loading embedding model: {model_name} ({backend})")
+        self.model = _load_model(model_name, device, backend)
         logger.info(f"Model loaded. Embedding dim: {self.model.get_sentence_embedding_dimension()}")
 
         # Initialize ChromaDB client
         persist_path = Path(chroma_persist_dir)
         persist_path.mkdir(parents=True, exist_ok=True)
 
-        self.client = chromadb.PersistentClient(path=str(persist_path))
+        self.persist_dir = str(persist_path.resolve())
+        self.client = _get_client(self.persist_dir)
         logger.info(f"ChromaDB initialized at: {persist_path}")
 
         # Initialize chunker
         self.chunker = DocumentChunker()
 
-        # Collection names
-        self.collections = {
-            "all_documents": None,
-            "court_rulings": None,
-            "bare_acts": None,
-        }
+        # Rows waiting for a bulk upsert: collection -> {id: (embedding, text, metadata)}
+        self._pending: Dict[str, Dict[str, Tuple]] = {}
+        # Collections written since their keyword index was last built
+        self._flushed: set = set()
+
+        # Repeated queries (expanded RAG queries, UI retries) skip the encoder
+        self._qcache: OrderedDict = OrderedDict()
+        self._qcache_lock = threading.Lock()
+
+        # One throwaway encode pays for ORT kernel selection / CUDA context
+        # creation here instead of on the first user query
+        try:
+            self.model.encode(["warmup legal text"], convert_to_numpy=True)
+        except Exception as e:
+            logger.warning(f"Embedding model warmup failed: {e}")
 
     def _get_or_create_collection(self, name: str):
         """Get or create a ChromaDB collection."""
-        if self.collections[name] is None:
-            self.collections[name] = self.client.get_or_create_collection(
-                name=name,
-                metadata={"description": f"Collection for {name}"}
-            )
-            logger.info(f"Collection '{name}' ready (count: {self.collections[name].count()})")
-        return self.collections[name]
+        if name not in COLLECTION_NAMES:
+            raise KeyError(name)
+
+        key = (self.persist_dir, name)
+        coll = _COLLECTIONS.get(key)
+        if coll is None:
+            with _CHROMA_LOCK:
+                coll = _COLLECTIONS.get(key)
+                if coll is None:
+                    coll = self.client.get_or_create_collection(
+                        name=name,
+                        metadata={
+                            "description": f"Collection for {name}",
+                            "hnsw:space": HNSW_SPACE,
+                            "hnsw:M": HNSW_M,
+                            "hnsw:construction_ef": HNSW_CONSTRUCTION_EF,
+                            "hnsw:search_ef": HNSW_SEARCH_EF,
+                        }
+                    )
+                    _COLLECTIONS[key] = coll
+                    logger.info(f"Collection '{name}' ready (count: {coll.count()})")
+        return coll
 
     def embed_directory(
         self,
@@ -125,35 +256,35 @@ class EmbeddingPipeline:
         json_files = list(input_path.rglob("*.json"))
         logger.info(f"Found {len(json_files)} documents to embed")
 
-        for json_file in json_files:
-            try:
-                # Load document
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    doc = json.load(f)
+        # Chunks from several documents are encoded together so each forward
+        # pass fills a full batch instead of the handful of chunks in one file
+        pending: List[Tuple[Dict, List[Dict]]] = []
+        pending_texts = 0
 
-                # Skip if no content
-                if not doc.get("content"):
-                    logger.warning(f"Skipping {json_file.name}: no content")
-                    continue
+        for loaded in self._iter_loaded(json_files):
+            if loaded is None:
+                continue
+            doc, chunks = loaded
 
-                # Chunk document (pass whole doc dict)
-                chunks = self.chunker.chunk_document(doc)
+            pending.append((doc, chunks))
+            pending_texts += len(chunks)
 
-                if not chunks:
-                    logger.warning(f"No chunks generated for {json_file.name}")
-                    continue
+            stats["total_docs"] += 1
+            stats["total_chunks"] += len(chunks)
 
-                # Embed and store chunks
-                self._embed_and_store_chunks(doc, chunks)
+            if pending_texts >= ENCODE_BUFFER_SIZE:
+                self._embed_and_store_batch(pending, batch_size)
+                pending, pending_texts = [], 0
 
-                stats["total_docs"] += 1
-                stats["total_chunks"] += len(chunks)
+            if stats["total_docs"] % 10 == 0:
+                logger.info(f"Processed {stats['total_docs']} documents, {stats['total_chunks']} chunks")
 
-                if stats["total_docs"] % 10 == 0:
-                    logger.info(f"Processed {stats['total_docs']} documents, {stats['total_chunks']} chunks")
+        if pending:
+            self._embed_and_store_batch(pending, batch_size)
+        self.flush()
 
-            except Exception as e:
-                logger.error(f"Error processing {json_file}: {e}")
+        for name in sorted(self._flushed):
+            self.build_keyword_index(name)
 
         logger.info("=" * 60)
         logger.info("Embedding Statistics:")
@@ -164,6 +295,55 @@ class EmbeddingPipeline:
 
         return stats
 
+    def _load_and_chunk(self, json_file: Path) -> Optional[Tuple[Dict, List[Dict]]]:
+        """Load and chunk one document; None if it is skipped."""
+        try:
+            # Load document
+            with open(json_file, 'r', encoding='utf-8') as f:
+                doc = json.load(f)
+
+            # Skip if no content
+            if not doc.get("content"):
+                logger.warning(f"Skipping {json_file.name}: no content")
+                return None
+
+            # Chunk document (pass whole doc dict)
+            chunks = self.chunker.chunk_document(doc)
+
+            if not chunks:
+                logger.warning(f"No chunks generated for {json_file.name}")
+                return None
+
+        except Exception as e:
+            logger.error(f"Error processing {json_file}: {e}")
+            return None
+
+        return doc, chunks
+
+    def _iter_loaded(self, json_files: List[Path]) -> Iterator[Optional[Tuple[Dict, List[Dict]]]]:
+        """
+        Load and chunk files on LOAD_WORKERS threads, yielding in file order.
+
+        At most a fixed window of files is in flight ahead of the consumer, so
+        loading overlaps encoding without running far ahead of it.
+        """
+        if LOAD_WORKERS <= 1:
+            yield from map(self._load_and_chunk, json_files)
+            return
+
+        files = iter(json_files)
+        with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+            window = deque(
+                executor.submit(self._load_and_chunk, f)
+                for f in islice(files, LOAD_WORKERS * 4)
+            )
+            while window:
+                result = window.popleft().result()
+                next_file = next(files, None)
+                if next_file is not None:
+                    window.append(executor.submit(self._load_and_chunk, next_file))
+                yield result
+
     def _embed_and_store_chunks(self, doc: Dict, chunks: List[Dict]):
         """
         Embed chunks and store in ChromaDB.
@@ -172,13 +352,96 @@ class EmbeddingPipeline:
             doc: Original document dict
             chunks: List of chunk dicts from chunker
         """
-        # Extract texts and metadata
-        texts = [chunk["text"] for chunk in chunks]
+        self._embed_and_store_batch([(doc, chunks)])
+        self.flush()
 
-        # Generate embeddings
-        embeddings = self.model.encode(texts, convert_to_numpy=True).tolist()
+    def _embed_and_store_batch(self, batch: List[Tuple[Dict, List[Dict]]], batch_size: int = 32):
+        """
+        Embed chunks from several documents in one encode call and queue them.
 
-        # Prepare for ChromaDB
+        Args:
+            batch: (document, chunks) pairs
+            batch_size: Batch size for the encoder forward passes
+        """
+        texts = [chunk["text"] for _, chunks in batch for chunk in chunks]
+
+        try:
+            # Rows stay float32 ndarray views until their upsert slice is built
+            embeddings = self.model.encode(texts, batch_size=batch_size, convert_to_numpy=True)
+        except Exception as e:
+            logger.error(f"Error embedding batch of {len(texts)} chunks: {e}")
+            return
+
+        token_counts = self._token_counts(texts)
+
+        # Queue rows per target collection; a later row for the same id
+        # replaces the queued one, matching upsert semantics
+        offset = 0
+        for doc, chunks in batch:
+            ids, metadatas = self._chunk_rows(doc, chunks)
+            if token_counts is not None:
+                for meta, count in zip(metadatas, token_counts[offset:offset + len(chunks)]):
+                    meta["token_count"] = count
+
+            targets = ["all_documents"]
+            doc_type = doc.get("document_type", "").lower()
+            if "court_ruling" in doc_type:
+                targets.append("court_rulings")
+            elif "bare_act" in doc_type:
+                targets.append("bare_acts")
+
+            for name in targets:
+                pending = self._pending.setdefault(name, {})
+                for i, chunk_id in enumerate(ids, offset):
+                    pending[chunk_id] = (embeddings[i], texts[i], metadatas[i - offset])
+            offset += len(chunks)
+
+        for name in [n for n, rows in self._pending.items() if len(rows) >= FLUSH_BATCH_SIZE]:
+            self.flush(name)
+
+    def flush(self, name: Optional[str] = None, max_batch: int = FLUSH_BATCH_SIZE):
+        """
+        Write queued chunks to ChromaDB.
+
+        Args:
+            name: Collection to flush (all collections if None)
+            max_batch: Maximum rows per upsert call
+        """
+        names = [name] if name else list(self._pending)
+        for coll_name in names:
+            pending = self._pending.pop(coll_name, None)
+            if not pending:
+                continue
+
+            ids = list(pending)
+            rows = list(pending.values())
+            coll = self._get_or_create_collection(coll_name)
+            self._flushed.add(coll_name)
+            for start in range(0, len(ids), max_batch):
+                embeddings, documents, metadatas = zip(*rows[start:start + max_batch])
+                try:
+                    coll.upsert(
+                        # chromadb 0.5 validates embeddings as Python lists
+                        embeddings=np.stack(embeddings).tolist(),
+                        documents=list(documents),
+                        metadatas=list(metadatas),
+                        ids=ids[start:start + max_batch]
+                    )
+                except Exception as e:
+                    logger.error(f"Error storing {len(embeddings)} chunks in '{coll_name}': {e}")
+
+    def _token_counts(self, texts: List[str]) -> Optional[List[int]]:
+        """Count tokens per chunk with the model tokenizer (None if unavailable)."""
+        try:
+            encoded = self.model.tokenizer(texts, add_special_tokens=False)
+        except Exception as e:
+            logger.debug(f"Token counting skipped: {e}")
+            return None
+        return [len(ids) for ids in encoded["input_ids"]]
+
+    @staticmethod
+    def _chunk_rows(doc: Dict, chunks: List[Dict]) -> Tuple[List[str], List[Dict]]:
+        """Build ChromaDB ids and metadata for one document's chunks."""
         ids = [f"{doc.get('content_hash', 'unknown')[:16]}_chunk_{i}" for i in range(len(chunks))]
 
         metadatas = []
@@ -196,26 +459,169 @@ class EmbeddingPipeline:
                 "total_chunks": len(chunks),
                 "source_url": doc.get("source_url", "")[:500],
             })
+        return ids, metadatas
+
+    def _embed_query(self, query: str) -> List[float]:
+        """Embed a search query, reusing the result for repeated queries."""
+        with self._qcache_lock:
+            cached = self._qcache.get(query)
+            if cached is not None:
+                self._qcache.move_to_end(query)
+                return cached
+
+        embedding = self.model.encode([query], convert_to_numpy=True).tolist()[0]
+
+        with self._qcache_lock:
+            self._qcache[query] = embedding
+            self._qcache.move_to_end(query)
+            if len(self._qcache) > QUERY_CACHE_SIZE:
+                self._qcache.popitem(last=False)
+        return embedding
+
+    def get_chunks(
+        self,
+        collection: str = "all_documents",
+        where: Optional[Dict] = None,
+        include: Tuple[str, ...] = ("documents", "metadatas"),
+        page_size: int = 5000,
+        ids: Optional[List[str]] = None
+    ) -> Dict[str, list]:
+        """
+        Read stored chunks from a collection, page by page.
+
+        Args:
+            collection: Collection name
+            where: Optional metadata filters
+            include: Fields to return besides ids
+            page_size: Rows per ChromaDB get call
+            ids: Only return these chunk ids (in no particular order)
 
-        # Add to appropriate collections
-        doc_type = doc.get("document_type", "")
+        Returns:
+            Dict with "ids" and one list per included field
+        """
+        coll = self._get_or_create_collection(collection)
+        chunks: Dict[str, list] = {"ids": [], **{field: [] for field in include}}
+        offset = 0
+        while True:
+            page = coll.get(ids=ids, where=where, include=list(include), limit=page_size, offset=offset)
+            for key, values in chunks.items():
+                values.extend(page[key])
+            if len(page["ids"]) < page_size:
+                return chunks
+            offset += page_size
+
+    def _keyword_index_dir(self, collection: str) -> Path:
+        """Directory holding a collection's saved BM25 index."""
+        return Path(self.persist_dir) / BM25_DIR_NAME / collection
+
+    def build_keyword_index(self, collection: str = "all_documents") -> int:
+        """
+        Build the BM25 index for a collection and save it to disk.
 
-        # All documents collection
-        all_coll = self._get_or_create_collection("all_documents")
-        all_coll.add(
-            embeddings=embeddings,
-            documents=texts,
-            metadatas=metadatas,
-            ids=ids
+        The new index is written to a temporary directory and swapped in, so
+        a reader loading it meanwhile sees either the old or the new one.
+
+        Args:
+            collection: Collection name
+
+        Returns:
+            Number of chunks indexed (0 if skipped)
+        """
+        self._flushed.discard(collection)
+        if bm25s is None:
+            logger.warning("bm25s not installed, skipping keyword index")
+            return 0
+
+        chunks = self.get_chunks(collection, include=("documents",))
+        if not chunks["ids"]:
+            return 0
+
+        logger.info(f"Building BM25 index for '{collection}' ({len(chunks['ids'])} chunks)")
+        retriever = bm25s.BM25()
+        retriever.index(
+            bm25s.tokenize(chunks["documents"], stopwords="en", show_progress=False),
+            show_progress=False
         )
 
-        # Type-specific collection
-        if "court_ruling" in doc_type.lower():
-            coll = self._get_or_create_collection("court_rulings")
-            coll.add(embeddings=embeddings, documents=texts, metadatas=metadatas, ids=ids)
-        elif "bare_act" in doc_type.lower():
-            coll = self._get_or_create_collection("bare_acts")
-            coll.add(embeddings=embeddings, documents=texts, metadatas=metadatas, ids=ids)
+        target = self._keyword_index_dir(collection)
+        tmp = target.with_name(target.name + ".tmp")
+        old = target.with_name(target.name + ".old")
+        shutil.rmtree(tmp, ignore_errors=True)
+        retriever.save(str(tmp))
+        with open(tmp / "chunk_ids.json", "w", encoding="utf-8") as f:
+            json.dump(chunks["ids"], f)
+
+        shutil.rmtree(old, ignore_errors=True)
+        if target.exists():
+            target.rename(old)
+        tmp.rename(target)
+        shutil.rmtree(old, ignore_errors=True)
+        return len(chunks["ids"])
+
+    def load_keyword_index(self, collection: str = "all_documents") -> Optional[Tuple]:
+        """
+        Load a saved BM25 index.
+
+        Args:
+            collection: Collection name
+
+        Returns:
+            (retriever, chunk ids) or None if bm25s or the index is missing
+        """
+        index_dir = self._keyword_index_dir(collection)
+        if bm25s is None or not index_dir.is_dir():
+            return None
+        try:
+            retriever = bm25s.BM25.load(str(index_dir), mmap=True)
+            with open(index_dir / "chunk_ids.json", "r", encoding="utf-8") as f:
+                chunk_ids = json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading BM25 index for '{collection}': {e}")
+            return None
+        return retriever, chunk_ids
+
+    def score_chunks(
+        self,
+        query: str,
+        ids: List[str],
+        collection: str = "all_documents"
+    ) -> Dict[str, float]:
+        """
+        Vector similarity of stored chunks to a query, on search()'s scale.
+
+        The distance follows the collection's hnsw:space (collections created
+        before cosine became the default stay in L2), mapped to a score with
+        search()'s 1 - distance / 2.
+
+        Args:
+            query: Query text
+            ids: Chunk ids to score
+            collection: Collection name
+
+        Returns:
+            Dict of chunk id -> similarity in [0, 1]
+        """
+        if not ids:
+            return {}
+        chunks = self.get_chunks(collection, include=("embeddings",), ids=ids)
+        if not chunks["ids"]:
+            return {}
+
+        query_vec = np.asarray(self._embed_query(query), dtype=np.float32)
+        vectors = np.asarray(chunks["embeddings"], dtype=np.float32)
+        metadata = self._get_or_create_collection(collection).metadata or {}
+        space = metadata.get("hnsw:space", "l2")  # Chroma's default space
+        if space == "cosine":
+            norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query_vec)
+            distances = 1.0 - vectors @ query_vec / np.maximum(norms, 1e-12)
+        elif space == "ip":
+            distances = 1.0 - vectors @ query_vec
+        else:  # l2: Chroma reports the squared Euclidean distance
+            distances = np.sum((vectors - query_vec) ** 2, axis=1)
+        return {
+            chunk_id: min(1.0, max(0.0, 1.0 - float(distance) * 0.5))
+            for chunk_id, distance in zip(chunks["ids"], distances)
+        }
 
     def search(
         self,
@@ -240,7 +646,7 @@ class EmbeddingPipeline:
         coll = self._get_or_create_collection(collection)
 
         # Embed query
-        query_embedding = self.model.encode([query], convert_to_numpy=True).tolist()[0]
+        query_embedding = self._embed_query(query)
 
         # Search
         results = coll.query(
@@ -252,22 +658,24 @@ class EmbeddingPipeline:
         # Parse results
         search_results = []
         if results and results['documents'] and len(results['documents'][0]) > 0:
-            for i in range(len(results['documents'][0])):
-                metadata = results['metadatas'][0][i]
-                distance = results['distances'][0][i] if 'distances' in results else 0.0
+            documents = results['documents'][0]
+            distances = results['distances'][0] if 'distances' in results else [0.0] * len(documents)
 
-                # Convert distance to similarity score (1 - normalized_distance)
-                # For L2 distance, normalize and invert
-                score = max(0.0, 1.0 - (distance / 2.0))  # Simple normalization
+            for text, chunk_id, metadata, distance in zip(
+                documents, results['ids'][0], results['metadatas'][0], distances
+            ):
+                sections = metadata.get('sections')
 
                 search_results.append(SearchResult(
-                    chunk_text=results['documents'][0][i],
-                    doc_id=results['ids'][0][i],
+                    chunk_text=text,
+                    doc_id=chunk_id,
                     title=metadata.get('title', ''),
                     source=metadata.get('source', ''),
                     court=metadata.get('court'),
-                    sections=metadata.get('sections', '').split(',') if metadata.get('sections') else [],
-                    score=score,
+                    sections=sections.split(',') if sections else [],
+                    # Cosine distance lies in [0, 2]; map it to a [0, 1] similarity
+                    # (clamped: float error can make an exact match's distance < 0)
+                    score=min(1.0, max(0.0, 1.0 - distance * 0.5)),
                     metadata=metadata
                 ))
 
@@ -9,15 +9,81 @@ Combines:
 5. LLM generation
 """
 
+import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:  # Optional: single-pass term matching (pyahocorasick)
+    ahocorasick = None
+
+try:
+    import bm25s
+except ImportError:  # Optional: keyword search returns no results without it
+    bm25s = None
+
 from src.retrieval.embeddings import EmbeddingPipeline, SearchResult
 from src.model.inference import LLMClient
 
 logger = logging.getLogger(__name__)
 
+# Reciprocal Rank Fusion constant; dampens the lead of the very top ranks
+RRF_K = 60
+
+# Simple expansion for POC
+# Full implementation would use legal term dictionary
+_QUERY_EXPANSIONS = {
+    "murder": "murder Section 302 IPC Section 103 BNS homicide killing",
+    "theft": "theft Section 379 IPC Section 303 BNS stealing larceny",
+    "bail": "bail anticipatory bail regular bail Section 437 CrPC",
+    "chargesheet": "chargesheet Section 173 CrPC prosecution complaint",
+    "FIR": "FIR First Information Report Section 154 CrPC",
+    "302": "Section 302 IPC Section 103 BNS murder",
+    "304": "Section 304 IPC culpable homicide",
+    "376": "Section 376 IPC Section 63 BNS rape sexual assault",
+}
+
+
+_EXPANSION_VALUES = tuple(_QUERY_EXPANSIONS.values())
+
+
+def _build_expansion_automaton():
+    """Compile all expansion terms into one automaton (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for order, term in enumerate(_QUERY_EXPANSIONS):
+        automaton.add_word(term.lower(), order)
+    automaton.make_automaton()
+    return automaton
+
+
+_EXPANSION_AUTOMATON = _build_expansion_automaton()
+
+
+@lru_cache(maxsize=1024)
+def _expand_query(query: str) -> str:
+    """Append expansions for every legal term found in the query."""
+    lowered = query.lower()
+    if _EXPANSION_AUTOMATON is not None:
+        # One scan of the query however large the dictionary grows;
+        # expansions keep dictionary order
+        hits = sorted({order for _, order in _EXPANSION_AUTOMATON.iter(lowered)})
+        extras = [_EXPANSION_VALUES[order] for order in hits]
+    else:
+        extras = [
+            expansion for term, expansion in _QUERY_EXPANSIONS.items()
+            if term.lower() in lowered
+        ]
+    return " ".join([query, *extras])
+
 
 @dataclass
 class RAGResponse:
@@ -66,6 +132,15 @@ class RAGPipeline:
         self.max_context_tokens = max_context_tokens
         self.vector_weight = vector_weight
 
+        # BM25 index per collection as saved at ingestion: name -> (retriever,
+        # chunk ids), or None when no index was saved. Reloaded only by
+        # refresh_keyword_index().
+        self._bm25: Dict[str, Optional[tuple]] = {}
+        self._bm25_lock = threading.Lock()
+
+        # Runs the LLM health probe alongside retrieval in query()
+        self._background = ThreadPoolExecutor(max_workers=4, thread_name_prefix="rag")
+
         logger.info("RAG Pipeline initialized")
         logger.info(f"  Embedding model: {self.embeddings.model}")
         logger.info(f"  LLM backend: {self.llm.backend}")
@@ -80,23 +155,7 @@ class RAGPipeline:
         Returns:
             Expanded query with additional terms
         """
-        # Simple expansion for POC
-        # Full implementation would use legal term dictionary
-        expansions = {
-            "murder": "murder Section 302 IPC Section 103 BNS homicide killing",
-            "theft": "theft Section 379 IPC Section 303 BNS stealing larceny",
-            "bail": "bail anticipatory bail regular bail Section 437 CrPC",
-            "chargesheet": "chargesheet Section 173 CrPC prosecution complaint",
-            "FIR": "FIR First Information Report Section 154 CrPC",
-            "302": "Section 302 IPC Section 103 BNS murder",
-            "304": "Section 304 IPC culpable homicide",
-            "376": "Section 376 IPC Section 63 BNS rape sexual assault",
-        }
-
-        expanded = query
-        for term, expansion in expansions.items():
-            if term.lower() in query.lower():
-                expanded = f"{expanded} {expansion}"
+        expanded = _expand_query(query)
 
         logger.debug(f"Query expanded: '{query}' -> '{expanded}'")
         return expanded
@@ -147,8 +206,11 @@ class RAGPipeline:
         filters: Optional[Dict] = None
     ) -> List[Dict]:
         """
-        Keyword search (BM25-like).
-        For POC, just returns empty list. Full implementation would use BM25.
+        Keyword search with BM25 over the chunks stored in the collection.
+
+        Uses the index saved by EmbeddingPipeline.embed_directory(); call
+        refresh_keyword_index() to pick up a newer one. Returns an empty list
+        without bm25s or a saved index.
 
         Args:
             query: Search query
@@ -159,10 +221,71 @@ class RAGPipeline:
         Returns:
             List of keyword search results
         """
-        # POC: keyword search not implemented yet
-        # Full implementation would use BM25 or PostgreSQL full-text search
-        logger.debug("Keyword search not implemented, returning empty results")
-        return []
+        if bm25s is None:
+            logger.debug("bm25s not installed, keyword search returns no results")
+            return []
+
+        index = self._get_bm25_index(collection)
+        if index is None:
+            return []
+        retriever, chunk_ids = index
+
+        query_tokens = bm25s.tokenize(query, stopwords="en", return_ids=False, show_progress=False)[0]
+        scores = retriever.get_scores(query_tokens)
+
+        if filters:
+            allowed = set(self.embeddings.get_chunks(collection, where=filters, include=())["ids"])
+            mask = np.fromiter((chunk_id in allowed for chunk_id in chunk_ids), bool, len(scores))
+            scores = np.where(mask, scores, 0.0)
+
+        top = [i for i in np.argsort(-scores, kind="stable")[:top_k] if scores[i] > 0]
+        if not top:
+            return []
+
+        chunks = self.embeddings.get_chunks(collection, ids=[chunk_ids[i] for i in top])
+        stored = {
+            chunk_id: (text, metadata)
+            for chunk_id, text, metadata in zip(chunks["ids"], chunks["documents"], chunks["metadatas"])
+        }
+        return [
+            {
+                "text": stored[chunk_ids[i]][0],
+                "id": chunk_ids[i],
+                "score": float(scores[i]),
+                "metadata": stored[chunk_ids[i]][1],
+                "source": "keyword"
+            }
+            for i in top
+            # Chunks deleted since the index was built
+            if chunk_ids[i] in stored
+        ]
+
+    def _get_bm25_index(self, collection: str) -> Optional[tuple]:
+        """Return the saved (retriever, chunk ids) for a collection, loading it once."""
+        with self._bm25_lock:
+            if collection not in self._bm25:
+                index = self.embeddings.load_keyword_index(collection)
+                if index is None:
+                    logger.warning(
+                        f"No BM25 index saved for '{collection}'; run embedding ingestion "
+                        f"or refresh_keyword_index(rebuild=True)"
+                    )
+                self._bm25[collection] = index
+            return self._bm25[collection]
+
+    def refresh_keyword_index(self, collection: str = "all_documents", rebuild: bool = False):
+        """
+        Reload a collection's BM25 index from disk.
+
+        Args:
+            collection: Collection name
+            rebuild: Rebuild and save the index from the stored chunks first
+        """
+        if rebuild:
+            self.embeddings.build_keyword_index(collection)
+        index = self.embeddings.load_keyword_index(collection)
+        with self._bm25_lock:
+            self._bm25[collection] = index
 
     def hybrid_search(
         self,
@@ -202,23 +325,31 @@ class RAGPipeline:
             filters=filters
         )
 
-        # Merge and re-rank
+        # Merge with Reciprocal Rank Fusion: ranks are comparable across the
+        # two lists even though cosine and BM25 scores are on different scales.
+        # combined_score only orders the results; "score" stays the vector
+        # similarity shown in citations.
         combined = {}
-        for doc in vector_results:
-            doc_id = doc.get("id", doc["text"][:50])
-            combined[doc_id] = {**doc, "combined_score": doc["score"] * self.vector_weight}
-
         keyword_weight = 1 - self.vector_weight
-        for doc in keyword_results:
-            doc_id = doc.get("id", doc["text"][:50])
-            if doc_id in combined:
-                combined[doc_id]["combined_score"] += doc["score"] * keyword_weight
-            else:
-                combined[doc_id] = {**doc, "combined_score": doc["score"] * keyword_weight}
+        for results, weight in ((vector_results, self.vector_weight), (keyword_results, keyword_weight)):
+            for rank, doc in enumerate(results, 1):
+                doc_id = doc.get("id", doc["text"][:50])
+                if doc_id not in combined:
+                    combined[doc_id] = {**doc, "combined_score": 0.0}
+                combined[doc_id]["combined_score"] += weight / (RRF_K + rank)
 
         # Sort by combined score
-        ranked = sorted(combined.values(), key=lambda x: x["combined_score"], reverse=True)
-        return ranked[:top_k]
+        ranked = sorted(combined.values(), key=lambda x: x["combined_score"], reverse=True)[:top_k]
+
+        # Keyword-only hits carry a BM25 score; replace it with their similarity
+        keyword_only = [r["id"] for r in ranked if r["source"] == "keyword"]
+        if keyword_only:
+            similarity = self.embeddings.score_chunks(expanded, keyword_only, collection)
+            for r in ranked:
+                if r["source"] == "keyword":
+                    r["keyword_score"] = r["score"]
+                    r["score"] = similarity.get(r["id"], 0.0)
+        return ranked
 
     def assemble_context(self, results: List[Dict], max_tokens: Optional[int] = None) -> str:
         """
@@ -240,8 +371,12 @@ class RAGPipeline:
             source_tag = f"[Source {i+1}: {meta.get('title', 'Unknown')}]"
             chunk = f"{source_tag}\n{r['text']}"
 
-            # Rough token count (words * 1.3)
-            chunk_tokens = int(len(chunk.split()) * 1.3)
+            # Token count stored at ingestion, else a rough words * 1.3
+            stored = meta.get("token_count")
+            if stored is not None:
+                chunk_tokens = stored + int((source_tag.count(" ") + 1) * 1.3)
+            else:
+                chunk_tokens = int((chunk.count(" ") + 1) * 1.3)
 
             if token_count + chunk_tokens > max_tokens:
                 break
@@ -274,6 +409,9 @@ class RAGPipeline:
         """
         logger.info(f"RAG query: use_case={use_case}, top_k={top_k}")
 
+        # The health probe can be a network round trip; overlap it with retrieval
+        llm_ready = self._background.submit(self.llm.health_check) if self.llm else None
+
         # 1. Hybrid search
         results = self.hybrid_search(
             text,
@@ -295,7 +433,7 @@ class RAGPipeline:
 
         # 4. Generate response
         response_text = ""
-        if self.llm and self.llm.health_check():
+        if llm_ready is not None and llm_ready.result():
             try:
                 response_text = self.llm.generate(
                     prompt,
@@ -316,7 +454,7 @@ class RAGPipeline:
                 "source": r.get("metadata", {}).get("title", "Unknown"),
                 "doc_type": r.get("metadata", {}).get("doc_type", ""),
                 "court": r.get("metadata", {}).get("court", ""),
-                "score": r.get("combined_score", r.get("score", 0)),
+                "score": r.get("score", 0),
             }
             for r in results
         ]
@@ -334,6 +472,22 @@ class RAGPipeline:
             }
         )
 
+    async def aquery(
+        self,
+        text: str,
+        use_case: str = "general",
+        collection: str = "all_documents",
+        filters: Optional[Dict] = None,
+        top_k: int = 5
+    ) -> RAGResponse:
+        """
+        Async variant of query() for event-loop callers (API routes).
+
+        Runs query() on a worker thread so concurrent requests are not
+        serialized behind retrieval and generation on the event loop.
+        """
+        return await asyncio.to_thread(self.query, text, use_case, collection, filters, top_k)
+
 
 def create_rag_pipeline(
     embedding_pipeline: Optional[EmbeddingPipeline] = None,
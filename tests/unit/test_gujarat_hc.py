@@ -0,0 +1,39 @@
+"""Unit tests for the Gujarat High Court scraper's cross-combo dedup."""
+
+import pytest
+
+from src.data_sources.base import DataSourceConfig
+from src.data_sources.gujarat_hc import GujaratHCDataSource
+
+LISTINGS = {
+    "CR.A": ["u0", "u1"],
+    "CR.MA": ["u0", "u1", "u2"],  # overlaps the previous case type
+}
+
+
+@pytest.fixture
+def source(tmp_path):
+    source = GujaratHCDataSource(DataSourceConfig(base_url="x", output_dir=str(tmp_path)))
+    source._redis = None
+    source.fetched = []
+
+    def search_judgments(case_type, page, **kwargs):
+        if page > 1:
+            return []
+        return [{"url": url, "title": f"Judgment {url}"} for url in LISTINGS[case_type]]
+
+    def fetch_judgment_text(url):
+        source.fetched.append(url)
+        return {"full_text": f"Full text of {url}"}
+
+    source.search_judgments = search_judgments
+    source.fetch_judgment_text = fetch_judgment_text
+    yield source
+    source.close()
+
+
+def test_judgment_listed_under_two_combos_is_yielded_once(source):
+    docs = list(source.scrape(benches=["ahmedabad"], case_types=list(LISTINGS), max_per_combo=2))
+
+    assert [doc.source_url for doc in docs] == ["u0", "u1", "u2"]
+    assert source.fetched == ["u0", "u1", "u2"]
@@ -0,0 +1,25 @@
+"""Unit tests for Indian Kanoon section citation extraction."""
+
+import pytest
+
+from src.data_sources.indian_kanoon import IndianKanoonDataSource
+
+
+@pytest.mark.parametrize("text, expected", [
+    # Overlapping citations are both reported
+    ("Section 302 IPC Sec 34", ["IPC Sec 34", "Section 302 IPC"]),
+    # BNSS is not cut short to BNS
+    ("Section 35 BNSS", ["Section 35 BNSS"]),
+    ("convicted under Section 103 of the Bharatiya Nyaya Sanhita and S. 498A IPC",
+     ["S. 498A IPC", "Section 103 of the Bharatiya Nyaya Sanhita"]),
+    ("section 302 ipc", []),
+])
+def test_extract_sections(text, expected):
+    assert IndianKanoonDataSource._extract_sections(text) == expected
+
+
+def test_extract_sections_caps_at_fifty():
+    text = " ".join(f"Section {n} IPC" for n in range(100, 160))
+    sections = IndianKanoonDataSource._extract_sections(text)
+    assert len(sections) == 50
+    assert sections == sorted(sections)
@@ -0,0 +1,19 @@
+"""Unit tests for the shared ingestion text helpers."""
+
+import json
+
+from src.ingestion.utils import dump_json, script_counts
+
+
+def test_script_counts():
+    assert script_counts("Section 302 IPC") == (0, 0)
+    assert script_counts("ગુજરાત हिंदी") == (6, 5)
+    # Literal marker characters in the input are not counted
+    assert script_counts("\x01\x02 ગુ") == (2, 0)
+
+
+def test_dump_json_round_trips_unicode():
+    doc = {"title": "ગુજરાત", "pages": [{"page_number": 1}]}
+    payload = dump_json(doc)
+    assert "ગુજરાત".encode() in payload
+    assert json.loads(payload) == doc
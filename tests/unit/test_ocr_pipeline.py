@@ -0,0 +1,47 @@
+"""Unit tests for the OCR pipeline's Tesseract path."""
+
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("PIL")
+
+from PIL import Image
+
+from src.ingestion.ocr_pipeline import OCRPipeline
+
+
+class FakeTessAPI:
+    """Stand-in for tesserocr.PyTessBaseAPI recording the images it is given."""
+
+    def __init__(self, lang=None):
+        self.images = []
+
+    def SetImage(self, image):  # noqa: N802 - tesserocr's API
+        assert isinstance(image, Image.Image)
+        self.images.append(image.size)
+
+    def MapWordConfidences(self):  # noqa: N802
+        return [("Section", 92), ("302", 88), ("", 0)]
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """OCRPipeline with tesserocr faked and OpenCV / PaddleOCR unavailable."""
+    monkeypatch.setitem(sys.modules, "cv2", None)
+    monkeypatch.setitem(sys.modules, "paddleocr", None)
+    monkeypatch.setitem(sys.modules, "tesserocr", types.SimpleNamespace(PyTessBaseAPI=FakeTessAPI))
+    return OCRPipeline()
+
+
+@pytest.mark.parametrize("as_str", [True, False])
+def test_process_image_without_opencv_opens_the_file(pipeline, tmp_path, as_str):
+    image_path = tmp_path / "page.png"
+    Image.new("L", (40, 20), color=255).save(image_path)
+
+    result = pipeline.process_image(str(image_path) if as_str else image_path)
+
+    assert pipeline._tess_api.images == [(40, 20)]
+    assert result["pages"][0]["paragraphs"][0]["text"] == "Section 302"
+    assert result["overall_confidence"] == pytest.approx(0.90)
@@ -0,0 +1,21 @@
+"""Unit tests for PDF archive text cleaning and chunking."""
+
+from src.ingestion.pdf_archive_ingest import chunk_text, clean_text
+
+
+def test_clean_text_leaves_single_spaces_after_artifacts():
+    assert clean_text("The court  held ☐ that\n\nthe appeal ✓ fails.") == (
+        "The court held that the appeal fails."
+    )
+
+
+def test_chunk_word_counts_match_words_after_artifact_strip():
+    sentence = "The court held ☐ that the appeal must fail on every ground raised here."
+    text = clean_text(" ".join([sentence] * 60))
+
+    chunks = chunk_text(text, chunk_size=100, overlap=10)
+
+    assert chunks
+    for chunk in chunks:
+        assert chunk["word_count"] == len(chunk["text"].split())
+        assert chunk["word_count"] <= 100
@@ -0,0 +1,123 @@
+"""Unit tests for keyword and hybrid search over a small on-disk collection."""
+
+import json
+import types
+
+import numpy as np
+import pytest
+
+pytest.importorskip("chromadb")
+pytest.importorskip("sentence_transformers")
+pytest.importorskip("bm25s")
+
+from src.retrieval import embeddings
+from src.retrieval.embeddings import EmbeddingPipeline
+from src.retrieval.rag_pipeline import RAGPipeline
+
+VOCAB = ("murder", "bail", "theft", "knife", "appeal")
+
+# Eight murder judgments and one theft judgment whose only distinctive word,
+# "motorcycle", is invisible to the fake encoder but not to BM25
+DOCS = [
+    (f"The accused was convicted of murder in case {n} and the conviction was "
+     f"upheld after the evidence of witness number {n} was examined in detail.",
+     "court_ruling")
+    for n in range(8)
+] + [
+    ("A motorcycle was taken from the parking lot of the market at night and "
+     "found abandoned near the highway two days later by the patrol.",
+     "bare_act"),
+    ("The applicant sought anticipatory bail fearing arrest in a dispute and "
+     "the court granted bail subject to conditions on travel and reporting.",
+     "court_ruling"),
+]
+
+
+class FakeEncoder:
+    """Presence of each VOCAB word plus a constant component."""
+
+    def get_sentence_embedding_dimension(self):
+        return len(VOCAB) + 1
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True):
+        rows = []
+        for text in texts:
+            words = set(text.lower().split())
+            rows.append([float(word in words) for word in VOCAB] + [1.0])
+        return np.array(rows, dtype=np.float32)
+
+
+@pytest.fixture(params=["cosine", "l2"])
+def rag(request, tmp_path, monkeypatch):
+    monkeypatch.setattr(embeddings, "_load_model", lambda *args: FakeEncoder())
+    monkeypatch.setattr(embeddings, "HNSW_SPACE", request.param)
+
+    input_dir = tmp_path / "docs"
+    input_dir.mkdir()
+    for n, (text, doc_type) in enumerate(DOCS):
+        (input_dir / f"{n}.json").write_text(json.dumps({
+            "title": f"Document {n}",
+            "content": text,
+            "document_type": doc_type,
+            "content_hash": f"{n:02d}" + "0" * 30,
+        }))
+
+    pipeline = EmbeddingPipeline(chroma_persist_dir=str(tmp_path / "chroma"))
+    pipeline.embed_directory(str(input_dir))
+    return RAGPipeline(
+        embedding_pipeline=pipeline,
+        llm_client=types.SimpleNamespace(backend="none"),
+        vector_weight=0.3,
+    )
+
+
+def test_keyword_search_ranks_bm25_hits(rag):
+    results = rag.keyword_search("anticipatory bail", top_k=3)
+
+    assert results[0]["metadata"]["title"] == "Document 9"
+    assert results[0]["text"] == DOCS[9][0]
+    assert all(r["source"] == "keyword" and r["score"] > 0 for r in results)
+
+
+def test_keyword_search_applies_filters(rag):
+    assert rag.keyword_search("motorcycle", filters={"doc_type": "court_ruling"}) == []
+    results = rag.keyword_search("motorcycle", filters={"doc_type": "bare_act"})
+    assert [r["metadata"]["title"] for r in results] == ["Document 8"]
+
+
+def test_keyword_index_reloads_only_on_refresh(rag, tmp_path):
+    assert rag.keyword_search("arson") == []
+
+    rag.embeddings._embed_and_store_batch([(
+        {"title": "Late", "document_type": "court_ruling", "content_hash": "late" + "0" * 28},
+        [{"text": "The arson case was heard and the arson charge framed."}],
+    )])
+    rag.embeddings.flush()
+    assert rag.keyword_search("arson") == []
+
+    rag.refresh_keyword_index(rebuild=True)
+    assert [r["metadata"]["title"] for r in rag.keyword_search("arson")] == ["Late"]
+
+
+def test_score_chunks_matches_search_scores(rag):
+    results = rag.embeddings.search("murder appeal", top_k=10)
+    scores = rag.embeddings.score_chunks("murder appeal", [r.doc_id for r in results])
+
+    for r in results:
+        assert scores[r.doc_id] == pytest.approx(r.score, abs=1e-5)
+
+
+def test_hybrid_search_keeps_vector_similarity_as_score(rag):
+    results = rag.hybrid_search("murder motorcycle", top_k=3)
+
+    combined = [r["combined_score"] for r in results]
+    assert combined == sorted(combined, reverse=True)
+
+    keyword_only = [r for r in results if r["source"] == "keyword"]
+    assert [r["metadata"]["title"] for r in keyword_only] == ["Document 8"]
+    hit = keyword_only[0]
+    expected = rag.embeddings.score_chunks(rag.expand_query("murder motorcycle"), [hit["id"]])
+    assert hit["score"] == pytest.approx(expected[hit["id"]])
+    keyword = {r["id"]: r["score"] for r in rag.keyword_search("murder motorcycle", top_k=3)}
+    assert hit["keyword_score"] == pytest.approx(keyword[hit["id"]])
+    assert all(0.0 <= r["score"] <= 1.0 for r in results)